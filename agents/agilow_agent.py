@@ -10,6 +10,7 @@ import re
 from datetime import datetime
 from openai import OpenAI
 from api.notion_handler import (
+    sync,
     fetch_context_for_agent,
     handle_task_operations,
     create_retrolog_entry,
@@ -32,6 +33,8 @@ class AgilowAgent:
     def _refresh_context(self):
         """Refresh the context from Notion databases"""
         try:
+            # Delta-sync the task board first so the context reflects recent edits cheaply
+            sync()
             return fetch_context_for_agent()
         except Exception as e:
             print(f"❌ Error refreshing context: {str(e)}")
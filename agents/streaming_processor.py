@@ -17,9 +17,14 @@ from pynput import keyboard
 class StreamingMeetingProcessor:
     """Processes meeting audio in real-time with continuous Notion updates."""
     
-    def __init__(self, chunk_duration=5):
-        """Initialize the streaming processor with specified chunk duration."""
+    def __init__(self, chunk_duration=5, plan_only=False):
+        """Initialize the streaming processor with specified chunk duration.
+        
+        With plan_only, the execution plan for each batch of operations is
+        printed instead of being written to Notion.
+        """
         self.chunk_duration = chunk_duration  # seconds
+        self.plan_only = plan_only
         self.audio_queue = queue.Queue()
         self.transcript_buffer = ""
         self.processed_operations = {}  # Track operations by their unique signature
@@ -162,11 +167,15 @@ class StreamingMeetingProcessor:
                     if new_operations:
                         print(f"\n📋 Processing {len(new_operations)} new task operations...")
                         try:
-                            results = handle_task_operations(new_operations)
+                            results = handle_task_operations(new_operations, plan_only=self.plan_only)
+                            if self.plan_only:
+                                # The plan has been printed; nothing was written
+                                results = []
                             
                             # Print summary of operations
                             success_count = sum(1 for r in results if r.get("success", False))
-                            print(f"✅ Successfully processed {success_count} of {len(results)} operations.")
+                            if results:
+                                print(f"✅ Successfully processed {success_count} of {len(results)} operations.")
                             
                             # Print details of each operation
                             for i, result in enumerate(results):
@@ -4,7 +4,7 @@ import json
 import re
 import os
 from datetime import datetime
-from api.notion_handler import fetch_tasks, fetch_users, format_board_state, fetch_epics
+from api.notion_handler import sync, fetch_users, format_board_state, fetch_epics
 
 def extract_tasks(transcription, is_streaming=False):
     """Extract tasks and operations from transcription"""
@@ -18,8 +18,8 @@ def extract_tasks(transcription, is_streaming=False):
         
         current_date = datetime.now().strftime("%Y-%m-%d")
         
-        # Fetch current board state from Notion
-        tasks = fetch_tasks()
+        # Bring the board state up to date (only pages edited since the last call are fetched)
+        tasks = sync()
         board_state = format_board_state(tasks)
         
         # Fetch existing epics
@@ -286,6 +286,16 @@ def extract_tasks_trello(transcription, is_streaming=False):
             "force_new": true
         }}
 
+        Example for creating a checklist as a copy of an existing one (template_card defaults to the same card):
+        {{
+            "operation": "create_checklist",
+            "card": "Design new landing page",
+            "checklist": "Release Steps",
+            "template_card": "Design old landing page",
+            "template_checklist": "Release Steps",
+            "items": []
+        }}
+
         Example checklist item status update:
         {{
             "operation": "update_checklist_item",
@@ -0,0 +1,172 @@
+# api/fuzzy_index.py
+"""
+Character n-gram index for fuzzy name lookups.
+
+Every name is turned into a vector of its character trigrams (space-padded so
+word starts and ends count), normalized to unit length, and stored in an
+inverted index of NumPy arrays. A query's cosine similarity with every name is
+the sparse dot product of its own trigram vector with the postings it shares,
+summed per name with np.bincount, so a lookup costs the length of those
+postings instead of a string comparison against every name.
+
+Names can be added, renamed and removed in place. The index is not
+thread-safe; the board caches in api/trello_handler.py only touch theirs while
+holding their own lock.
+"""
+
+import math
+from collections import Counter
+
+import numpy as np
+
+NGRAM_SIZE = 3
+COMPACT_MIN_DEAD = 256  # removed rows tolerated before the postings are rebuilt
+
+def ngrams(text, n=NGRAM_SIZE):
+    """Return the character n-gram counts of a lowercased, whitespace-normalized string"""
+    text = f" {' '.join((text or '').lower().split())} "
+    if len(text) <= n:
+        return Counter([text])
+    return Counter(text[i:i + n] for i in range(len(text) - n + 1))
+
+class FuzzyIndex:
+    """Trigram cosine-similarity index over named items"""
+    
+    def __init__(self, names=None):
+        """
+        Build an index.
+        
+        Args:
+            names (dict or list): Optional initial contents, either key -> name
+                or a list of names that serve as their own keys.
+        """
+        self.clear()
+        if names:
+            self.replace(names)
+    
+    def clear(self):
+        """Remove everything"""
+        self._keys = []        # row -> key, or None once removed
+        self._names = []       # row -> name
+        self._rows = {}        # key -> row
+        self._postings = {}    # n-gram -> ([rows], [weights])
+        self._arrays = {}      # n-gram -> (rows, weights) as arrays, built on first use
+        self._dead = set()     # removed rows
+    
+    def replace(self, names):
+        """Replace the contents with key -> name pairs (or a list of names)"""
+        self.clear()
+        items = names.items() if isinstance(names, dict) else ((name, name) for name in names)
+        for key, name in items:
+            self.add(key, name)
+    
+    def add(self, key, name):
+        """Add an item, or rename it if the key is already indexed"""
+        name = name or ''
+        row = self._rows.get(key)
+        if row is not None:
+            if self._names[row] == name:
+                return
+            self.remove(key)
+        
+        row = len(self._keys)
+        self._keys.append(key)
+        self._names.append(name)
+        self._rows[key] = row
+        
+        grams = ngrams(name)
+        norm = math.sqrt(sum(count * count for count in grams.values()))
+        for gram, count in grams.items():
+            rows, weights = self._postings.setdefault(gram, ([], []))
+            rows.append(row)
+            weights.append(count / norm)
+            self._arrays.pop(gram, None)
+    
+    def remove(self, key):
+        """Remove an item; unknown keys are ignored"""
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+        # The row's postings stay until the next compaction; search() skips dead rows
+        self._keys[row] = None
+        self._dead.add(row)
+        if len(self._dead) >= COMPACT_MIN_DEAD and len(self._dead) * 2 >= len(self._keys):
+            self._compact()
+    
+    def _compact(self):
+        """Rebuild the postings without removed rows"""
+        live = [(key, name) for key, name in zip(self._keys, self._names) if key is not None]
+        self.clear()
+        for key, name in live:
+            self.add(key, name)
+    
+    def __len__(self):
+        return len(self._rows)
+    
+    def __contains__(self, key):
+        return key in self._rows
+    
+    def keys(self):
+        """Return the indexed keys"""
+        return list(self._rows)
+    
+    def name(self, key):
+        """Return the name indexed under key, or None"""
+        row = self._rows.get(key)
+        return self._names[row] if row is not None else None
+    
+    def _posting_arrays(self, gram):
+        """Return a posting list as (rows, weights) arrays"""
+        arrays = self._arrays.get(gram)
+        if arrays is None:
+            rows, weights = self._postings[gram]
+            arrays = (np.array(rows, dtype=np.int64), np.array(weights, dtype=np.float64))
+            self._arrays[gram] = arrays
+        return arrays
+    
+    def scores(self, query):
+        """Return the cosine similarity of query with every row (0 for removed rows)"""
+        scores = np.zeros(len(self._keys))
+        grams = ngrams(query)
+        norm = math.sqrt(sum(count * count for count in grams.values()))
+        rows, weights = [], []
+        for gram, count in grams.items():
+            if gram in self._postings:
+                gram_rows, gram_weights = self._posting_arrays(gram)
+                rows.append(gram_rows)
+                weights.append(gram_weights * (count / norm))
+        if rows:
+            scores += np.bincount(np.concatenate(rows), weights=np.concatenate(weights), minlength=len(self._keys))
+        if self._dead:
+            scores[list(self._dead)] = 0
+        return scores
+    
+    def search(self, query, k=5, min_score=0.0, keys=None):
+        """
+        Find the names most similar to query.
+        
+        Args:
+            query (str): The text to look up.
+            k (int): Maximum number of results.
+            min_score (float): Lowest cosine similarity to return (0.0 to 1.0).
+            keys (iterable): Optional keys to restrict the search to; unknown
+                keys are ignored.
+        
+        Returns:
+            list: (key, name, score) tuples, best first.
+        """
+        if not self._rows or k <= 0:
+            return []
+        
+        scores = self.scores(query)
+        if keys is not None:
+            allowed = np.zeros(len(scores), dtype=bool)
+            allowed[[self._rows[key] for key in keys if key in self._rows]] = True
+            scores[~allowed] = 0
+        candidates = np.argpartition(-scores, k - 1)[:k] if len(scores) > k else np.arange(len(scores))
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+        # The tolerance keeps an identical name (score 1.0 give or take rounding) above min_score=1.0
+        return [
+            (self._keys[row], self._names[row], float(min(scores[row], 1.0))) for row in candidates
+            if scores[row] > 0 and scores[row] >= min_score - 1e-9
+        ]
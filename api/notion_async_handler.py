@@ -0,0 +1,571 @@
+# api/notion_async_handler.py
+"""
+Asyncio counterpart of api/notion_handler.py.
+
+Same function names and result dict shapes, built on a shared httpx.AsyncClient
+connection pool, so hundreds of in-flight board writes cost coroutines rather
+than threads. Request bodies, the board snapshot, the title index, the users
+directory and the dependency graph are shared with the sync handler, and both
+handlers draw on the sync client's token bucket, so using them side by side
+stays within one API quota.
+"""
+
+import asyncio
+import os
+import random
+import time
+
+import httpx
+
+from api.notion_handler import (
+    NOTION_API_URL,
+    NOTION_VERSION,
+    NOTION_MAX_RETRIES,
+    NOTION_BACKOFF_BASE,
+    NOTION_BACKOFF_MAX,
+    NOTION_OPERATION_DEADLINE,
+    BOARD_SNAPSHOT_TTL,
+    USERS_DIRECTORY_TTL,
+    TASK_PROPERTIES,
+    BoardSnapshot,
+    UsersDirectory,
+    get_client as get_sync_client,
+    build_new_task_data,
+    build_task_update_properties,
+    DatabaseSchema,
+    build_epic_schema_update,
+    plan_epic_creation,
+    format_board_state as _format_board_state,
+    _order_operations,
+    _build_dependencies,
+)
+
+NOTION_ASYNC_MAX_CONCURRENCY = 50
+
+class AsyncRateLimiter:
+    """Awaitable view of a RateLimiter, so coroutines and threads share one token bucket"""
+    
+    def __init__(self, limiter=None):
+        """Wrap limiter, by default the sync handler's client limiter"""
+        self.limiter = limiter or get_sync_client().rate_limiter
+    
+    async def acquire(self):
+        """Wait until a token is available; returns the number of seconds waited"""
+        waited = 0.0
+        while True:
+            delay = self.limiter.try_acquire()
+            if delay <= 0:
+                return waited
+            await asyncio.sleep(delay)
+            waited += delay
+
+class AsyncNotionClient:
+    """Async Notion API client with a pooled connection, rate limiting and retries"""
+    
+    def __init__(self, api_key=None, max_connections=20, timeout=30.0, rate_limiter=None,
+                 max_retries=NOTION_MAX_RETRIES, deadline=NOTION_OPERATION_DEADLINE):
+        """Initialize the client; must be created inside a running event loop"""
+        self.api_key = api_key
+        self.max_retries = max_retries
+        self.deadline = deadline
+        self.loop = asyncio.get_running_loop()
+        self.rate_limiter = rate_limiter or AsyncRateLimiter()
+        self.http = httpx.AsyncClient(
+            base_url=NOTION_API_URL + "/",
+            headers={"Content-Type": "application/json", "Notion-Version": NOTION_VERSION},
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=httpx.Timeout(timeout, connect=5.0)
+        )
+        self.metrics = {"requests": 0, "rate_limit_wait_time": 0.0, "retries": 0, "deadline_exceeded": 0}
+    
+    def _retry_delay(self, response, attempt):
+        """Seconds to wait before the next attempt: Retry-After if given, else jittered backoff"""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        backoff = min(NOTION_BACKOFF_MAX, NOTION_BACKOFF_BASE * (2 ** attempt))
+        return backoff / 2 + random.uniform(0, backoff / 2)
+    
+    async def request(self, method, path, **kwargs):
+        """Send a request to the Notion API, retrying 429 (and 5xx when safe to repeat), and return the response"""
+        api_key = self.api_key or os.getenv("NOTION_API_KEY")
+        headers = {"Authorization": f"Bearer {api_key}"}
+        deadline = time.monotonic() + self.deadline
+        repeatable = method.upper() != "POST" or path.split("?")[0].endswith("/query")
+        attempt = 0
+        
+        while True:
+            self.metrics["rate_limit_wait_time"] += await self.rate_limiter.acquire()
+            self.metrics["requests"] += 1
+            
+            response = None
+            error = None
+            try:
+                response = await self.http.request(method, path.lstrip("/"), headers=headers, **kwargs)
+            except httpx.TransportError as e:
+                if not repeatable:
+                    raise
+                error = e
+            
+            if response is not None and response.status_code != 429 and (response.status_code < 500 or not repeatable):
+                return response
+            
+            delay = self._retry_delay(response, attempt)
+            if attempt >= self.max_retries or time.monotonic() + delay > deadline:
+                if time.monotonic() + delay > deadline:
+                    self.metrics["deadline_exceeded"] += 1
+                if error is not None:
+                    raise error
+                return response
+            
+            attempt += 1
+            self.metrics["retries"] += 1
+            await asyncio.sleep(delay)
+    
+    async def get(self, path, **kwargs):
+        return await self.request("GET", path, **kwargs)
+    
+    async def post(self, path, **kwargs):
+        return await self.request("POST", path, **kwargs)
+    
+    async def patch(self, path, **kwargs):
+        return await self.request("PATCH", path, **kwargs)
+    
+    async def close(self):
+        """Close the connection pool"""
+        await self.http.aclose()
+
+_clients = {}  # event loop -> AsyncNotionClient
+
+def get_client():
+    """Return the AsyncNotionClient for the running event loop, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    # A closed loop's client can no longer be awaited; callers close theirs with close_client()
+    for stale in [other for other in _clients if other.is_closed()]:
+        del _clients[stale]
+    if loop not in _clients:
+        _clients[loop] = AsyncNotionClient()
+    return _clients[loop]
+
+async def close_client():
+    """Close the running loop's client connection pool; await it before the loop shuts down"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+_database_schema = DatabaseSchema()
+
+async def get_database(database_id=None):
+    """Return the database object from the schema cache, reading it from Notion when needed"""
+    database_id = database_id or os.getenv("NOTION_DATABASE_ID")
+    database = _database_schema.cached(database_id)
+    if database is None:
+        response = await get_client().get(f"databases/{database_id}")
+        if response.status_code != 200:
+            print(f"⚠️ Could not read database schema: {response.text}")
+            return None
+        database = response.json()
+        _database_schema.store(database_id, database)
+    return database
+
+async def _resolve_property_ids(database_id, names):
+    """Map property names to the IDs Notion expects in filter_properties"""
+    if await get_database(database_id) is None:
+        print("⚠️ Querying all properties")
+        return None
+    return _database_schema.property_ids(database_id, names)
+
+async def query_database(database_id=None, query_filter=None, sorts=None, filter_properties=None, page_size=100,
+                         raise_errors=False):
+    """Stream pages from a Notion database query, following pagination cursors (async generator)"""
+    database_id = database_id or os.getenv("NOTION_DATABASE_ID")
+    
+    path = f"databases/{database_id}/query"
+    if filter_properties:
+        property_ids = await _resolve_property_ids(database_id, filter_properties)
+        if property_ids:
+            path += "?" + "&".join(f"filter_properties={prop_id}" for prop_id in property_ids)
+    
+    body = {"page_size": page_size}
+    if query_filter:
+        body["filter"] = query_filter
+    if sorts:
+        body["sorts"] = sorts
+    
+    while True:
+        response = await get_client().post(path, json=body)
+        
+        if response.status_code != 200:
+            if raise_errors:
+                response.raise_for_status()
+            print(f"❌ Error querying database: {response.text}")
+            return
+        
+        data = response.json()
+        for page in data.get("results", []):
+            yield page
+        
+        if not data.get("has_more") or not data.get("next_cursor"):
+            return
+        body["start_cursor"] = data["next_cursor"]
+
+class _AsyncBoardSnapshot(BoardSnapshot):
+    """
+    BoardSnapshot that never loads itself.
+    
+    The sync loaders run the blocking requests client, which must not run on the
+    event loop, so reads serve whatever get_board_snapshot() last loaded through
+    the async client. It keeps no SQLite mirror either.
+    """
+    
+    def __init__(self):
+        super().__init__(use_mirror=False)
+    
+    def ensure_current(self):
+        pass
+    
+    def sync(self):
+        return False
+
+class _AsyncUsersDirectory(UsersDirectory):
+    """UsersDirectory filled only by get_users_directory(), never by the blocking sync loader"""
+    
+    def _load(self):
+        return None
+
+# Freshness is tracked below and reloads go through the async client
+_board_snapshot = _AsyncBoardSnapshot()
+_board_loaded_at = None
+_users_directory = _AsyncUsersDirectory()
+_users_loaded_at = None
+_locks = {}
+
+def _loop_lock(name):
+    """Return an asyncio.Lock bound to the running event loop"""
+    key = (name, asyncio.get_running_loop())
+    if key not in _locks:
+        _locks[key] = asyncio.Lock()
+    return _locks[key]
+
+async def get_board_snapshot():
+    """Return the async handler's BoardSnapshot, reloading it if older than BOARD_SNAPSHOT_TTL"""
+    global _board_loaded_at
+    async with _loop_lock("board"):
+        if _board_loaded_at is None or time.monotonic() - _board_loaded_at >= BOARD_SNAPSHOT_TTL:
+            try:
+                pages = [page async for page in query_database(filter_properties=TASK_PROPERTIES, raise_errors=True)]
+            except httpx.HTTPError as e:
+                print(f"❌ Error refreshing board snapshot: {str(e)}")
+            else:
+                _board_snapshot.replace(pages)
+                _board_loaded_at = time.monotonic()
+    return _board_snapshot
+
+def invalidate_board_snapshot():
+    """Force the next read to reload the board"""
+    global _board_loaded_at
+    _board_loaded_at = None
+
+async def get_users_directory():
+    """Return the async handler's UsersDirectory, reloading it if older than USERS_DIRECTORY_TTL"""
+    global _users_loaded_at
+    async with _loop_lock("users"):
+        if _users_loaded_at is None or time.monotonic() - _users_loaded_at >= USERS_DIRECTORY_TTL:
+            users = []
+            params = {"page_size": 100}
+            while True:
+                response = await get_client().get("users", params=params)
+                if response.status_code != 200:
+                    print(f"❌ Error fetching users: {response.text}")
+                    return _users_directory
+                data = response.json()
+                users.extend(data.get("results", []))
+                if not data.get("has_more") or not data.get("next_cursor"):
+                    break
+                params["start_cursor"] = data["next_cursor"]
+            _users_directory.load_users(users)
+            _users_loaded_at = time.monotonic()
+    return _users_directory
+
+async def fetch_tasks():
+    """Fetch all tasks from Notion"""
+    return (await get_board_snapshot()).pages()
+
+async def fetch_users():
+    """Fetch all users from Notion"""
+    return (await get_users_directory()).users()
+
+async def format_board_state(tasks):
+    """Format current board state for GPT"""
+    return _format_board_state(tasks, users=await fetch_users())
+
+async def fetch_epics():
+    """Fetch all existing epics from Notion"""
+    epics = set()
+    for page in (await get_board_snapshot()).pages():
+        select = page["properties"].get("Select", {}).get("select")
+        if select and select.get("name"):
+            epics.add(select["name"])
+    return list(epics)
+
+async def find_task_match(task_name):
+    """Find the best-matching task for a name; returns (page_id, score) or (None, 0)"""
+    if not task_name:
+        return None, 0
+    return (await get_board_snapshot()).title_index().lookup(task_name)
+
+async def find_task_by_name(task_name):
+    """Find a task by name and return its page ID"""
+    page_id, score = await find_task_match(task_name)
+    if page_id and score < 1.0:
+        print(f"✓ Using closest match for '{task_name}' (similarity: {score:.2f})")
+    return page_id
+
+async def _patch_page(page_id, data, success_message, failure_message):
+    """PATCH a page, write the result through to the snapshot and report the outcome"""
+    response = await get_client().patch(f"pages/{page_id}", json=data)
+    
+    if response.status_code >= 200 and response.status_code < 300:
+        _board_snapshot.upsert(response.json())
+        print(success_message)
+        return True
+    else:
+        print(f"{failure_message}: {response.text}")
+        return False
+
+async def create_task(task_data):
+    """Create a new task in Notion"""
+    notion_database_id = os.getenv("NOTION_DATABASE_ID")
+    
+    user_id = None
+    if task_data.get('assignee'):
+        user_id = (await get_users_directory()).resolve(task_data['assignee'])
+        if not user_id:
+            print(f"⚠️ User not found: {task_data['assignee']}")
+    
+    data = build_new_task_data(task_data, notion_database_id, user_id)
+    response = await get_client().post("pages", json=data)
+    
+    if response.status_code >= 200 and response.status_code < 300:
+        (await get_board_snapshot()).upsert(response.json())
+        print(f"✅ Created task: {task_data.get('task')}")
+        return True
+    else:
+        print(f"❌ Failed to create task: {response.text}")
+        return False
+
+async def update_task(task_data):
+    """Update an existing task in Notion"""
+    task_name = task_data.get('task')
+    page_id = await find_task_by_name(task_name)
+    
+    if not page_id:
+        print(f"❌ Task not found: {task_name}")
+        return False
+    
+    user_id = None
+    if task_data.get('assignee'):
+        user_id = (await get_users_directory()).resolve(task_data['assignee'])
+        if not user_id:
+            print(f"⚠️ Could not find user ID for {task_data['assignee']}")
+    
+    data = {"properties": build_task_update_properties(task_data, user_id)}
+    return await _patch_page(page_id, data, f"✅ Updated task: {task_name}", "❌ Failed to update task")
+
+async def delete_task(task_data):
+    """Delete (archive) a task from Notion"""
+    task_name = task_data.get('task')
+    page_id = await find_task_by_name(task_name)
+    
+    if not page_id:
+        print(f"❌ Task not found: {task_name}")
+        return False
+    
+    return await _patch_page(page_id, {"archived": True}, f"✅ Archived task: {task_name}", "❌ Failed to archive task")
+
+async def rename_task(task_data):
+    """Rename a task in Notion"""
+    old_name = task_data.get('old_name')
+    if not old_name:
+        print("❌ No old name provided for rename operation")
+        return False
+    
+    page_id = await find_task_by_name(old_name)
+    if not page_id:
+        print(f"❌ Task not found: {old_name}")
+        return False
+    
+    data = {
+        "properties": {
+            "Name": {"title": [{"text": {"content": task_data.get('new_name', 'Untitled Task')}}]}
+        }
+    }
+    return await _patch_page(
+        page_id, data, f"✅ Renamed task: {old_name} → {task_data.get('new_name')}", "❌ Failed to rename task"
+    )
+
+async def assign_epic_to_task(task_name, epic_name):
+    """Assign an existing epic to a task"""
+    page_id = await find_task_by_name(task_name)
+    
+    if not page_id:
+        print(f"❌ Task not found: {task_name}")
+        return False
+    
+    data = {"properties": {"Select": {"select": {"name": epic_name}}}}
+    return await _patch_page(
+        page_id, data, f"✅ Assigned epic '{epic_name}' to task: {task_name}", "❌ Failed to assign epic"
+    )
+
+async def add_comment(task_data):
+    """Add a comment to a task in Notion"""
+    task_name = task_data.get('task')
+    page_id = await find_task_by_name(task_name)
+    
+    if not page_id:
+        print(f"❌ Task not found: {task_name}")
+        return False
+    
+    data = {
+        "parent": {"page_id": page_id},
+        "rich_text": [{"type": "text", "text": {"content": task_data.get('comment', '')}}]
+    }
+    response = await get_client().post("comments", json=data)
+    
+    if response.status_code >= 200 and response.status_code < 300:
+        print(f"✅ Added comment to task: {task_name}")
+        return True
+    else:
+        print(f"❌ Failed to add comment: {response.text}")
+        return False
+
+async def create_epics(operations):
+    """Create the epics for a batch of create_epic operations with at most one schema PATCH"""
+    notion_database_id = os.getenv("NOTION_DATABASE_ID")
+    
+    try:
+        database = await get_database(notion_database_id)
+        existing = (_database_schema.select_options(notion_database_id) if database else []) + await fetch_epics()
+        results, pending = plan_epic_creation(operations, existing)
+        if not pending:
+            return results
+        
+        if database is None:
+            print("❌ Failed to get database schema")
+            return results
+        
+        update_data = build_epic_schema_update(database, list(pending))
+        if not update_data:
+            print("❌ No select property found in database schema")
+            return results
+        
+        response = await get_client().patch(f"databases/{notion_database_id}", json=update_data)
+    except Exception as e:
+        print(f"❌ Error processing operation create_epic: {str(e)}")
+        return [
+            {"operation": "create_epic", "success": False, "epic": op.get('epic'), "error": str(e)}
+            for op in operations
+        ]
+    
+    if response.status_code >= 200 and response.status_code < 300:
+        _database_schema.store(notion_database_id, response.json())
+        for epic_name, entries in pending.items():
+            print(f"✅ Created epic: {epic_name}")
+            for result in entries:
+                result['success'] = True
+    else:
+        print(f"❌ Failed to create epics {', '.join(pending)}: {response.text}")
+    
+    return results
+
+async def create_epic(epic_data):
+    """Create a new epic in Notion"""
+    return (await create_epics([epic_data]))[0]['success']
+
+async def _execute_operation(op):
+    """Run a single task operation and return its result entry"""
+    operation_type = op.get('operation')
+    result = {"operation": operation_type, "success": False}
+    
+    try:
+        if operation_type == 'create':
+            result['success'] = await create_task(op)
+            result['task'] = op.get('task')
+        elif operation_type == 'update':
+            result['success'] = await update_task(op)
+            result['task'] = op.get('task')
+        elif operation_type == 'delete':
+            result['success'] = await delete_task(op)
+            result['task'] = op.get('task')
+        elif operation_type == 'rename':
+            result['success'] = await rename_task(op)
+            result['old_name'] = op.get('old_name')
+            result['new_name'] = op.get('new_name')
+        elif operation_type == 'comment':
+            result['success'] = await add_comment(op)
+            result['task'] = op.get('task')
+        elif operation_type == 'create_epic':
+            result['success'] = await create_epic(op)
+            result['epic'] = op.get('epic')
+        elif operation_type == 'assign_epic':
+            result['success'] = await assign_epic_to_task(op.get('task'), op.get('epic'))
+            result['task'] = op.get('task')
+            result['epic'] = op.get('epic')
+        else:
+            print(f"❌ Unknown operation type: {operation_type}")
+    except Exception as e:
+        print(f"❌ Error processing operation {operation_type}: {str(e)}")
+        result['error'] = str(e)
+    
+    return result
+
+async def handle_task_operations(operations, max_concurrency=NOTION_ASYNC_MAX_CONCURRENCY):
+    """
+    Process a list of task operations concurrently.
+    
+    All create_epic operations run first as a single schema PATCH. The rest use
+    the same dependency graph as the sync handler: each operation waits only for
+    earlier operations touching the same task. Results are returned in input
+    order with the same dict shape as notion_handler.handle_task_operations.
+    """
+    if not operations:
+        return []
+    
+    snapshot = await get_board_snapshot()
+    if any(op.get('assignee') for op in operations):
+        await get_users_directory()
+    
+    results = [None] * len(operations)
+    epic_indices = [i for i, op in enumerate(operations) if op.get("operation") == "create_epic"]
+    if epic_indices:
+        epic_results = await create_epics([operations[i] for i in epic_indices])
+        for i, result in zip(epic_indices, epic_results):
+            results[i] = result
+    
+    epic_set = set(epic_indices)
+    other_indices = [i for i in range(len(operations)) if i not in epic_set]
+    operations = [operations[i] for i in other_indices]
+    
+    order = _order_operations(operations)
+    dependencies = _build_dependencies(operations, order, lookup=snapshot.title_index().lookup)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    tasks = {}
+    
+    async def run(i):
+        if dependencies[i]:
+            await asyncio.gather(*(tasks[j] for j in dependencies[i]))
+        async with semaphore:
+            return await _execute_operation(operations[i])
+    
+    # Dependencies always point to earlier positions in `order`, so they exist already
+    for i in order:
+        tasks[i] = asyncio.ensure_future(run(i))
+    
+    other_results = await asyncio.gather(*(tasks[i] for i in range(len(operations))))
+    for i, result in zip(other_indices, other_results):
+        results[i] = result
+    
+    return results
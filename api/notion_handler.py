@@ -2,54 +2,915 @@
 import requests
 import json
 import os
-from datetime import datetime
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
 
-def fetch_tasks():
-    """Fetch all tasks from Notion"""
-    notion_api_key = os.getenv("NOTION_API_KEY")
-    notion_database_id = os.getenv("NOTION_DATABASE_ID")
+from utils.dependency_runner import run_with_dependencies
+
+NOTION_API_URL = "https://api.notion.com/v1"
+NOTION_VERSION = "2022-06-28"
+
+NOTION_RATE_LIMIT = 3.0         # requests per second per integration
+NOTION_MAX_RETRIES = 5
+NOTION_BACKOFF_BASE = 0.5       # seconds, doubled on each retry
+NOTION_BACKOFF_MAX = 30.0       # seconds
+NOTION_OPERATION_DEADLINE = 60  # seconds allowed for one operation, retries included
+
+class RateLimiter:
+    """Thread-safe token bucket shared by every request to one API"""
+    
+    def __init__(self, rate=NOTION_RATE_LIMIT, capacity=None):
+        """Initialize a full bucket refilling at `rate` tokens per second"""
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def try_acquire(self):
+        """Take a token if one is available; returns 0.0, or the seconds until one will be"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+    
+    def acquire(self):
+        """Block until a token is available; returns the number of seconds waited"""
+        waited = 0.0
+        while True:
+            delay = self.try_acquire()
+            if delay <= 0:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+class NotionClient:
+    """
+    Shared Notion API client.
+    
+    Owns a pooled keep-alive session, passes every request through a token-bucket
+    rate limiter, retries 429/5xx responses with jittered exponential backoff
+    (honouring Retry-After), and keeps per-endpoint latency, retry and wait counters.
+    """
+    
+    def __init__(self, api_key=None, pool_size=10, timeout=(5, 30), rate_limiter=None,
+                 max_retries=NOTION_MAX_RETRIES, deadline=NOTION_OPERATION_DEADLINE):
+        """Initialize the client; the API key is read from the environment on each call if not given"""
+        self.api_key = api_key
+        self.timeout = timeout  # (connect, read) seconds
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.max_retries = max_retries
+        self.deadline = deadline
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "Notion-Version": NOTION_VERSION
+        })
+        
+        self._stats = {}
+        self._metrics = {"rate_limit_waits": 0, "rate_limit_wait_time": 0.0, "retries": 0, "deadline_exceeded": 0}
+        self._stats_lock = threading.Lock()
+        self._local = threading.local()
+    
+    def _endpoint_key(self, method, path):
+        """Collapse page/database IDs and query strings so calls to the same endpoint share one counter"""
+        path = path.split("?")[0]
+        path = re.sub(r"[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}", "{id}", path)
+        return f"{method.upper()} /{path.lstrip('/')}"
+    
+    def _endpoint_stats(self, key):
+        """Return the counters for one endpoint; caller holds the stats lock"""
+        return self._stats.setdefault(key, {
+            "count": 0, "errors": 0, "retries": 0, "total_time": 0.0, "max_time": 0.0, "wait_time": 0.0
+        })
+    
+    def _record(self, key, elapsed, ok):
+        """Record the latency and outcome of a single call"""
+        with self._stats_lock:
+            stats = self._endpoint_stats(key)
+            stats["count"] += 1
+            stats["total_time"] += elapsed
+            stats["max_time"] = max(stats["max_time"], elapsed)
+            if not ok:
+                stats["errors"] += 1
+    
+    def _record_wait(self, key, waited):
+        """Record time spent waiting on the rate limiter"""
+        if waited <= 0:
+            return
+        with self._stats_lock:
+            self._endpoint_stats(key)["wait_time"] += waited
+            self._metrics["rate_limit_waits"] += 1
+            self._metrics["rate_limit_wait_time"] += waited
+    
+    def _record_retry(self, key):
+        """Record one retry"""
+        with self._stats_lock:
+            self._endpoint_stats(key)["retries"] += 1
+            self._metrics["retries"] += 1
+    
+    def _retry_delay(self, response, attempt):
+        """Seconds to wait before the next attempt: Retry-After if given, else jittered backoff"""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        backoff = min(NOTION_BACKOFF_MAX, NOTION_BACKOFF_BASE * (2 ** attempt))
+        return backoff / 2 + random.uniform(0, backoff / 2)
+    
+    @contextmanager
+    def operation_deadline(self, seconds=None):
+        """Bound the total time (including retries) of every request made in this block on this thread"""
+        previous = getattr(self._local, "deadline", None)
+        deadline = time.monotonic() + (seconds or self.deadline)
+        self._local.deadline = min(deadline, previous) if previous else deadline
+        try:
+            yield
+        finally:
+            self._local.deadline = previous
+    
+    def request(self, method, path, **kwargs):
+        """
+        Send a request to the Notion API and return the response.
+        
+        Retries 429 responses, and 5xx responses and connection errors on requests
+        that are safe to repeat, until max_retries or the deadline runs out; the
+        last response is returned either way. A page or comment POST that fails
+        with a 5xx may still have been applied, so it is returned as is rather
+        than risk a duplicate.
+        """
+        url = f"{NOTION_API_URL}/{path.lstrip('/')}"
+        api_key = self.api_key or os.getenv("NOTION_API_KEY")
+        kwargs.setdefault("timeout", self.timeout)
+        
+        key = self._endpoint_key(method, path)
+        deadline = getattr(self._local, "deadline", None) or time.monotonic() + self.deadline
+        repeatable = method.upper() != "POST" or key.endswith("/query")
+        attempt = 0
+        
+        while True:
+            self._record_wait(key, self.rate_limiter.acquire())
+            
+            start = time.perf_counter()
+            response = None
+            error = None
+            try:
+                response = self.session.request(
+                    method, url, headers={"Authorization": f"Bearer {api_key}"}, **kwargs
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not repeatable:
+                    raise
+                error = e
+            finally:
+                self._record(key, time.perf_counter() - start, response is not None and response.status_code < 400)
+            
+            if response is not None and response.status_code != 429 and (response.status_code < 500 or not repeatable):
+                return response
+            
+            delay = self._retry_delay(response, attempt)
+            if attempt >= self.max_retries or time.monotonic() + delay > deadline:
+                if time.monotonic() + delay > deadline:
+                    with self._stats_lock:
+                        self._metrics["deadline_exceeded"] += 1
+                if error is not None:
+                    raise error
+                return response
+            
+            attempt += 1
+            self._record_retry(key)
+            time.sleep(delay)
+    
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+    
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+    
+    def patch(self, path, **kwargs):
+        return self.request("PATCH", path, **kwargs)
+    
+    def get_stats(self):
+        """Return a copy of the per-endpoint counters with average latency filled in"""
+        with self._stats_lock:
+            stats = {}
+            for key, value in self._stats.items():
+                stats[key] = dict(value)
+                stats[key]["avg_time"] = value["total_time"] / value["count"] if value["count"] else 0.0
+            return stats
+    
+    def get_metrics(self):
+        """Return client-wide rate-limit and retry counters"""
+        with self._stats_lock:
+            return dict(self._metrics)
+    
+    def reset_stats(self):
+        """Clear all counters"""
+        with self._stats_lock:
+            self._stats.clear()
+            for name in self._metrics:
+                self._metrics[name] = 0
+    
+    def close(self):
+        """Close the underlying session and its pooled connections"""
+        self.session.close()
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    """Return the process-wide NotionClient, creating it on first use"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = NotionClient()
+    return _client
+
+# Properties read by format_board_state, find_task_by_name and the epic helpers
+TASK_PROPERTIES = ["Name", "Status", "Assign", "Deadline", "Select"]
+
+DATABASE_SCHEMA_TTL = 600  # seconds
+
+class DatabaseSchema:
+    """
+    Cache of database schemas.
+    
+    Each database is read once per TTL. The select, status, people and date
+    properties and their option lists are kept in memory, and the database
+    objects returned by our own schema PATCHes are stored back, so adding
+    epics never needs a re-read.
+    """
+    
+    CACHED_TYPES = ("select", "status", "people", "date")
+    
+    def __init__(self, ttl=DATABASE_SCHEMA_TTL):
+        """Initialize an empty cache"""
+        self.ttl = ttl
+        self._databases = {}  # database ID -> (loaded_at, database object)
+        self._lock = threading.RLock()
+    
+    def cached(self, database_id):
+        """Return the cached database object if it is within its TTL, without any request"""
+        with self._lock:
+            entry = self._databases.get(database_id)
+            if entry and time.monotonic() - entry[0] < self.ttl:
+                return entry[1]
+            return None
+    
+    def get(self, database_id=None):
+        """Return the database object, reading it from Notion when not cached; None on failure"""
+        database_id = database_id or os.getenv("NOTION_DATABASE_ID")
+        with self._lock:
+            database = self.cached(database_id)
+            if database is not None:
+                return database
+            
+            response = get_client().get(f"databases/{database_id}")
+            if response.status_code != 200:
+                print(f"⚠️ Could not read database schema: {response.text}")
+                return None
+            self.store(database_id, response.json())
+            return self._databases[database_id][1]
+    
+    def store(self, database_id, database):
+        """Cache a database object returned by a GET or PATCH"""
+        with self._lock:
+            self._databases[database_id] = (time.monotonic(), database)
+    
+    def properties(self, database_id=None):
+        """
+        Return the cached property types of a database.
+        
+        Returns:
+            dict: property name -> {"id", "type", "options"}, for select, status,
+            people and date properties (options is empty for people and date).
+        """
+        database = self.get(database_id) or {}
+        properties = {}
+        for name, prop in database.get("properties", {}).items():
+            prop_type = prop.get("type")
+            if prop_type in self.CACHED_TYPES:
+                options = (prop.get(prop_type) or {}).get("options", [])
+                properties[name] = {
+                    "id": prop.get("id"),
+                    "type": prop_type,
+                    "options": [option.get("name") for option in options]
+                }
+        return properties
+    
+    def property_ids(self, database_id, names):
+        """Map property names to their IDs, or None if the schema can't be read"""
+        database = self.get(database_id)
+        if database is None:
+            return None
+        schema = database.get("properties", {})
+        return [schema[name].get("id") for name in names if name in schema]
+    
+    def select_options(self, database_id=None):
+        """Return the option names of the select property that holds epics"""
+        for prop in self.properties(database_id).values():
+            if prop["type"] == "select":
+                return prop["options"]
+        return []
     
-    headers = {
-        "Authorization": f"Bearer {notion_api_key}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
+    def invalidate(self, database_id=None):
+        """Drop one cached database, or all of them"""
+        with self._lock:
+            if database_id:
+                self._databases.pop(database_id, None)
+            else:
+                self._databases = {}
+
+_database_schema = DatabaseSchema()
+
+def get_database_schema():
+    """Return the process-wide DatabaseSchema cache"""
+    return _database_schema
+
+def _resolve_property_ids(database_id, names):
+    """Map property names to the IDs Notion expects in filter_properties"""
+    ids = get_database_schema().property_ids(database_id, names)
+    if ids is None:
+        print("⚠️ Querying all properties")
+    return ids
+
+def query_database(database_id=None, query_filter=None, sorts=None, filter_properties=None, page_size=100,
+                   raise_errors=False):
+    """
+    Stream pages from a Notion database query, following pagination cursors.
+    
+    Args:
+        database_id (str): The database to query. Defaults to NOTION_DATABASE_ID.
+        query_filter (dict): A Notion filter object, passed through as "filter".
+        sorts (list): A list of Notion sort objects.
+        filter_properties (list): Property names to return; all other properties are left off the response.
+        page_size (int): Number of pages to request per round trip (max 100).
+        raise_errors (bool): Raise requests.HTTPError on a failed page instead of stopping quietly.
+    
+    Yields:
+        dict: Notion page objects, available as soon as their batch arrives.
+    """
+    database_id = database_id or os.getenv("NOTION_DATABASE_ID")
+    
+    path = f"databases/{database_id}/query"
+    if filter_properties:
+        property_ids = _resolve_property_ids(database_id, filter_properties)
+        if property_ids:
+            # Property IDs are already URL-encoded, so build the query string by hand
+            path += "?" + "&".join(f"filter_properties={prop_id}" for prop_id in property_ids)
+    
+    body = {"page_size": page_size}
+    if query_filter:
+        body["filter"] = query_filter
+    if sorts:
+        body["sorts"] = sorts
+    
+    while True:
+        response = get_client().post(path, json=body)
+        
+        if response.status_code != 200:
+            if raise_errors:
+                response.raise_for_status()
+            print(f"❌ Error querying database: {response.text}")
+            return
+        
+        data = response.json()
+        for page in data.get("results", []):
+            yield page
+        
+        if not data.get("has_more") or not data.get("next_cursor"):
+            return
+        body["start_cursor"] = data["next_cursor"]
+
+def iter_tasks(page_size=100, raise_errors=False):
+    """Stream all tasks from Notion, fetching only the properties we read"""
+    return query_database(filter_properties=TASK_PROPERTIES, page_size=page_size, raise_errors=raise_errors)
+
+def get_task_title(page):
+    """Return the plain title of a task page, or an empty string"""
+    title_property = page.get("properties", {}).get("Name", {}).get("title") or []
+    return "".join(part.get("text", {}).get("content", part.get("plain_text", "")) for part in title_property)
+
+def normalize_title(title):
+    """Normalize a task title for case- and whitespace-insensitive matching"""
+    return " ".join(title.lower().split())
+
+def project_task(page):
+    """Flatten a task page into the fields the board state, lookups and mirror use"""
+    properties = page.get("properties", {})
+    status = (properties.get("Status") or {}).get("status") or {}
+    people = (properties.get("Assign") or {}).get("people") or []
+    deadline = (properties.get("Deadline") or {}).get("date") or {}
+    epic = (properties.get("Select") or {}).get("select") or {}
+    return {
+        "id": page.get("id"),
+        "title": get_task_title(page),
+        "status": status.get("name"),
+        "assignee": people[0].get("name") if people else None,
+        "assignee_id": people[0].get("id") if people else None,
+        "deadline": deadline.get("start"),
+        "epic": epic.get("name"),
+        "epic_color": epic.get("color")
     }
+
+class TitleIndex:
+    """
+    In-memory index of task titles.
+    
+    Exact lookups go through a hash map of normalized titles. Substring lookups use a
+    trigram inverted index for titles containing the query, and hash probes of the
+    query's substrings for titles contained in it. Matches are ranked by length ratio
+    rather than by whichever page the database happened to return first.
+    """
+    
+    def __init__(self):
+        """Initialize an empty index"""
+        self._titles = {}    # page ID -> normalized title
+        self._order = {}     # page ID -> insertion order, used to break ties
+        self._exact = {}     # normalized title -> [page IDs]
+        self._trigrams = {}  # trigram -> {page IDs}
+        self._next_order = 0
+    
+    @staticmethod
+    def _grams(text):
+        """Return the set of character trigrams in a string"""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    def add(self, page_id, title):
+        """Index a page title, replacing any previous title for the page"""
+        if page_id in self._titles:
+            self.remove(page_id)
+        
+        norm = normalize_title(title)
+        if not norm:
+            return
+        
+        self._titles[page_id] = norm
+        self._order[page_id] = self._next_order
+        self._next_order += 1
+        self._exact.setdefault(norm, []).append(page_id)
+        for gram in self._grams(norm):
+            self._trigrams.setdefault(gram, set()).add(page_id)
+    
+    def remove(self, page_id):
+        """Drop a page from the index"""
+        norm = self._titles.pop(page_id, None)
+        self._order.pop(page_id, None)
+        if norm is None:
+            return
+        
+        ids = self._exact.get(norm, [])
+        if page_id in ids:
+            ids.remove(page_id)
+        if not ids:
+            self._exact.pop(norm, None)
+        for gram in self._grams(norm):
+            postings = self._trigrams.get(gram)
+            if postings:
+                postings.discard(page_id)
+                if not postings:
+                    del self._trigrams[gram]
+    
+    def _containing(self, query):
+        """Return IDs of pages whose titles contain the query"""
+        grams = self._grams(query)
+        if not grams:
+            # Too short for trigrams; short queries are rare, so scan
+            return [page_id for page_id, title in self._titles.items() if query in title]
+        
+        postings = sorted((self._trigrams.get(gram, set()) for gram in grams), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates &= posting
+        
+        return [page_id for page_id in candidates if query in self._titles[page_id]]
+    
+    def _contained(self, query):
+        """Return IDs of pages whose titles are substrings of the query"""
+        found = []
+        for start in range(len(query)):
+            for end in range(start + 1, len(query) + 1):
+                found.extend(self._exact.get(query[start:end], []))
+        return found
+    
+    def candidates(self, name, limit=5):
+        """
+        Rank pages whose titles match a name.
+        
+        Args:
+            name (str): The task name to look up.
+            limit (int): Maximum number of candidates to return.
+        
+        Returns:
+            list: (page_id, score) tuples, best first. Score is 1.0 for an exact match,
+            otherwise the length ratio of the shorter string to the longer one.
+        """
+        query = normalize_title(name or "")
+        if not query:
+            return []
+        
+        if query in self._exact:
+            return [(page_id, 1.0) for page_id in self._exact[query][:limit]]
+        
+        scored = {}
+        for page_id in self._containing(query) + self._contained(query):
+            title = self._titles[page_id]
+            scored[page_id] = min(len(title), len(query)) / max(len(title), len(query))
+        
+        ranked = sorted(scored.items(), key=lambda item: (-item[1], self._order[item[0]]))
+        return ranked[:limit]
     
-    url = f"https://api.notion.com/v1/databases/{notion_database_id}/query"
-    response = requests.post(url, headers=headers, json={})
+    def lookup(self, name):
+        """Return the best (page_id, score) match for a name, or (None, 0)"""
+        ranked = self.candidates(name, limit=1)
+        return ranked[0] if ranked else (None, 0)
+
+BOARD_SNAPSHOT_TTL = 60  # seconds
+FULL_SYNC_INTERVAL = 900  # seconds between full reloads, which also pick up pages archived elsewhere
+
+class BoardSnapshot:
+    """
+    Process-wide cache of the task database.
+    
+    One full query fills it; every reader in this module shares it, and our own
+    creates/updates/renames/archives are written through so it stays correct
+    without refetching until the TTL runs out or invalidate() is called.
+    
+    Once loaded, it is kept current by delta syncs that only fetch pages whose
+    last_edited_time is at or after the high-water mark. Notion's query endpoint
+    never returns archived pages, so pages archived outside this process are only
+    dropped by the periodic full reload.
+    
+    When NOTION_MIRROR_PATH is set, every change is also written to the SQLite
+    mirror, and a new process restores from it and delta-syncs instead of
+    running a full scan.
+    """
+    
+    def __init__(self, ttl=BOARD_SNAPSHOT_TTL, full_sync_interval=FULL_SYNC_INTERVAL, use_mirror=True):
+        """Initialize an empty snapshot"""
+        self.ttl = ttl
+        self.full_sync_interval = full_sync_interval
+        self.use_mirror = use_mirror
+        self._pages = {}  # page ID -> page object, in query order
+        self._index = None  # TitleIndex, built on first lookup
+        self._loaded_at = None
+        self._full_loaded_at = None
+        self._high_water_mark = None  # latest last_edited_time seen, ISO 8601
+        self._lock = threading.RLock()
+    
+    def is_fresh(self):
+        """Check whether the snapshot is loaded and within its TTL"""
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl
+    
+    def ensure_current(self):
+        """Sync the snapshot if it is stale"""
+        with self._lock:
+            if not self.is_fresh():
+                self.sync()
+    
+    def mirror(self):
+        """Return the SQLite mirror this snapshot writes to, or None"""
+        return get_mirror() if self.use_mirror else None
+    
+    def _restore(self):
+        """Load the snapshot from the mirror left by a previous process, if any"""
+        mirror = self.mirror()
+        if mirror is None:
+            return False
+        saved = mirror.load()
+        if saved is None:
+            return False
+        pages, high_water_mark, full_synced_at = saved
+        self._pages = {page["id"]: page for page in pages}
+        self._index = None
+        self._high_water_mark = high_water_mark
+        self._loaded_at = time.monotonic()
+        # Carry the age of the last full sync across the restart
+        self._full_loaded_at = self._loaded_at - max(0.0, time.time() - full_synced_at)
+        return True
     
-    if response.status_code == 200:
-        return response.json().get("results", [])
-    else:
-        print(f"❌ Error fetching tasks: {response.text}")
-        return []
+    def refresh(self):
+        """Reload every task from Notion; on failure the previous contents are kept"""
+        with self._lock:
+            try:
+                pages = list(iter_tasks(raise_errors=True))
+            except requests.RequestException as e:
+                print(f"❌ Error refreshing board snapshot: {str(e)}")
+                return False
+            
+            self.replace(pages)
+            return True
+    
+    def replace(self, pages):
+        """Replace the snapshot contents with a freshly loaded list of pages"""
+        with self._lock:
+            self._pages = {page["id"]: page for page in pages}
+            self._index = None
+            self._loaded_at = time.monotonic()
+            self._full_loaded_at = self._loaded_at
+            self._advance_high_water_mark(pages)
+            mirror = self.mirror()
+            if mirror is not None:
+                mirror.replace(pages, self._high_water_mark)
+    
+    def _advance_high_water_mark(self, pages):
+        """Move the high-water mark to the newest last_edited_time in pages"""
+        edited = [page["last_edited_time"] for page in pages if page.get("last_edited_time")]
+        if self._high_water_mark:
+            edited.append(self._high_water_mark)
+        if edited:
+            # ISO 8601 UTC timestamps in the same format compare correctly as strings
+            self._high_water_mark = max(edited)
+    
+    def merge(self, pages):
+        """Apply pages from a delta query; archived pages are treated as deletions"""
+        with self._lock:
+            for page in pages:
+                self._apply(page)
+            self._loaded_at = time.monotonic()
+            self._advance_high_water_mark(pages)
+            mirror = self.mirror()
+            if mirror is not None:
+                mirror.upsert(pages, self._high_water_mark)
+    
+    def sync(self):
+        """
+        Bring the snapshot up to date.
+        
+        Fetches only pages edited since the high-water mark, falling back to a full
+        reload on first use, when no mark is known, or every full_sync_interval.
+        
+        Returns:
+            bool: True if the snapshot is now current.
+        """
+        with self._lock:
+            if self._loaded_at is None and self._high_water_mark is None:
+                self._restore()
+            if (self._high_water_mark is None or self._full_loaded_at is None
+                    or time.monotonic() - self._full_loaded_at >= self.full_sync_interval):
+                return self.refresh()
+            
+            # last_edited_time is rounded to the minute, so on_or_after re-reads the
+            # boundary minute; merging the same page twice is harmless
+            query_filter = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": self._high_water_mark}
+            }
+            try:
+                changed = list(query_database(
+                    query_filter=query_filter, filter_properties=TASK_PROPERTIES, raise_errors=True
+                ))
+            except requests.RequestException as e:
+                print(f"❌ Error syncing board snapshot: {str(e)}")
+                return False
+            
+            self.merge(changed)
+            return True
+    
+    def pages(self):
+        """Return all cached task pages, loading them first if the snapshot is stale"""
+        with self._lock:
+            self.ensure_current()
+            return list(self._pages.values())
+    
+    def get(self, page_id):
+        """Return a cached page by ID, or None"""
+        with self._lock:
+            return self._pages.get(page_id)
+    
+    def title_index(self):
+        """Return the TitleIndex for the current pages, building it once per load"""
+        with self._lock:
+            self.ensure_current()
+            if self._index is None:
+                self._index = TitleIndex()
+                for page in self._pages.values():
+                    self._index.add(page["id"], get_task_title(page))
+            return self._index
+    
+    def _apply(self, page):
+        """Apply one page to the in-memory contents; archived pages are removed"""
+        if page.get("archived") or page.get("in_trash"):
+            self._discard(page["id"])
+            return
+        self._pages[page["id"]] = page
+        if self._index is not None:
+            self._index.add(page["id"], get_task_title(page))
+    
+    def _discard(self, page_id):
+        """Drop a page from the in-memory contents"""
+        self._pages.pop(page_id, None)
+        if self._index is not None:
+            self._index.remove(page_id)
+    
+    def upsert(self, page):
+        """Write a page returned by a create/update call through to the snapshot"""
+        if not page or page.get("object") != "page":
+            return
+        with self._lock:
+            self._apply(page)
+            mirror = self.mirror()
+            if mirror is not None:
+                mirror.upsert([page])
+    
+    def remove(self, page_id):
+        """Drop an archived page from the snapshot"""
+        with self._lock:
+            self._discard(page_id)
+            mirror = self.mirror()
+            if mirror is not None:
+                mirror.delete(page_id)
+    
+    def invalidate(self):
+        """Force the next read to reload from Notion"""
+        with self._lock:
+            self._pages = {}
+            self._index = None
+            self._loaded_at = None
+            self._full_loaded_at = None
+            self._high_water_mark = None
+            mirror = self.mirror()
+            if mirror is not None:
+                mirror.clear()
+
+_mirrors = {}
+_mirrors_lock = threading.Lock()
+
+def get_mirror():
+    """Return the SQLite mirror for the configured database, or None if NOTION_MIRROR_PATH is unset"""
+    path = os.getenv("NOTION_MIRROR_PATH")
+    database_id = os.getenv("NOTION_DATABASE_ID")
+    if not path or not database_id:
+        return None
+    key = (path, database_id)
+    with _mirrors_lock:
+        if key not in _mirrors:
+            # Imported here because the mirror reuses this module's page helpers
+            from api.notion_mirror import NotionMirror
+            _mirrors[key] = NotionMirror(path, database_id)
+        return _mirrors[key]
+
+_board_snapshot = BoardSnapshot()
+
+def get_board_snapshot():
+    """Return the process-wide BoardSnapshot"""
+    return _board_snapshot
+
+def fetch_tasks():
+    """Fetch all tasks from Notion"""
+    return get_board_snapshot().pages()
+
+def sync():
+    """Bring the board snapshot up to date with a delta query and return all tasks"""
+    snapshot = get_board_snapshot()
+    snapshot.sync()
+    return snapshot.pages()
+
+def fetch_task_summaries():
+    """Return every task as a project_task() dict, served from the mirror when enabled"""
+    snapshot = get_board_snapshot()
+    snapshot.ensure_current()
+    mirror = snapshot.mirror()
+    if mirror is not None:
+        return mirror.tasks()
+    return [project_task(page) for page in snapshot.pages()]
+
+USERS_DIRECTORY_TTL = 300  # seconds
+
+class UsersDirectory:
+    """
+    Cached directory of Notion workspace users.
+    
+    Loaded with full cursor pagination and refreshed after the TTL. Names resolve
+    exactly first, then case-insensitively against the full name, email, email
+    local part and (when unambiguous) first name.
+    """
+    
+    def __init__(self, ttl=USERS_DIRECTORY_TTL):
+        """Initialize an empty directory"""
+        self.ttl = ttl
+        self._users = {}    # display name -> user ID
+        self._aliases = {}  # lowercase alias -> user ID
+        self._loaded_at = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def _load(self):
+        """Fetch every page of /v1/users; returns None on failure"""
+        users = []
+        params = {"page_size": 100}
+        
+        while True:
+            response = get_client().get("users", params=params)
+            if response.status_code != 200:
+                print(f"❌ Error fetching users: {response.text}")
+                return None
+            
+            data = response.json()
+            users.extend(data.get("results", []))
+            
+            if not data.get("has_more") or not data.get("next_cursor"):
+                return users
+            params["start_cursor"] = data["next_cursor"]
+    
+    def _ensure_loaded(self):
+        """Reload the directory if it is stale, counting cache hits and misses"""
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl:
+            self.hits += 1
+            return
+        
+        self.misses += 1
+        users = self._load()
+        if users is not None:
+            self.load_users(users)
+    
+    def load_users(self, users):
+        """Rebuild the name and alias maps from a list of Notion user objects"""
+        names = {}
+        aliases = {}
+        first_names = {}
+        for user in users:
+            name = user.get("name")
+            if not name:
+                continue
+            names[name] = user["id"]
+            aliases[name.lower()] = user["id"]
+            
+            email = (user.get("person") or {}).get("email")
+            if email:
+                aliases.setdefault(email.lower(), user["id"])
+                aliases.setdefault(email.split("@")[0].lower(), user["id"])
+            
+            first_names.setdefault(name.split()[0].lower(), set()).add(user["id"])
+        
+        for first_name, ids in first_names.items():
+            if len(ids) == 1:
+                aliases.setdefault(first_name, next(iter(ids)))
+        
+        self._users = names
+        self._aliases = aliases
+        self._loaded_at = time.monotonic()
+    
+    def users(self):
+        """Return a {name: user_id} mapping of all users"""
+        with self._lock:
+            self._ensure_loaded()
+            return dict(self._users)
+    
+    def resolve(self, name):
+        """Return the user ID for a name or alias, or None"""
+        if not name:
+            return None
+        with self._lock:
+            self._ensure_loaded()
+            if name in self._users:
+                return self._users[name]
+            return self._aliases.get(name.strip().lower())
+    
+    def get_stats(self):
+        """Return cache hit/miss counters"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "users": len(self._users)}
+    
+    def invalidate(self):
+        """Force the next lookup to reload from Notion"""
+        with self._lock:
+            self._loaded_at = None
+
+_users_directory = UsersDirectory()
+
+def get_users_directory():
+    """Return the process-wide UsersDirectory"""
+    return _users_directory
 
 def fetch_users():
     """Fetch all users from Notion"""
-    notion_api_key = os.getenv("NOTION_API_KEY")
-    
-    headers = {
-        "Authorization": f"Bearer {notion_api_key}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
-    
-    url = "https://api.notion.com/v1/users"
-    response = requests.get(url, headers=headers)
-    
-    if response.status_code == 200:
-        users = {}
-        for user in response.json().get("results", []):
-            users[user["name"]] = user["id"]
-        return users
-    else:
-        print(f"❌ Error fetching users: {response.text}")
-        return {}
+    return get_users_directory().users()
 
-def format_board_state(tasks):
+def format_board_state(tasks=None, users=None):
     """Format current board state for GPT"""
     # First, get all users
-    users = fetch_users()
+    if users is None:
+        users = fetch_users()
     
     board_state = "Current Board State:\n\n"
     
@@ -61,24 +922,16 @@ def format_board_state(tasks):
     board_state += "\nCurrent Tasks:\n"
     statuses = {"Not started": [], "In Progress": [], "Done": []}
     
+    # With no task list given, read the projected rows (from the mirror when enabled)
+    if tasks is None:
+        summaries = fetch_task_summaries()
+    else:
+        summaries = [project_task(task) for task in tasks]
+    
     # Group tasks by status
-    for task in tasks:
-        status = task["properties"]["Status"]["status"]["name"]
-        name = task["properties"]["Name"]["title"][0]["text"]["content"]
-        
-        # Get assignee
-        assignee = None
-        if "Assign" in task["properties"] and task["properties"]["Assign"]["people"]:
-            assignee = task["properties"]["Assign"]["people"][0]["name"]
-        
-        # Get deadline
-        deadline = "No deadline"
-        if "Deadline" in task["properties"] and task["properties"]["Deadline"] is not None:
-            date_obj = task["properties"]["Deadline"].get("date")
-            if date_obj:
-                deadline = date_obj.get("start", "No deadline")
-            
-        statuses[status].append((name, assignee, deadline))
+    for task in summaries:
+        deadline = task["deadline"] or "No deadline"
+        statuses[task["status"]].append((task["title"], task["assignee"], deadline))
     
     # Format tasks by status
     for status, tasks in statuses.items():
@@ -89,63 +942,45 @@ def format_board_state(tasks):
     
     return board_state
 
+def _iter_epic_selects():
+    """Yield the Select value of every task that has an epic assigned"""
+    for page in get_board_snapshot().pages():
+        if "Select" in page["properties"] and page["properties"]["Select"].get("select"):
+            yield page["properties"]["Select"]["select"]
+
 def fetch_epics():
     """Fetch all existing epics from Notion"""
-    notion_api_key = os.getenv("NOTION_API_KEY")
-    notion_database_id = os.getenv("NOTION_DATABASE_ID")
-    
-    headers = {
-        "Authorization": f"Bearer {notion_api_key}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
+    snapshot = get_board_snapshot()
+    mirror = snapshot.mirror()
+    if mirror is not None:
+        snapshot.ensure_current()
+        return mirror.epics()
     
-    url = f"https://api.notion.com/v1/databases/{notion_database_id}/query"
+    epics = set()
     
-    response = requests.post(url, headers=headers, json={})
+    for select in _iter_epic_selects():
+        epic = select.get("name")
+        if epic:
+            epics.add(epic)
     
-    if response.status_code >= 200 and response.status_code < 300:
-        results = response.json().get("results", [])
-        epics = set()
-        
-        for page in results:
-            if "Select" in page["properties"] and page["properties"]["Select"].get("select"):
-                epic = page["properties"]["Select"]["select"].get("name")
-                if epic:
-                    epics.add(epic)
-        
-        return list(epics)
-    
-    return []
+    return list(epics)
 
 def get_epic_colors():
     """Get all colors used by existing epics"""
-    notion_api_key = os.getenv("NOTION_API_KEY")
-    notion_database_id = os.getenv("NOTION_DATABASE_ID")
-    
-    headers = {
-        "Authorization": f"Bearer {notion_api_key}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
-    
-    url = f"https://api.notion.com/v1/databases/{notion_database_id}/query"
+    snapshot = get_board_snapshot()
+    mirror = snapshot.mirror()
+    if mirror is not None:
+        snapshot.ensure_current()
+        return mirror.epic_colors()
     
-    response = requests.post(url, headers=headers, json={})
+    used_colors = set()
     
-    if response.status_code >= 200 and response.status_code < 300:
-        results = response.json().get("results", [])
-        used_colors = set()
-        
-        for page in results:
-            if "Select" in page["properties"] and page["properties"]["Select"].get("select"):
-                color = page["properties"]["Select"]["select"].get("color")
-                if color:
-                    used_colors.add(color)
-        
-        return list(used_colors)
+    for select in _iter_epic_selects():
+        color = select.get("color")
+        if color:
+            used_colors.add(color)
     
-    return []
+    return list(used_colors)
 
 def get_unique_color(used_colors):
     """Get a unique color not used by existing epics"""
@@ -163,14 +998,6 @@ def get_unique_color(used_colors):
 
 def assign_epic_to_task(task_name, epic_name):
     """Assign an existing epic to a task"""
-    notion_api_key = os.getenv("NOTION_API_KEY")
-    
-    headers = {
-        "Authorization": f"Bearer {notion_api_key}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
-    
     # Find the task by name
     page_id = find_task_by_name(task_name)
     
@@ -178,21 +1005,12 @@ def assign_epic_to_task(task_name, epic_name):
         print(f"❌ Task not found: {task_name}")
         return False
     
-    url = f"https://api.notion.com/v1/pages/{page_id}"
-    
-    data = {
-        "properties": {
-            "Select": {
-                "select": {
-                    "name": epic_name
-                }
-            }
-        }
-    }
+    data = {"properties": build_epic_properties(epic_name)}
     
-    response = requests.patch(url, headers=headers, json=data)
+    response = get_client().patch(f"pages/{page_id}", json=data)
     
     if response.status_code >= 200 and response.status_code < 300:
+        get_board_snapshot().upsert(response.json())
         print(f"✅ Assigned epic '{epic_name}' to task: {task_name}")
         return True
     else:
@@ -201,14 +1019,6 @@ def assign_epic_to_task(task_name, epic_name):
 
 def create_epic_for_task(task_name, epic_name):
     """Create a new epic and assign it to a task"""
-    notion_api_key = os.getenv("NOTION_API_KEY")
-    
-    headers = {
-        "Authorization": f"Bearer {notion_api_key}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
-    
     # Find the task by name
     page_id = find_task_by_name(task_name)
     
@@ -220,8 +1030,6 @@ def create_epic_for_task(task_name, epic_name):
     used_colors = get_epic_colors()
     unique_color = get_unique_color(used_colors)
     
-    url = f"https://api.notion.com/v1/pages/{page_id}"
-    
     data = {
         "properties": {
             "Select": {
@@ -233,98 +1041,777 @@ def create_epic_for_task(task_name, epic_name):
         }
     }
     
-    response = requests.patch(url, headers=headers, json=data)
+    response = get_client().patch(f"pages/{page_id}", json=data)
     
     if response.status_code >= 200 and response.status_code < 300:
+        get_board_snapshot().upsert(response.json())
         print(f"✅ Created new epic '{epic_name}' with color '{unique_color}' and assigned to task: {task_name}")
         return True
     else:
         print(f"❌ Failed to create epic: {response.text}")
         return False
 
-def handle_task_operations(operations):
-    """Process a list of task operations"""
-    results = []
+NOTION_MAX_WORKERS = 4
+
+def _order_operations(operations):
+    """Return operation indices in execution order: create_epic first, then create, then the rest"""
+    order = [i for i, op in enumerate(operations) if op.get("operation") == "create_epic"]
+    order += [i for i, op in enumerate(operations) if op.get("operation") == "create"]
+    order += [i for i, op in enumerate(operations) if op.get("operation") not in ["create_epic", "create"]]
+    return order
+
+def _operation_resources(op, lookup):
+    """
+    Return the board resources an operation touches.
+    
+    Returns:
+        dict: resource key -> "r" or "w". Task names are keyed both by normalized
+        name and, when they already resolve, by page ID, so fuzzy references to
+        the same page are ordered too.
+    """
+    operation_type = op.get("operation")
+    resources = {}
+    
+    if operation_type == "create_epic":
+        # Every new epic rewrites the same select-options list
+        resources["schema"] = "w"
+        if op.get("epic"):
+            resources[f"epic:{normalize_title(op['epic'])}"] = "w"
+        return resources
+    
+    names = [op.get("old_name"), op.get("new_name")] if operation_type == "rename" else [op.get("task")]
+    for name in names:
+        if not name:
+            continue
+        resources[f"task:{normalize_title(name)}"] = "w"
+        page_id, _ = lookup(name)
+        if page_id:
+            resources[page_id] = "w"
+    
+    if op.get("epic"):
+        resources.setdefault(f"epic:{normalize_title(op['epic'])}", "r")
+    
+    return resources
+
+def _build_dependencies(operations, order, lookup=None):
+    """
+    Build the dependency graph for a batch of operations.
+    
+    An operation depends on every earlier operation (in execution order) that
+    touches one of its resources, unless both only read it. `lookup` resolves a
+    task name to (page_id, score) and defaults to find_task_match.
+    
+    Returns:
+        dict: operation index -> set of indices it must wait for.
+    """
+    group_dependencies = _build_group_dependencies(operations, [[i] for i in order], lookup)
+    return {order[g]: {order[h] for h in deps} for g, deps in group_dependencies.items()}
+
+def _build_group_dependencies(operations, groups, lookup=None):
+    """
+    Build the dependency graph between groups of operations that run as one unit.
+    
+    Args:
+        operations (list): The operations.
+        groups (list): Lists of operation indices, in execution order.
+        lookup (callable): Resolves a task name to (page_id, score).
+    
+    Returns:
+        dict: group position -> set of group positions it must wait for.
+    """
+    lookup = lookup or find_task_match
+    resources = []
+    for group in groups:
+        merged = {}
+        for i in group:
+            for key, mode in _operation_resources(operations[i], lookup).items():
+                if merged.get(key) != "w":
+                    merged[key] = mode
+        resources.append(merged)
+    
+    dependencies = {g: set() for g in range(len(groups))}
+    for g in range(len(groups)):
+        for h in range(g):
+            for key, mode in resources[g].items():
+                other = resources[h].get(key)
+                if other and "w" in (mode, other):
+                    dependencies[g].add(h)
+                    break
+    
+    return dependencies
+
+COALESCABLE_OPERATIONS = ("update", "assign_epic", "rename")
+
+def _coalesce_page_writes(operations, order, lookup=None):
+    """
+    Group the property writes that target the same existing page.
+    
+    Walking operations in execution order, every update, assign_epic and rename
+    that resolves to a page joins that page's open group. Any other operation
+    on the page (delete, comment, ...) closes the group, so later writes start
+    a new one and op-order semantics are kept. Names introduced by a rename
+    earlier in the batch resolve to the renamed page.
+    
+    Returns:
+        list: (page_id, operation indices) tuples in execution order; page_id is
+        None for operations that run on their own.
+    """
+    lookup = lookup or find_task_match
+    groups = []
+    open_groups = {}  # page ID -> index list still accepting writes
+    renamed = {}  # normalized new name -> page ID
+    
+    for i in order:
+        op = operations[i]
+        operation_type = op.get("operation")
+        name = op.get("old_name") if operation_type == "rename" else op.get("task")
+        
+        page_id = renamed.get(normalize_title(name)) if name else None
+        if page_id is None and name:
+            page_id, _ = lookup(name)
+        
+        if operation_type in COALESCABLE_OPERATIONS and page_id:
+            if page_id in open_groups:
+                open_groups[page_id].append(i)
+            else:
+                open_groups[page_id] = [i]
+                groups.append((page_id, open_groups[page_id]))
+            if operation_type == "rename" and op.get("new_name"):
+                renamed[normalize_title(op["new_name"])] = page_id
+        else:
+            groups.append((None, [i]))
+            if page_id:
+                open_groups.pop(page_id, None)
     
-    # Reorder operations: create_epic first, then create tasks, then other operations
-    reordered_operations = []
+    return groups
+
+def _execute_operation(op):
+    """Run a single task operation and return its result entry"""
+    operation_type = op.get('operation')
+    result = {"operation": operation_type, "success": False}
+    
+    try:
+        with get_client().operation_deadline():
+            _dispatch_operation(op, result)
+    except Exception as e:
+        print(f"❌ Error processing operation {operation_type}: {str(e)}")
+        result['error'] = str(e)
+    
+    return result
+
+def _dispatch_operation(op, result):
+    """Call the handler for an operation and fill in its result entry"""
+    operation_type = op.get('operation')
     
-    # First, add all create_epic operations
-    for op in operations:
-        if op.get("operation") == "create_epic":
-            reordered_operations.append(op)
+    if operation_type == 'create':
+        result['success'] = create_task(op)
+        result['task'] = op.get('task')
     
-    # Then, add all create operations
-    for op in operations:
-        if op.get("operation") == "create":
-            reordered_operations.append(op)
+    elif operation_type == 'update':
+        result['success'] = update_task(op)
+        result['task'] = op.get('task')
     
-    # Finally, add all other operations
-    for op in operations:
-        if op.get("operation") not in ["create_epic", "create"]:
-            reordered_operations.append(op)
+    elif operation_type == 'delete':
+        result['success'] = delete_task(op)
+        result['task'] = op.get('task')
     
-    for op in reordered_operations:
-        operation_type = op.get('operation')
-        result = {"operation": operation_type, "success": False}
-        
-        try:
-            if operation_type == 'create':
-                result['success'] = create_task(op)
-                result['task'] = op.get('task')
-            
-            elif operation_type == 'update':
-                result['success'] = update_task(op)
-                result['task'] = op.get('task')
-            
-            elif operation_type == 'delete':
-                result['success'] = delete_task(op)
-                result['task'] = op.get('task')
-            
-            elif operation_type == 'rename':
-                result['success'] = rename_task(op)
-                result['old_name'] = op.get('old_name')
-                result['new_name'] = op.get('new_name')
-            
-            elif operation_type == 'comment':
-                result['success'] = add_comment(op)
-                result['task'] = op.get('task')
-            
-            elif operation_type == 'create_epic':
-                result['success'] = create_epic(op)
-                result['epic'] = op.get('epic')
-            
-            elif operation_type == 'assign_epic':
-                result['success'] = assign_epic_to_task(op.get('task'), op.get('epic'))
-                result['task'] = op.get('task')
-                result['epic'] = op.get('epic')
-            
-            else:
-                print(f"❌ Unknown operation type: {operation_type}")
-        
-        except Exception as e:
-            print(f"❌ Error processing operation {operation_type}: {str(e)}")
+    elif operation_type == 'rename':
+        result['success'] = rename_task(op)
+        result['old_name'] = op.get('old_name')
+        result['new_name'] = op.get('new_name')
+    
+    elif operation_type == 'comment':
+        result['success'] = add_comment(op)
+        result['task'] = op.get('task')
+    
+    elif operation_type == 'create_epic':
+        result['success'] = create_epic(op)
+        result['epic'] = op.get('epic')
+    
+    elif operation_type == 'assign_epic':
+        result['success'] = assign_epic_to_task(op.get('task'), op.get('epic'))
+        result['task'] = op.get('task')
+        result['epic'] = op.get('epic')
+    
+    else:
+        print(f"❌ Unknown operation type: {operation_type}")
+
+
+def handle_task_operations(operations, max_workers=NOTION_MAX_WORKERS, plan_only=False):
+    """
+    Process a list of task operations.
+    
+    Runs in two phases. plan_task_operations first resolves every task name,
+    assignee, epic and schema property against one snapshot and turns the batch
+    into an execution plan: all create_epic operations become one schema PATCH,
+    property writes to the same page are merged, and each request waits only for
+    the earlier ones touching the same task. execute_plan then sends those
+    requests on up to max_workers threads without any further lookups.
+    
+    When NOTION_JOURNAL_PATH is set, every operation is journaled before it
+    runs. Operations left unfinished by a previous process are reconciled and
+    resumed first, and operations whose request raised are checked against the
+    board before being retried, so nothing is applied twice.
+    
+    Args:
+        operations (list): The task operations.
+        max_workers (int): Maximum number of requests in flight.
+        plan_only (bool): Print the plan and return without sending any writes.
+    
+    Returns:
+        list: One result dict per operation, in input order ([] with plan_only).
+    """
+    if not operations:
+        return []
+    
+    journal = None if plan_only else get_journal()
+    if journal is not None:
+        recover_operations(max_workers=max_workers)
+    
+    plan = plan_task_operations(operations, max_workers=max_workers)
+    if plan_only:
+        print(format_execution_plan(plan))
+        return []
+    
+    if journal is None:
+        return execute_plan(plan, max_workers=max_workers)
+    
+    keys = journal.record_intents(operations, plan["page_ids"])
+    
+    def record(i, result, page_id):
+        _record_outcome(journal, keys[i], result, page_id or plan["page_ids"][i])
+    
+    results = execute_plan(plan, max_workers=max_workers, on_result=record)
+    
+    # A request that raised may still have been applied; check the board before retrying it
+    unknown = {keys[i]: i for i, result in enumerate(results) if result.get('error')}
+    if unknown:
+        replayed = _reconcile_operations(journal, journal.pending(keys=set(unknown)), max_workers)
+        for key, result in replayed.items():
+            results[unknown[key]] = result
+    
+    return results
+
+_journals = {}
+_journals_lock = threading.Lock()
+_recovered_journals = set()
+
+def get_journal():
+    """Return the operation journal, or None if NOTION_JOURNAL_PATH is unset"""
+    path = os.getenv("NOTION_JOURNAL_PATH")
+    if not path:
+        return None
+    with _journals_lock:
+        if path not in _journals:
+            from api.operation_journal import OperationJournal
+            _journals[path] = OperationJournal(path)
+        return _journals[path]
+
+def _record_outcome(journal, key, result, page_id=None):
+    """Append an operation's outcome to the journal"""
+    if result.get('success'):
+        status = "done"
+    elif result.get('error'):
+        status = "unknown"
+    else:
+        status = "failed"
+    
+    journal.record_outcome(key, status, page_id=page_id, error=result.get('error'))
+
+def _comment_exists(page_id, text, since):
+    """Check whether a page already has a comment with this text created at or after since"""
+    response = get_client().get("comments", params={"block_id": page_id, "page_size": 100})
+    if response.status_code != 200:
+        return False
+    for comment in response.json().get("results", []):
+        body = "".join(part.get("plain_text") or part.get("text", {}).get("content", "")
+                       for part in comment.get("rich_text", []))
+        if body == text and comment.get("created_time", "")[:16] >= since:
+            return True
+    return False
+
+def _operation_applied(intent):
+    """
+    Check a journaled operation against the board.
+    
+    Returns:
+        tuple: (applied, page_id). update and assign_epic only set properties, so
+        they are never reported as applied and are simply run again.
+    """
+    op = intent["op"]
+    operation_type = op.get('operation')
+    page_id = intent.get("page_id")
+    snapshot = get_board_snapshot()
+    # Notion timestamps are minute precision; allow for a little clock skew as well
+    started = datetime.fromisoformat(intent["at"]) - timedelta(minutes=2)
+    since = started.strftime("%Y-%m-%dT%H:%M")
+    
+    if operation_type == 'create':
+        title = normalize_title(op.get('task', ''))
+        for page in snapshot.pages():
+            if normalize_title(get_task_title(page)) == title and page.get("created_time", "")[:16] >= since:
+                return True, page["id"]
+        return False, None
+    
+    if operation_type == 'rename':
+        page = snapshot.get(page_id) if page_id else None
+        applied = page is not None and normalize_title(get_task_title(page)) == normalize_title(op.get('new_name', ''))
+        return applied, page_id
+    
+    if operation_type == 'delete':
+        # Delta syncs never return archived pages, so ask for the page itself
+        if not page_id:
+            return False, page_id
+        response = get_client().get(f"pages/{page_id}")
+        if response.status_code != 200 or not response.json().get("archived"):
+            return False, page_id
+        snapshot.remove(page_id)
+        return True, page_id
+    
+    if operation_type == 'comment':
+        return bool(page_id) and _comment_exists(page_id, op.get('comment', ''), since), page_id
+    
+    if operation_type == 'create_epic':
+        existing = {epic.lower().strip() for epic in get_database_schema().select_options()}
+        return title_case_epic(op.get('epic') or '').lower().strip() in existing, None
+    
+    return False, page_id
+
+def _reconcile_operations(journal, pending, max_workers=NOTION_MAX_WORKERS):
+    """
+    Resolve journaled operations whose outcome is missing or unknown.
+    
+    The board is synced once for the whole batch, so creates and renames made by
+    lost requests are visible without a full reload; archives are checked page by
+    page. Operations already applied are marked done; the rest are run again.
+    
+    Returns:
+        dict: idempotency key -> result entry.
+    """
+    get_board_snapshot().sync()
+    if any(intent["op"].get('operation') == 'create_epic' for intent in pending):
+        get_database_schema().invalidate()
+    
+    results = {}
+    replay = []
+    for intent in pending:
+        applied, page_id = _operation_applied(intent)
+        if applied:
+            op = intent["op"]
+            print(f"✓ Already applied, not repeating: {op.get('operation')} "
+                  f"{op.get('task') or op.get('old_name') or op.get('epic')}")
+            journal.record_outcome(intent["key"], "done", page_id=page_id)
+            result = _new_result(op)
+            result['success'] = True
+            results[intent["key"]] = result
+        else:
+            replay.append(intent)
+    
+    if replay:
+        def record(i, result, page_id):
+            _record_outcome(journal, replay[i]["key"], result, page_id or replay[i].get("page_id"))
         
-        results.append(result)
+        plan = plan_task_operations([intent["op"] for intent in replay], max_workers=max_workers)
+        replayed = execute_plan(plan, max_workers=max_workers, on_result=record)
+        results.update(zip([intent["key"] for intent in replay], replayed))
     
     return results
 
-def create_task(task_data):
-    """Create a new task in Notion"""
-    notion_api_key = os.getenv("NOTION_API_KEY")
-    notion_database_id = os.getenv("NOTION_DATABASE_ID")
+def recover_operations(max_workers=NOTION_MAX_WORKERS):
+    """
+    Reconcile and resume the operations a previous process left unfinished.
+    
+    Runs once per journal per process; handle_task_operations calls it first.
     
-    headers = {
-        "Authorization": f"Bearer {notion_api_key}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
+    Returns:
+        list: Result entries for the recovered operations.
+    """
+    journal = get_journal()
+    if journal is None:
+        return []
+    
+    with _journals_lock:
+        if journal.path in _recovered_journals:
+            return []
+        _recovered_journals.add(journal.path)
+    
+    pending = journal.pending()
+    results = {}
+    if pending:
+        print(f"🔁 Reconciling {len(pending)} unfinished operations from {journal.path}")
+        results = _reconcile_operations(journal, pending, max_workers)
+    journal.compact()
+    
+    return list(results.values())
+
+def _new_result(op):
+    """Return an unsuccessful result entry with the keys reported for the operation type"""
+    operation_type = op.get('operation')
+    result = {"operation": operation_type, "success": False}
+    if operation_type == 'create_epic':
+        result['epic'] = op.get('epic')
+        return result
+    if operation_type == 'rename':
+        result['old_name'] = op.get('old_name')
+        result['new_name'] = op.get('new_name')
+    else:
+        result['task'] = op.get('task')
+    if operation_type == 'assign_epic':
+        result['epic'] = op.get('epic')
+    return result
+
+def _operation_properties(op):
+    """Return the page properties an update, assign_epic or rename operation sets"""
+    operation_type = op.get('operation')
+    
+    if operation_type == 'rename':
+        return build_rename_properties(op.get('new_name', 'Untitled Task'))
+    
+    if operation_type == 'assign_epic':
+        return build_epic_properties(op.get('epic'))
+    
+    return _resolve_update_properties(op)
+
+NOTION_DEFAULT_LATENCY = 0.4  # seconds per request, used until the client has measured some
+
+def _describe_operation(op):
+    """Return a one-line description of an operation for plans and progress output"""
+    operation_type = op.get('operation')
+    if operation_type == 'create':
+        return f"Create task: {op.get('task')}"
+    if operation_type == 'update':
+        return f"Update task: {op.get('task')}"
+    if operation_type == 'delete':
+        return f"Archive task: {op.get('task')}"
+    if operation_type == 'rename':
+        return f"Rename task: {op.get('old_name')} → {op.get('new_name')}"
+    if operation_type == 'comment':
+        return f"Comment on task: {op.get('task')}"
+    if operation_type == 'assign_epic':
+        return f"Assign epic '{op.get('epic')}' to task: {op.get('task')}"
+    if operation_type == 'create_epic':
+        return f"Create epic: {op.get('epic')}"
+    return f"{operation_type}"
+
+def _created_page_placeholder(index):
+    """Return the stand-in used for the ID of the page operation `index` will create"""
+    return f"{{created:{index}}}"
+
+def _fill_placeholders(value, created):
+    """Replace created-page placeholders in a request path or body; raises KeyError if one is missing"""
+    if isinstance(value, str):
+        match = re.fullmatch(r"(.*)\{created:(\d+)\}(.*)", value)
+        if match:
+            return match.group(1) + created[int(match.group(2))] + match.group(3)
+        return value
+    if isinstance(value, dict):
+        return {key: _fill_placeholders(item, created) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_fill_placeholders(item, created) for item in value]
+    return value
+
+def _plan_epics(plan, operations, epic_indices, database_id):
+    """Add the single schema PATCH that creates every new epic in the batch"""
+    schema = get_database_schema()
+    database = schema.get(database_id)
+    existing = (schema.select_options(database_id) if database else []) + fetch_epics()
+    results, pending = plan_epic_creation([operations[i] for i in epic_indices], existing)
+    
+    pending_results = {id(result) for entries in pending.values() for result in entries}
+    pending_indices = []
+    for i, result in zip(epic_indices, results):
+        if result['success']:
+            plan["satisfied"][i] = result
+        elif id(result) in pending_results:
+            pending_indices.append(i)
+        else:
+            plan["errors"][i] = "No epic name provided"
+    
+    if not pending:
+        return None
+    
+    body = build_epic_schema_update(database, list(pending)) if database else None
+    if body is None:
+        reason = "No select property found in database schema" if database else "Failed to get database schema"
+        print(f"❌ {reason}")
+        for i in pending_indices:
+            plan["errors"][i] = reason
+        return None
+    
+    return _add_step(plan, "PATCH", f"databases/{database_id}", body, pending_indices, kind="schema")
+
+def _add_step(plan, method, path, body, indices, kind="page", creates=None, depends_on=()):
+    """Append one HTTP call to a plan and return its step number"""
+    step = {
+        "id": len(plan["steps"]),
+        "method": method,
+        "path": path,
+        "body": body,
+        "operations": list(indices),
+        "kind": kind,
+        "creates": creates,
+        "depends_on": sorted(set(depends_on))
     }
+    plan["steps"].append(step)
+    return step["id"]
+
+def _plan_group(plan, operations, page_id, indices, lookup, database_id):
+    """Turn one coalesced group of operations into a plan step, or record why it can't run"""
+    op = operations[indices[0]]
+    operation_type = op.get('operation')
+    
+    if page_id is not None:
+        # update / assign_epic / rename on one page: a single PATCH with merged properties
+        properties = {}
+        for i in indices:
+            properties.update(_operation_properties(operations[i]))
+        return _add_step(plan, "PATCH", f"pages/{page_id}", {"properties": properties}, indices)
+    
+    if operation_type == 'create':
+        user_id = None
+        if op.get('assignee'):
+            user_id = get_users_directory().resolve(op['assignee'])
+            if not user_id:
+                print(f"⚠️ User not found: {op['assignee']}")
+        body = build_new_task_data(op, database_id, user_id)
+        return _add_step(plan, "POST", "pages", body, indices, creates=indices[0])
+    
+    if operation_type not in ('update', 'assign_epic', 'rename', 'delete', 'comment'):
+        print(f"❌ Unknown operation type: {operation_type}")
+        plan["errors"][indices[0]] = f"Unknown operation type: {operation_type}"
+        return None
+    
+    name = op.get('old_name') if operation_type == 'rename' else op.get('task')
+    # Property writes only get here when their page didn't resolve
+    target = lookup(name)[0] if name and operation_type in ('delete', 'comment') else None
+    if not target:
+        print(f"❌ Task not found: {name}")
+        plan["errors"][indices[0]] = f"Task not found: {name}"
+        return None
+    
+    if operation_type == 'delete':
+        return _add_step(plan, "PATCH", f"pages/{target}", {"archived": True}, indices)
+    
+    body = {
+        "parent": {"page_id": target},
+        "rich_text": [{"type": "text", "text": {"content": op.get('comment', '')}}]
+    }
+    return _add_step(plan, "POST", "comments", body, indices, kind="comment")
+
+def plan_task_operations(operations, max_workers=NOTION_MAX_WORKERS):
+    """
+    Resolve a batch of operations into an execution plan.
+    
+    Task names, assignees, epics and schema properties are all resolved here,
+    against one board snapshot, the users directory and the schema cache. Pages
+    created earlier in the batch are referred to by placeholders that
+    execute_plan fills in. Nothing is written.
+    
+    Returns:
+        dict: 'operations'; 'steps' (HTTP calls with method, path, body, the
+        operation indices they serve and the steps they depend on); 'errors' and
+        'satisfied' (operation index -> reason / result for operations that need
+        no call); 'page_ids' (the page each operation resolved to); and
+        'estimate' (call count, critical path and seconds).
+    """
+    database_id = os.getenv("NOTION_DATABASE_ID")
+    plan = {"operations": operations, "steps": [], "errors": {}, "satisfied": {}, "page_ids": [None] * len(operations)}
+    
+    epic_indices = [i for i, op in enumerate(operations) if op.get("operation") == "create_epic"]
+    epic_step = _plan_epics(plan, operations, epic_indices, database_id) if epic_indices else None
+    new_epics = set()
+    if epic_step is not None:
+        new_epics = {normalize_title(operations[i].get('epic') or '') for i in plan["steps"][epic_step]["operations"]}
+    
+    index = get_board_snapshot().title_index()
+    created = {}  # normalized name -> index of the create operation
+    for i, op in enumerate(operations):
+        if op.get("operation") == "create" and op.get("task"):
+            created.setdefault(normalize_title(op["task"]), i)
+    
+    renamed = {}  # normalized new name -> page (or placeholder) renamed earlier in the batch
+    
+    def lookup(name):
+        key = normalize_title(name)
+        if key in renamed:
+            return renamed[key], 1.0
+        page_id, score = index.lookup(name)
+        if key in created and (page_id is None or score < 1.0):
+            return _created_page_placeholder(created[key]), 1.0
+        return page_id, score
+    
+    epic_set = set(epic_indices)
+    order = [i for i in _order_operations(operations) if i not in epic_set]
+    # Resolve rename chains up front so every later lookup (comment, delete, ...) sees the new names
+    for i in order:
+        op = operations[i]
+        if op.get("operation") == "rename" and op.get("old_name") and op.get("new_name"):
+            page_id, _ = lookup(op["old_name"])
+            if page_id:
+                renamed[normalize_title(op["new_name"])] = page_id
+    groups = _coalesce_page_writes(operations, order, lookup=lookup)
+    group_dependencies = _build_group_dependencies(operations, [indices for _, indices in groups], lookup=lookup)
+    
+    group_steps = {}
+    for position, (page_id, indices) in enumerate(groups):
+        for i in indices:
+            op = operations[i]
+            name = op.get('old_name') if op.get('operation') == 'rename' else op.get('task')
+            resolved = page_id or (lookup(name)[0] if name and op.get('operation') != 'create' else None)
+            if resolved and not resolved.startswith("{"):
+                plan["page_ids"][i] = resolved
+        
+        step_id = _plan_group(plan, operations, page_id, indices, lookup, database_id)
+        if step_id is None:
+            continue
+        group_steps[position] = step_id
+        
+        step = plan["steps"][step_id]
+        depends_on = {group_steps[g] for g in group_dependencies[position] if g in group_steps}
+        if epic_step is not None and any(
+            normalize_title(operations[i].get('epic') or '') in new_epics for i in indices
+        ):
+            depends_on.add(epic_step)
+        step["depends_on"] = sorted(depends_on)
+    
+    plan["estimate"] = _estimate_plan(plan["steps"], max_workers)
+    return plan
+
+def _estimate_plan(steps, max_workers=NOTION_MAX_WORKERS):
+    """Estimate the calls and wall time a plan needs from the measured latency and the rate limit"""
+    client = get_client()
+    stats = client.get_stats()
+    measured = sum(entry["total_time"] for entry in stats.values())
+    count = sum(entry["count"] for entry in stats.values())
+    latency = measured / count if count else NOTION_DEFAULT_LATENCY
+    
+    depth = {}
+    for step in steps:
+        depth[step["id"]] = 1 + max((depth[d] for d in step["depends_on"]), default=0)
+    critical_path = max(depth.values(), default=0)
+    
+    calls = len(steps)
+    seconds = max(
+        critical_path * latency,
+        calls * latency / max(1, max_workers),
+        calls / client.rate_limiter.rate
+    ) if calls else 0.0
+    
+    return {"calls": calls, "critical_path": critical_path, "latency": latency, "seconds": seconds}
+
+def format_execution_plan(plan):
+    """Format an execution plan for display"""
+    text = "\n\n=== Execution Plan ===\n"
+    operations = plan["operations"]
+    creating_step = {step["creates"]: step["id"] for step in plan["steps"] if step["creates"] is not None}
+    
+    def show(value):
+        return re.sub(r"\{created:(\d+)\}", lambda m: f"<page from step {creating_step[int(m.group(1))] + 1}>", value)
+    
+    for step in plan["steps"]:
+        after = f" (after {', '.join(str(d + 1) for d in step['depends_on'])})" if step["depends_on"] else ""
+        text += f"{step['id'] + 1}. {step['method']} /v1/{show(step['path'])}{after}\n"
+        for i in step["operations"]:
+            text += f"     {_describe_operation(operations[i])}\n"
+        text += f"     {show(json.dumps(step['body'], ensure_ascii=False))}\n"
+    
+    for i, result in sorted(plan["satisfied"].items()):
+        text += f"ℹ️ No call needed: {_describe_operation(operations[i])}\n"
+    for i, reason in sorted(plan["errors"].items()):
+        text += f"❌ Will fail: {_describe_operation(operations[i])} - {reason}\n"
+    
+    estimate = plan["estimate"]
+    text += (f"\nEstimated: {estimate['calls']} calls, critical path {estimate['critical_path']}, "
+             f"~{estimate['seconds']:.1f}s at {estimate['latency']:.2f}s per call\n")
+    return text
+
+def execute_plan(plan, max_workers=NOTION_MAX_WORKERS, on_result=None):
+    """
+    Send the HTTP calls of a plan from plan_task_operations.
+    
+    Each step starts once the steps it depends on have finished; no names,
+    users or schemas are looked up. If Notion rejects a merged page write with
+    a 400, its operations are retried one by one.
+    
+    Args:
+        plan (dict): The plan.
+        max_workers (int): Maximum number of requests in flight.
+        on_result (callable): Called as on_result(index, result, page_id) when an operation finishes.
+    
+    Returns:
+        list: One result dict per operation, in input order.
+    """
+    operations = plan["operations"]
+    results = [None] * len(operations)
+    created = {}  # create operation index -> new page ID
+    
+    def finish(i, result, page_id=None):
+        results[i] = result
+        if on_result:
+            on_result(i, result, page_id)
+    
+    for i, result in plan["satisfied"].items():
+        finish(i, result)
+    for i in plan["errors"]:
+        finish(i, _new_result(operations[i]))
+    
+    def run_step(step):
+        entries = [_new_result(operations[i]) for i in step["operations"]]
+        page_id = None
+        
+        try:
+            with get_client().operation_deadline():
+                path = _fill_placeholders(step["path"], created)
+                body = _fill_placeholders(step["body"], created)
+                response = get_client().request(step["method"], path, json=body)
+        except KeyError:
+            print(f"❌ Skipped {step['method']} /v1/{step['path']}: the task it needs was not created")
+            response = None
+        except Exception as e:
+            print(f"❌ Error processing operation {entries[0]['operation']}: {str(e)}")
+            for result in entries:
+                result['error'] = str(e)
+            response = None
+        
+        if response is not None and response.status_code >= 200 and response.status_code < 300:
+            try:
+                data = response.json()
+                if step["kind"] == "schema":
+                    get_database_schema().store(os.getenv("NOTION_DATABASE_ID"), data)
+                elif data.get("object") == "page":
+                    get_board_snapshot().upsert(data)
+                    page_id = data.get("id")
+                if step["creates"] is not None:
+                    created[step["creates"]] = data["id"]
+            except Exception as e:
+                print(f"❌ Unreadable response to {step['method']} /v1/{path}: {str(e)}")
+                for result in entries:
+                    result['error'] = str(e)
+                page_id = None
+            else:
+                for i, result in zip(step["operations"], entries):
+                    result['success'] = True
+                    print(f"✅ {_describe_operation(operations[i])}")
+        elif response is not None and response.status_code == 400 and len(step["operations"]) > 1:
+            print(f"⚠️ Combined request rejected, applying {len(step['operations'])} operations separately: "
+                  f"{response.text}")
+            entries = [_execute_operation(operations[i]) for i in step["operations"]]
+        elif response is not None:
+            print(f"❌ Failed: {step['method']} /v1/{path}: {response.text}")
+        
+        for i, result in zip(step["operations"], entries):
+            finish(i, result, page_id)
     
-    url = "https://api.notion.com/v1/pages"
+    steps = plan["steps"]
+    dependencies = {step["id"]: set(step["depends_on"]) for step in steps}
+    run_with_dependencies(steps, dependencies, run_step, max_workers=max_workers)
     
-    # Prepare the request data
+    return results
+
+def build_new_task_data(task_data, database_id, user_id=None):
+    """Build the request body for creating a task page"""
     data = {
-        "parent": {"database_id": notion_database_id},
+        "parent": {"database_id": database_id},
         "properties": {
             "Name": {
                 "title": [{"text": {"content": task_data.get('task', 'Untitled Task')}}]
@@ -342,46 +1829,149 @@ def create_task(task_data):
         }
     
     # Add assignee if provided and user exists
+    if user_id:
+        data["properties"]["Assign"] = {
+            "people": [{"id": user_id}]
+        }
+    
+    return data
+
+def create_task(task_data):
+    """Create a new task in Notion"""
+    notion_database_id = os.getenv("NOTION_DATABASE_ID")
+    
+    user_id = None
     if 'assignee' in task_data and task_data['assignee']:
-        users = fetch_users()
-        user_id = users.get(task_data['assignee'])
-        if user_id:
-            data["properties"]["Assign"] = {
-                "people": [{"id": user_id}]
-            }
-        else:
+        user_id = get_users_directory().resolve(task_data['assignee'])
+        if not user_id:
             print(f"⚠️ User not found: {task_data['assignee']}")
     
-    response = requests.post(url, headers=headers, json=data)
+    # Prepare the request data
+    data = build_new_task_data(task_data, notion_database_id, user_id)
+    
+    response = get_client().post("pages", json=data)
     
     if response.status_code >= 200 and response.status_code < 300:
+        get_board_snapshot().upsert(response.json())
         print(f"✅ Created task: {task_data.get('task')}")
         return True
     else:
         print(f"❌ Failed to create task: {response.text}")
         return False
 
-def update_task(task_data):
-    """Update an existing task in Notion"""
-    notion_api_key = os.getenv("NOTION_API_KEY")
+NOTION_BULK_MAX_WORKERS = 8
+BULK_PROGRESS_INTERVAL = 25  # tasks between progress lines
+
+def _resolve_bulk_epics(epic_names):
+    """Create any missing epics with one schema PATCH and map each name to its canonical spelling"""
+    if not epic_names:
+        return {}
     
-    headers = {
-        "Authorization": f"Bearer {notion_api_key}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
+    create_epics([{"operation": "create_epic", "epic": name} for name in epic_names])
+    known = {}
+    for epic in get_database_schema().select_options() + fetch_epics():
+        known.setdefault(epic.lower().strip(), epic)
+    return {name: known.get(title_case_epic(name).lower().strip()) for name in epic_names}
+
+def _create_bulk_task(index, data, task_data):
+    """POST one prepared task page and return its result entry"""
+    result = {"operation": "create", "success": False, "task": task_data.get('task'), "index": index}
     
-    # First, find the task by name
-    task_name = task_data.get('task')
-    page_id = find_task_by_name(task_name)
+    try:
+        with get_client().operation_deadline():
+            response = get_client().post("pages", json=data)
+    except Exception as e:
+        result['error'] = str(e)
+        return result
     
-    if not page_id:
-        print(f"❌ Task not found: {task_name}")
-        return False
+    if response.status_code >= 200 and response.status_code < 300:
+        page = response.json()
+        get_board_snapshot().upsert(page)
+        result['success'] = True
+        result['page_id'] = page.get("id")
+    else:
+        result['error'] = response.text
+    
+    return result
+
+def iter_bulk_create_tasks(tasks, max_workers=NOTION_BULK_MAX_WORKERS):
+    """
+    Create many tasks concurrently, yielding each result as it completes.
     
-    url = f"https://api.notion.com/v1/pages/{page_id}"
+    Assignees are resolved once per distinct name and all missing epics are
+    created with a single schema PATCH before any page is written. Pages are
+    then posted on up to max_workers threads, all sharing the client's rate limiter.
     
-    # Prepare properties to update
+    Args:
+        tasks (iterable): Task dicts as accepted by create_task, optionally with an 'epic'.
+        max_workers (int): Maximum number of creates in flight.
+    
+    Yields:
+        dict: A create result entry with the task's input 'index' and, on success, its 'page_id'.
+    """
+    notion_database_id = os.getenv("NOTION_DATABASE_ID")
+    tasks = list(tasks)
+    if not tasks:
+        return
+    
+    directory = get_users_directory()
+    user_ids = {}
+    for name in {task.get('assignee') for task in tasks if task.get('assignee')}:
+        user_ids[name] = directory.resolve(name)
+        if not user_ids[name]:
+            print(f"⚠️ User not found: {name}")
+    
+    epics = _resolve_bulk_epics(sorted({task['epic'] for task in tasks if task.get('epic')}))
+    
+    started = time.monotonic()
+    created = 0
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = []
+        for index, task_data in enumerate(tasks):
+            data = build_new_task_data(task_data, notion_database_id, user_ids.get(task_data.get('assignee')))
+            if epics.get(task_data.get('epic')):
+                data["properties"].update(build_epic_properties(epics[task_data['epic']]))
+            futures.append(pool.submit(_create_bulk_task, index, data, task_data))
+        
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            if result['success']:
+                created += 1
+            else:
+                print(f"❌ Failed to create task {result['task']}: {result.get('error')}")
+            
+            if done % BULK_PROGRESS_INTERVAL == 0 or done == len(tasks):
+                elapsed = time.monotonic() - started
+                print(f"📦 {done}/{len(tasks)} tasks processed, {created} created "
+                      f"({done / elapsed if elapsed else 0:.1f} pages/s)")
+            yield result
+
+def bulk_create_tasks(tasks, max_workers=NOTION_BULK_MAX_WORKERS):
+    """
+    Create many tasks and summarize the run.
+    
+    Returns:
+        dict: 'results' (one entry per task, in input order), 'created', 'failed',
+        'elapsed' (seconds) and 'pages_per_second'.
+    """
+    started = time.monotonic()
+    results = sorted(iter_bulk_create_tasks(tasks, max_workers=max_workers), key=lambda result: result['index'])
+    elapsed = time.monotonic() - started
+    created = sum(1 for result in results if result['success'])
+    
+    print(f"✅ Bulk import finished: {created}/{len(results)} tasks created in {elapsed:.1f}s")
+    
+    return {
+        "results": results,
+        "created": created,
+        "failed": len(results) - created,
+        "elapsed": elapsed,
+        "pages_per_second": len(results) / elapsed if elapsed else 0.0
+    }
+
+def build_task_update_properties(task_data, user_id=None):
+    """Build the properties to change for a task update"""
     properties = {}
     
     if 'status' in task_data:
@@ -390,20 +1980,48 @@ def update_task(task_data):
     if 'deadline' in task_data and task_data['deadline']:
         properties["Deadline"] = {"date": {"start": task_data['deadline']}}
     
+    if user_id:
+        properties["Assign"] = {"people": [{"id": user_id}]}
+    
+    return properties
+
+def _resolve_update_properties(task_data):
+    """Resolve the assignee of an update and build the properties it changes"""
+    user_id = None
     if 'assignee' in task_data and task_data['assignee']:
-        users = fetch_users()
-        user_id = users.get(task_data['assignee'])
+        user_id = get_users_directory().resolve(task_data['assignee'])
         if user_id:
-            properties["Assign"] = {"people": [{"id": user_id}]}
             print(f"✅ Updating assignee to: {task_data['assignee']}")
         else:
             print(f"⚠️ Could not find user ID for {task_data['assignee']}")
     
-    data = {"properties": properties}
+    return build_task_update_properties(task_data, user_id)
+
+def build_rename_properties(new_name):
+    """Build the properties that rename a task"""
+    return {"Name": {"title": [{"text": {"content": new_name}}]}}
+
+def build_epic_properties(epic_name):
+    """Build the properties that assign an epic to a task"""
+    return {"Select": {"select": {"name": epic_name}}}
+
+def update_task(task_data):
+    """Update an existing task in Notion"""
+    # First, find the task by name
+    task_name = task_data.get('task')
+    page_id = find_task_by_name(task_name)
     
-    response = requests.patch(url, headers=headers, json=data)
+    if not page_id:
+        print(f"❌ Task not found: {task_name}")
+        return False
+    
+    # Prepare properties to update
+    data = {"properties": _resolve_update_properties(task_data)}
+    
+    response = get_client().patch(f"pages/{page_id}", json=data)
     
     if response.status_code >= 200 and response.status_code < 300:
+        get_board_snapshot().upsert(response.json())
         print(f"✅ Updated task: {task_name}")
         return True
     else:
@@ -412,14 +2030,6 @@ def update_task(task_data):
 
 def delete_task(task_data):
     """Delete (archive) a task from Notion"""
-    notion_api_key = os.getenv("NOTION_API_KEY")
-    
-    headers = {
-        "Authorization": f"Bearer {notion_api_key}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
-    
     # Find the task by name
     task_name = task_data.get('task')
     page_id = find_task_by_name(task_name)
@@ -428,14 +2038,13 @@ def delete_task(task_data):
         print(f"❌ Task not found: {task_name}")
         return False
     
-    url = f"https://api.notion.com/v1/pages/{page_id}"
-    
     # Archive the page
     data = {"archived": True}
     
-    response = requests.patch(url, headers=headers, json=data)
+    response = get_client().patch(f"pages/{page_id}", json=data)
     
     if response.status_code >= 200 and response.status_code < 300:
+        get_board_snapshot().remove(page_id)
         print(f"✅ Archived task: {task_name}")
         return True
     else:
@@ -444,14 +2053,6 @@ def delete_task(task_data):
 
 def add_comment(task_data):
     """Add a comment to a task in Notion"""
-    notion_api_key = os.getenv("NOTION_API_KEY")
-    
-    headers = {
-        "Authorization": f"Bearer {notion_api_key}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
-    
     # Find the task by name
     task_name = task_data.get('task')
     page_id = find_task_by_name(task_name)
@@ -460,8 +2061,6 @@ def add_comment(task_data):
         print(f"❌ Task not found: {task_name}")
         return False
     
-    url = "https://api.notion.com/v1/comments"
-    
     data = {
         "parent": {"page_id": page_id},
         "rich_text": [
@@ -472,7 +2071,7 @@ def add_comment(task_data):
         ]
     }
     
-    response = requests.post(url, headers=headers, json=data)
+    response = get_client().post("comments", json=data)
     
     if response.status_code >= 200 and response.status_code < 300:
         print(f"✅ Added comment to task: {task_name}")
@@ -483,14 +2082,6 @@ def add_comment(task_data):
 
 def rename_task(task_data):
     """Rename a task in Notion"""
-    notion_api_key = os.getenv("NOTION_API_KEY")
-    
-    headers = {
-        "Authorization": f"Bearer {notion_api_key}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
-    
     # Find the task by old name
     old_name = task_data.get('old_name')
     if not old_name:
@@ -503,70 +2094,53 @@ def rename_task(task_data):
         print(f"❌ Task not found: {old_name}")
         return False
     
-    url = f"https://api.notion.com/v1/pages/{page_id}"
-    
     # Update the task name
-    data = {
-        "properties": {
-            "Name": {
-                "title": [
-                    {
-                        "text": {
-                            "content": task_data.get('new_name', 'Untitled Task')
-                        }
-                    }
-                ]
-            }
-        }
-    }
+    data = {"properties": build_rename_properties(task_data.get('new_name', 'Untitled Task'))}
     
-    response = requests.patch(url, headers=headers, json=data)
+    response = get_client().patch(f"pages/{page_id}", json=data)
     
     if response.status_code >= 200 and response.status_code < 300:
+        get_board_snapshot().upsert(response.json())
         print(f"✅ Renamed task: {old_name} → {task_data.get('new_name')}")
         return True
     else:
         print(f"❌ Failed to rename task: {response.text}")
         return False
 
+def find_task_match(task_name):
+    """
+    Find the best-matching task for a name.
+    
+    Args:
+        task_name (str): The task name to look up (case-insensitive).
+    
+    Returns:
+        tuple: (page_id, score) for the best exact or substring match, or (None, 0).
+    """
+    if not task_name:
+        return None, 0
+    snapshot = get_board_snapshot()
+    mirror = snapshot.mirror()
+    if mirror is not None:
+        # Exact titles come straight from the mirror's index, without building the TitleIndex
+        snapshot.ensure_current()
+        matches = mirror.find_by_title(task_name)
+        if matches:
+            return matches[0], 1.0
+    return snapshot.title_index().lookup(task_name)
+
 def find_task_by_name(task_name):
     """Find a task by name and return its page ID"""
-    notion_api_key = os.getenv("NOTION_API_KEY")
-    notion_database_id = os.getenv("NOTION_DATABASE_ID")
-    
-    headers = {
-        "Authorization": f"Bearer {notion_api_key}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
-    
-    url = f"https://api.notion.com/v1/databases/{notion_database_id}/query"
-    
-    # Query for the task by name
-    response = requests.post(url, headers=headers, json={})
-    
-    if response.status_code >= 200 and response.status_code < 300:
-        results = response.json().get("results", [])
-        
-        # Make the search case-insensitive
-        search_name = task_name.lower().strip()
-        
-        for page in results:
-            title_property = page["properties"]["Name"]["title"]
-            if title_property:
-                current_name = title_property[0]["text"]["content"].lower().strip()
-                if current_name == search_name:
-                    return page["id"]
-                # Add fuzzy matching for better results
-                elif search_name in current_name or current_name in search_name:
-                    return page["id"]
-    
-    return None
+    page_id, score = find_task_match(task_name)
+    if page_id and score < 1.0:
+        print(f"✓ Using closest match for '{task_name}' (similarity: {score:.2f})")
+    return page_id
 
 # Add this new function to check if an epic already exists (case-insensitive)
-def epic_exists(epic_name):
+def epic_exists(epic_name, epics=None):
     """Check if an epic already exists (case-insensitive)"""
-    epics = fetch_epics()
+    if epics is None:
+        epics = fetch_epics()
     
     # Make the search case-insensitive
     search_name = epic_name.lower().strip()
@@ -577,43 +2151,21 @@ def epic_exists(epic_name):
     
     return False, None
 
-# Update the create_epic function
-def create_epic(epic_data):
-    """Create a new epic in Notion"""
-    notion_api_key = os.getenv("NOTION_API_KEY")
-    notion_database_id = os.getenv("NOTION_DATABASE_ID")
-    
-    headers = {
-        "Authorization": f"Bearer {notion_api_key}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
-    
-    # Get the epic name
-    epic_name = epic_data.get('epic')
-    if not epic_name:
-        print(f"❌ No epic name provided")
-        return False
-    
-    # Standardize epic name to Title Case
-    epic_name = ' '.join(word.capitalize() for word in epic_name.split())
-    
-    # Check if the epic already exists (case-insensitive)
-    exists, existing_epic = epic_exists(epic_name)
-    if exists:
-        print(f"ℹ️ Epic already exists: {existing_epic}")
-        return True
-    
-    # Get database schema to update select options
-    url = f"https://api.notion.com/v1/databases/{notion_database_id}"
-    response = requests.get(url, headers=headers)
-    
-    if response.status_code != 200:
-        print(f"❌ Failed to get database schema: {response.text}")
-        return False
+def title_case_epic(epic_name):
+    """Standardize an epic name to Title Case"""
+    return ' '.join(word.capitalize() for word in epic_name.split())
+
+def build_epic_schema_update(database, epic_names):
+    """
+    Build the database PATCH body that adds epics to the Select property's options.
     
-    database = response.json()
+    Args:
+        database (dict): The database object from GET /v1/databases/{id}.
+        epic_names (list): Epic names to add.
     
+    Returns:
+        dict or None: The request body, or None if the database has no select property.
+    """
     # Find the Select property in the database schema
     select_property_id = None
     select_options = []
@@ -621,22 +2173,19 @@ def create_epic(epic_data):
     for prop_id, prop_data in database.get("properties", {}).items():
         if prop_data.get("type") == "select":
             select_property_id = prop_id
-            select_options = prop_data.get("select", {}).get("options", [])
+            select_options = list(prop_data.get("select", {}).get("options", []))
             break
     
     if not select_property_id:
-        print("❌ No select property found in database schema")
-        return False
+        return None
     
-    # Add the new epic to the select options
-    select_options.append({
-        "name": epic_name,
-        "color": "blue"  # Default color
-    })
+    for epic_name in epic_names:
+        select_options.append({
+            "name": epic_name,
+            "color": "blue"  # Default color
+        })
     
-    # Update the database schema with the new select option
-    update_url = f"https://api.notion.com/v1/databases/{notion_database_id}"
-    update_data = {
+    return {
         "properties": {
             select_property_id: {
                 "select": {
@@ -645,15 +2194,103 @@ def create_epic(epic_data):
             }
         }
     }
+
+def plan_epic_creation(operations, existing_epics):
+    """
+    Work out which create_epic operations need a new select option.
+    
+    Args:
+        operations (list): create_epic operations.
+        existing_epics (list): Epic names already in the schema or in use.
+    
+    Returns:
+        tuple: (results, pending) where results has one result dict per operation,
+        already successful for epics that exist, and pending maps each new Title
+        Case epic name to the result dicts that depend on creating it.
+    """
+    known = {epic.lower().strip(): epic for epic in existing_epics}
+    results = []
+    pending = {}
     
-    update_response = requests.patch(update_url, headers=headers, json=update_data)
+    for op in operations:
+        result = {"operation": "create_epic", "success": False, "epic": op.get('epic')}
+        results.append(result)
+        
+        if not op.get('epic'):
+            print("❌ No epic name provided")
+            continue
+        
+        # Standardize epic name to Title Case
+        epic_name = title_case_epic(op['epic'])
+        key = epic_name.lower().strip()
+        
+        if key in pending:
+            pending[key].append(result)
+        elif key in known:
+            print(f"ℹ️ Epic already exists: {known[key]}")
+            result['success'] = True
+        else:
+            pending[key] = [result]
+            known[key] = epic_name
     
-    if update_response.status_code >= 200 and update_response.status_code < 300:
-        print(f"✅ Created epic: {epic_name}")
-        return True
+    return results, {known[key]: entries for key, entries in pending.items()}
+
+def create_epics(operations):
+    """
+    Create the epics for a batch of create_epic operations.
+    
+    Existing epics are detected from the cached schema and the board snapshot;
+    all new ones are added with a single database PATCH.
+    
+    Returns:
+        list: One result dict per operation, in input order.
+    """
+    notion_database_id = os.getenv("NOTION_DATABASE_ID")
+    schema = get_database_schema()
+    results, pending = [], {}
+    
+    try:
+        with get_client().operation_deadline():
+            database = schema.get(notion_database_id)
+            existing = (schema.select_options(notion_database_id) if database else []) + fetch_epics()
+            results, pending = plan_epic_creation(operations, existing)
+            if not pending:
+                return results
+            
+            if database is None:
+                print("❌ Failed to get database schema")
+                return results
+            
+            update_data = build_epic_schema_update(database, list(pending))
+            if not update_data:
+                print("❌ No select property found in database schema")
+                return results
+            
+            response = get_client().patch(f"databases/{notion_database_id}", json=update_data)
+    except Exception as e:
+        print(f"❌ Error processing operation create_epic: {str(e)}")
+        for entries in pending.values():
+            for result in entries:
+                result['error'] = str(e)
+        return results or [
+            {"operation": "create_epic", "success": False, "epic": op.get('epic'), "error": str(e)}
+            for op in operations
+        ]
+    
+    if response.status_code >= 200 and response.status_code < 300:
+        schema.store(notion_database_id, response.json())
+        for epic_name, entries in pending.items():
+            print(f"✅ Created epic: {epic_name}")
+            for result in entries:
+                result['success'] = True
     else:
-        print(f"❌ Failed to create epic: {update_response.text}")
-        return False
+        print(f"❌ Failed to create epics {', '.join(pending)}: {response.text}")
+    
+    return results
+
+def create_epic(epic_data):
+    """Create a new epic in Notion"""
+    return create_epics([epic_data])[0]['success']
 
 def format_operation_summary(results):
     """Format the results of task operations for display"""
@@ -673,4 +2310,226 @@ def format_operation_summary(results):
             error = result.get('error', 'Unknown error')
             summary += f"❌ {operation.capitalize()}: {task} - {error}\n"
     
-    return summary
\ No newline at end of file
+    return summary
+
+# Agent context databases, configured next to NOTION_DATABASE_ID
+CONTEXT_DATABASE_ENV = {
+    "retrologs": "NOTION_RETROLOGS_DATABASE_ID",
+    "weekly_summaries": "NOTION_WEEKLY_SUMMARIES_DATABASE_ID",
+    "execution_insights": "NOTION_EXECUTION_INSIGHTS_DATABASE_ID"
+}
+
+# Context dict key -> expected Notion property name, per context database. Names are
+# matched against each database's schema ignoring case and spacing; "date" is optional.
+CONTEXT_PROPERTIES = {
+    "retrologs": {
+        "date": "Date",
+        "team_member": "Team Member",
+        "went_well": "Went Well",
+        "didnt_go_well": "Didn't Go Well",
+        "action_items": "Action Items"
+    },
+    "weekly_summaries": {
+        "date": "Date",
+        "date_range": "Date Range",
+        "completed_tasks": "Completed Tasks",
+        "carryover_tasks": "Carryover Tasks",
+        "key_metrics": "Key Metrics",
+        "weekly_retro_summary": "Weekly Retro Summary"
+    },
+    "execution_insights": {
+        "date": "Date",
+        "observations": "Observations",
+        "recommendations": "Recommendations",
+        "progress_metrics": "Progress Metrics"
+    }
+}
+
+CONTEXT_ENTRY_LIMIT = 5  # most recent entries read from each context database
+RICH_TEXT_CHUNK = 2000  # Notion's limit per rich_text item
+
+def property_text(prop):
+    """Return the plain-text value of a title, rich_text, date, select, status or people property"""
+    if not prop:
+        return ""
+    prop_type = prop.get("type") or next((key for key in ("title", "rich_text", "date") if key in prop), None)
+    value = prop.get(prop_type)
+    
+    if prop_type in ("title", "rich_text"):
+        return "".join(part.get("plain_text") or part.get("text", {}).get("content", "") for part in value or [])
+    if prop_type == "date":
+        return (value or {}).get("start") or ""
+    if prop_type in ("select", "status"):
+        return (value or {}).get("name") or ""
+    if prop_type == "people":
+        return ", ".join(person.get("name", "") for person in value or [])
+    return ""
+
+def build_rich_text(text):
+    """Build a rich_text value, split into chunks Notion accepts"""
+    text = text or ""
+    return [{"text": {"content": text[i:i + RICH_TEXT_CHUNK]}} for i in range(0, len(text), RICH_TEXT_CHUNK)]
+
+def _resolve_context_properties(kind, database_id):
+    """
+    Map each context key to the property name the database actually uses.
+    
+    Raises:
+        ValueError: If the schema can't be read or an expected property is missing.
+    """
+    database = get_database_schema().get(database_id)
+    if database is None:
+        raise ValueError(f"could not read the schema of database {database_id}")
+    
+    schema = {normalize_title(name): name for name in database.get("properties", {})}
+    resolved = {}
+    missing = []
+    for key, name in CONTEXT_PROPERTIES[kind].items():
+        if normalize_title(name) in schema:
+            resolved[key] = schema[normalize_title(name)]
+        elif key != "date":
+            missing.append(name)
+    
+    if missing:
+        raise ValueError(
+            f"database {database_id} ({CONTEXT_DATABASE_ENV[kind]}) has no "
+            f"{', '.join(repr(name) for name in missing)} property; it has {', '.join(map(repr, schema.values()))}"
+        )
+    return resolved
+
+def _fetch_context_entries(kind):
+    """Read the most recent entries of one context database as compact dicts"""
+    database_id = os.getenv(CONTEXT_DATABASE_ENV[kind])
+    if not database_id:
+        return []
+    
+    names = _resolve_context_properties(kind, database_id)
+    pages = query_database(
+        database_id=database_id,
+        sorts=[{"timestamp": "created_time", "direction": "descending"}],
+        filter_properties=list(names.values()),
+        page_size=CONTEXT_ENTRY_LIMIT,
+        raise_errors=True
+    )
+    entries = []
+    for page in pages:
+        properties = page.get("properties", {})
+        entry = {key: property_text(properties.get(names.get(key))) for key in CONTEXT_PROPERTIES[kind]}
+        entry["date"] = entry["date"] or page.get("created_time", "")[:10]
+        entries.append(entry)
+        if len(entries) >= CONTEXT_ENTRY_LIMIT:
+            break
+    return entries
+
+def _fetch_context_tasks():
+    """Return the task board as the compact dicts the agent prompt uses"""
+    return [
+        {
+            "id": task["id"],
+            "name": task["title"],
+            "status": task["status"],
+            "assignee": task["assignee"],
+            "deadline": task["deadline"],
+            "epic": task["epic"]
+        }
+        for task in fetch_task_summaries()
+    ]
+
+def fetch_context_for_agent():
+    """
+    Fetch context from Notion for the agent.
+    
+    The task board and the retrologs, weekly summaries and execution insights
+    databases are read concurrently, so this takes about as long as the slowest
+    single query. Databases that aren't configured, or fail to load because their
+    schema lacks an expected property, come back empty with the reason printed.
+    
+    Returns:
+        dict: 'tasks', 'retrologs', 'weekly_summaries' and 'execution_insights' lists.
+    """
+    loaders = {"tasks": _fetch_context_tasks}
+    for kind in CONTEXT_DATABASE_ENV:
+        loaders[kind] = lambda kind=kind: _fetch_context_entries(kind)
+    
+    context = {}
+    with ThreadPoolExecutor(max_workers=len(loaders)) as pool:
+        futures = {key: pool.submit(loader) for key, loader in loaders.items()}
+        for key, future in futures.items():
+            try:
+                context[key] = future.result()
+            except Exception as e:
+                print(f"❌ Error fetching {key.replace('_', ' ')} for agent: {str(e)}")
+                context[key] = []
+    
+    return context
+
+def _context_property_value(prop_type, value):
+    """Build a property value of the given schema type from plain text"""
+    if prop_type == "title":
+        return {"title": build_rich_text(value)}
+    if prop_type == "select":
+        return {"select": {"name": value}} if value else {"select": None}
+    if prop_type == "date":
+        return {"date": {"start": value}} if value else {"date": None}
+    if prop_type == "rich_text":
+        return {"rich_text": build_rich_text(value)}
+    raise ValueError(f"can't write text to a {prop_type} property")
+
+def _create_context_entry(kind, label, title, values):
+    """Create a page in one of the context databases, using the property names its schema resolves to"""
+    database_id = os.getenv(CONTEXT_DATABASE_ENV[kind])
+    if not database_id:
+        print(f"⚠️ {CONTEXT_DATABASE_ENV[kind]} is not set, skipping {label}")
+        return False
+    
+    try:
+        names = _resolve_context_properties(kind, database_id)
+        schema = get_database_schema().get(database_id)["properties"]
+        title_name = next(name for name, prop in schema.items() if prop.get("type") == "title")
+        properties = {title_name: _context_property_value("title", title)}
+        if "date" in names:
+            properties[names["date"]] = _context_property_value("date", datetime.now().strftime("%Y-%m-%d"))
+        for key, value in values.items():
+            properties[names[key]] = _context_property_value(schema[names[key]].get("type"), value)
+    except (ValueError, StopIteration) as e:
+        print(f"❌ Failed to create {label}: {str(e) or 'the database has no title property'}")
+        return False
+    
+    response = get_client().post("pages", json={"parent": {"database_id": database_id}, "properties": properties})
+    
+    if response.status_code >= 200 and response.status_code < 300:
+        print(f"✅ Created {label}: {title}")
+        return True
+    else:
+        print(f"❌ Failed to create {label}: {response.text}")
+        return False
+
+def create_retrolog_entry(team_member, went_well, didnt_go_well, action_items=""):
+    """Create a retrolog entry in Notion"""
+    title = f"Retro - {team_member or 'Team'} - {datetime.now().strftime('%Y-%m-%d')}"
+    return _create_context_entry("retrologs", "retrolog entry", title, {
+        "team_member": team_member,
+        "went_well": went_well,
+        "didnt_go_well": didnt_go_well,
+        "action_items": action_items
+    })
+
+def create_weekly_summary(date_range, completed_tasks, carryover_tasks="", key_metrics="", weekly_retro_summary=""):
+    """Create a weekly summary in Notion"""
+    title = f"Weekly Summary - {date_range or datetime.now().strftime('%Y-%m-%d')}"
+    return _create_context_entry("weekly_summaries", "weekly summary", title, {
+        "date_range": date_range,
+        "completed_tasks": completed_tasks,
+        "carryover_tasks": carryover_tasks,
+        "key_metrics": key_metrics,
+        "weekly_retro_summary": weekly_retro_summary
+    })
+
+def create_execution_insight(observations, recommendations="", progress_metrics=""):
+    """Create an execution insight in Notion"""
+    title = f"Execution Insight - {datetime.now().strftime('%Y-%m-%d')}"
+    return _create_context_entry("execution_insights", "execution insight", title, {
+        "observations": observations,
+        "recommendations": recommendations,
+        "progress_metrics": progress_metrics
+    })
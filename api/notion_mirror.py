@@ -0,0 +1,207 @@
+# api/notion_mirror.py
+"""
+Optional on-disk SQLite replica of the Notion task database.
+
+Enabled by setting NOTION_MIRROR_PATH. The board snapshot in api/notion_handler.py
+writes every full sync, delta sync and write-through into it, and restores from
+it on process start, so a restart only needs a delta query instead of a full
+scan. The projected task fields are indexed for title, status and epic lookups.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+
+from api.notion_handler import normalize_title, project_task
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id TEXT PRIMARY KEY,
+    database_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    last_edited_time TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    page_id TEXT PRIMARY KEY,
+    database_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    normalized_title TEXT NOT NULL,
+    status TEXT,
+    assignee TEXT,
+    assignee_id TEXT,
+    deadline TEXT,
+    epic TEXT,
+    epic_color TEXT
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    database_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (database_id, key)
+);
+CREATE INDEX IF NOT EXISTS idx_pages_position ON pages (database_id, position);
+CREATE INDEX IF NOT EXISTS idx_tasks_title ON tasks (database_id, normalized_title);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (database_id, status);
+CREATE INDEX IF NOT EXISTS idx_tasks_epic ON tasks (database_id, epic);
+"""
+
+TASK_COLUMNS = ["title", "status", "assignee", "assignee_id", "deadline", "epic", "epic_color"]
+
+class NotionMirror:
+    """SQLite replica of one Notion task database"""
+    
+    def __init__(self, path, database_id):
+        """Open (or create) the mirror file for a database"""
+        self.path = path
+        self.database_id = database_id
+        self._lock = threading.Lock()
+        # Shared across the executor's worker threads; every access holds _lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+    
+    def _get_state(self, key):
+        """Read one sync_state value"""
+        row = self._conn.execute(
+            "SELECT value FROM sync_state WHERE database_id = ? AND key = ?",
+            (self.database_id, key)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def _set_state(self, key, value):
+        """Write one sync_state value"""
+        self._conn.execute(
+            "INSERT INTO sync_state (database_id, key, value) VALUES (?, ?, ?) "
+            "ON CONFLICT (database_id, key) DO UPDATE SET value = excluded.value",
+            (self.database_id, key, value)
+        )
+    
+    def _write_pages(self, pages):
+        """Upsert pages and their projected fields, deleting archived ones"""
+        position = self._conn.execute(
+            "SELECT COALESCE(MAX(position), -1) FROM pages WHERE database_id = ?", (self.database_id,)
+        ).fetchone()[0]
+        for page in pages:
+            if page.get("archived") or page.get("in_trash"):
+                self._delete_page(page["id"])
+                continue
+            position += 1
+            # Existing pages keep their position so the board order stays stable
+            self._conn.execute(
+                "INSERT INTO pages (id, database_id, position, last_edited_time, data) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET last_edited_time = excluded.last_edited_time, data = excluded.data",
+                (page["id"], self.database_id, position, page.get("last_edited_time"), json.dumps(page))
+            )
+            task = project_task(page)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tasks (page_id, database_id, normalized_title, "
+                + ", ".join(TASK_COLUMNS) + ") VALUES (?, ?, ?" + ", ?" * len(TASK_COLUMNS) + ")",
+                [page["id"], self.database_id, normalize_title(task["title"])] + [task[c] for c in TASK_COLUMNS]
+            )
+    
+    def _delete_page(self, page_id):
+        """Remove a page and its projected fields"""
+        self._conn.execute("DELETE FROM pages WHERE id = ?", (page_id,))
+        self._conn.execute("DELETE FROM tasks WHERE page_id = ?", (page_id,))
+    
+    def load(self):
+        """
+        Return the state saved by the last sync.
+        
+        Returns:
+            tuple: (pages in board order, high-water mark, wall-clock time of the
+            last full sync), or None if this database has never been synced.
+        """
+        with self._lock:
+            high_water_mark = self._get_state("high_water_mark")
+            full_synced_at = self._get_state("full_synced_at")
+            if not high_water_mark or not full_synced_at:
+                return None
+            rows = self._conn.execute(
+                "SELECT data FROM pages WHERE database_id = ? ORDER BY position", (self.database_id,)
+            ).fetchall()
+            return [json.loads(row[0]) for row in rows], high_water_mark, float(full_synced_at)
+    
+    def replace(self, pages, high_water_mark):
+        """Replace the mirror contents with the result of a full sync"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM pages WHERE database_id = ?", (self.database_id,))
+            self._conn.execute("DELETE FROM tasks WHERE database_id = ?", (self.database_id,))
+            self._write_pages(pages)
+            if high_water_mark:
+                self._set_state("high_water_mark", high_water_mark)
+            self._set_state("full_synced_at", repr(time.time()))
+    
+    def upsert(self, pages, high_water_mark=None):
+        """Apply pages from a delta sync or a write-through"""
+        with self._lock, self._conn:
+            self._write_pages(pages)
+            if high_water_mark:
+                self._set_state("high_water_mark", high_water_mark)
+    
+    def delete(self, page_id):
+        """Remove an archived page"""
+        with self._lock, self._conn:
+            self._delete_page(page_id)
+    
+    def clear(self):
+        """Forget everything stored for this database so the next sync is a full one"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM pages WHERE database_id = ?", (self.database_id,))
+            self._conn.execute("DELETE FROM tasks WHERE database_id = ?", (self.database_id,))
+            self._conn.execute("DELETE FROM sync_state WHERE database_id = ?", (self.database_id,))
+    
+    def tasks(self, status=None, epic=None):
+        """Return projected tasks in board order, optionally filtered by status and epic"""
+        query = (
+            "SELECT t.page_id, " + ", ".join("t." + c for c in TASK_COLUMNS)
+            + " FROM tasks t JOIN pages p ON p.id = t.page_id WHERE t.database_id = ?"
+        )
+        params = [self.database_id]
+        if status is not None:
+            query += " AND t.status = ?"
+            params.append(status)
+        if epic is not None:
+            query += " AND t.epic = ?"
+            params.append(epic)
+        query += " ORDER BY p.position"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [dict(zip(["id"] + TASK_COLUMNS, row)) for row in rows]
+    
+    def find_by_title(self, title):
+        """Return the IDs of tasks whose normalized title equals title's, in board order"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT t.page_id FROM tasks t JOIN pages p ON p.id = t.page_id "
+                "WHERE t.database_id = ? AND t.normalized_title = ? ORDER BY p.position",
+                (self.database_id, normalize_title(title))
+            ).fetchall()
+        return [row[0] for row in rows]
+    
+    def epics(self):
+        """Return the distinct epic names in use"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT epic FROM tasks WHERE database_id = ? AND epic IS NOT NULL",
+                (self.database_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+    
+    def epic_colors(self):
+        """Return the distinct epic colors in use"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT epic_color FROM tasks WHERE database_id = ? AND epic_color IS NOT NULL",
+                (self.database_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,130 @@
+# api/operation_journal.py
+"""
+Append-only write-ahead journal for board operations.
+
+Enabled by setting NOTION_JOURNAL_PATH. Every operation's intent (with its
+idempotency key and the page ID it resolved to) is written and fsynced before
+any request goes out, and its outcome is appended once it finishes. Entries
+with no outcome, or whose outcome is unknown because the request raised, are
+what api/notion_handler.py reconciles against the board and resumes on restart.
+"""
+
+import json
+import os
+import threading
+import uuid
+from datetime import datetime, timezone
+
+class OperationJournal:
+    """JSONL journal of operation intents and outcomes"""
+    
+    def __init__(self, path):
+        """Open (or create) the journal file"""
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+    
+    def _append(self, records):
+        """Append records and force them to disk"""
+        with self._lock:
+            for record in records:
+                self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+    
+    def record_intents(self, operations, page_ids=None):
+        """
+        Record that a batch of operations is about to run.
+        
+        Args:
+            operations (list): The operations, in input order.
+            page_ids (list): The page ID each operation resolved to, or None.
+        
+        Returns:
+            list: The idempotency key assigned to each operation.
+        """
+        batch = uuid.uuid4().hex
+        page_ids = page_ids or [None] * len(operations)
+        now = datetime.now(timezone.utc).isoformat()
+        records = []
+        for index, (op, page_id) in enumerate(zip(operations, page_ids)):
+            records.append({
+                "event": "intent",
+                "key": f"{batch}:{index}",
+                "op": op,
+                "page_id": page_id,
+                "at": now
+            })
+        self._append(records)
+        return [record["key"] for record in records]
+    
+    def record_outcome(self, key, status, page_id=None, error=None):
+        """
+        Record how an operation ended.
+        
+        Args:
+            key (str): The operation's idempotency key.
+            status (str): "done", "failed" (Notion rejected it) or "unknown" (the
+                request raised, so it may or may not have been applied).
+            page_id (str): The page the operation created or changed, if known.
+            error (str): The error message, if any.
+        """
+        record = {"event": "outcome", "key": key, "status": status, "at": datetime.now(timezone.utc).isoformat()}
+        if page_id:
+            record["page_id"] = page_id
+        if error:
+            record["error"] = error
+        self._append([record])
+    
+    def _read(self):
+        """Return every record in the journal, skipping a torn final line"""
+        records = []
+        with open(self.path, encoding="utf-8") as journal_file:
+            for line in journal_file:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return records
+    
+    def pending(self, keys=None):
+        """
+        Return the intents that still need reconciling, in journal order.
+        
+        An intent is pending when it has no outcome or its latest outcome is
+        "unknown". Pass keys to restrict the result to those operations.
+        """
+        with self._lock:
+            records = self._read()
+        
+        intents = {}
+        statuses = {}
+        for record in records:
+            if record.get("event") == "intent":
+                intents[record["key"]] = record
+            elif record.get("event") == "outcome":
+                statuses[record["key"]] = record.get("status")
+        
+        return [
+            intent for key, intent in intents.items()
+            if statuses.get(key) in (None, "unknown") and (keys is None or key in keys)
+        ]
+    
+    def compact(self):
+        """Rewrite the journal keeping only pending intents"""
+        pending = self.pending()
+        with self._lock:
+            self._file.close()
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as temp_file:
+                for intent in pending:
+                    temp_file.write(json.dumps(intent) + "\n")
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            os.replace(temp_path, self.path)
+            self._file = open(self.path, "a", encoding="utf-8")
+    
+    def close(self):
+        """Close the journal file"""
+        with self._lock:
+            self._file.close()
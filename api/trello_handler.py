@@ -6,104 +6,1380 @@ from datetime import datetime, timedelta
 import random
 import re
 import difflib  # Add this for fuzzy string matching
-
-def fetch_cards():
-    """Fetch all cards from Trello"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    trello_board_id = os.getenv("TRELLO_BOARD_ID")
+import threading
+import time
+import atexit
+import base64
+import hashlib
+import hmac
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError
+
+from api.fuzzy_index import FuzzyIndex
+from utils.dependency_runner import run_with_dependencies
+
+# Trello allows about 100 requests per 10 seconds per token and 300 per 10 seconds per API key
+TRELLO_TOKEN_RATE_LIMIT = (100, 10.0)
+TRELLO_KEY_RATE_LIMIT = (300, 10.0)
+
+class SlidingWindowLimiter:
+    """
+    Thread-safe limiter for Trello's per-token and per-key request windows.
+    
+    A request may go out only when fewer than the limit of requests were sent
+    with the same token, and with the same key, in the trailing window.
+    """
+    
+    def __init__(self, token_limit=TRELLO_TOKEN_RATE_LIMIT, key_limit=TRELLO_KEY_RATE_LIMIT):
+        """Initialize empty windows; each limit is (requests, seconds)"""
+        self.token_limit = token_limit
+        self.key_limit = key_limit
+        self._sent = {}  # ("token" | "key", value) -> deque of send times
+        self._lock = threading.Lock()
+    
+    def _delay(self, window, limit, now):
+        """Prune a window and return how long until it has room (0 if it has room now)"""
+        count, seconds = limit
+        while window and now - window[0] >= seconds:
+            window.popleft()
+        if len(window) < count:
+            return 0.0
+        return window[0] + seconds - now
+    
+    def acquire(self, key=None, token=None):
+        """Block until a request with this key and token may be sent; returns the number of seconds waited"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                token_window = self._sent.setdefault(("token", token), deque())
+                key_window = self._sent.setdefault(("key", key), deque())
+                delay = max(
+                    self._delay(token_window, self.token_limit, now),
+                    self._delay(key_window, self.key_limit, now)
+                )
+                if delay <= 0:
+                    token_window.append(now)
+                    key_window.append(now)
+                    return waited
+            time.sleep(delay)
+            waited += delay
+
+TRELLO_API_URL = "https://api.trello.com/1"
+TRELLO_MAX_RETRIES = 4
+TRELLO_BACKOFF_BASE = 0.5  # seconds, doubled on each retry
+TRELLO_BACKOFF_MAX = 10.0  # seconds; kept short so a live meeting isn't stalled for long
+
+class TrelloClient:
+    """
+    Shared Trello API client.
+    
+    Owns a pooled keep-alive session, adds the API key and token to every
+    request, applies connect/read timeouts, passes every request through the
+    sliding-window limiter, retries 429/5xx responses with jittered exponential
+    backoff (honouring Retry-After), and keeps per-endpoint call, byte and
+    latency counters.
+    """
     
-    url = f"https://api.trello.com/1/boards/{trello_board_id}/cards"
+    def __init__(self, api_key=None, token=None, pool_size=10, timeout=(5, 30), rate_limiter=None,
+                 max_retries=TRELLO_MAX_RETRIES):
+        """Initialize the client; the key and token are read from the environment on each call if not given"""
+        self.api_key = api_key
+        self.token = token
+        self.timeout = timeout  # (connect, read) seconds
+        self.rate_limiter = rate_limiter or SlidingWindowLimiter()
+        self.max_retries = max_retries
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+    
+    def _endpoint_key(self, method, url):
+        """Collapse IDs and query strings so calls to the same endpoint share one counter"""
+        path = url.split("?")[0]
+        if path.startswith(TRELLO_API_URL):
+            path = path[len(TRELLO_API_URL):]
+        board_id = os.getenv("TRELLO_BOARD_ID")
+        if board_id:
+            path = path.replace(f"/boards/{board_id}", "/boards/{id}")
+        path = re.sub(r"[0-9a-fA-F]{24}", "{id}", path)
+        return f"{method.upper()} /{path.lstrip('/')}"
+    
+    def _record(self, key, elapsed, response, waited):
+        """Record the latency, size and outcome of a single call"""
+        with self._stats_lock:
+            stats = self._stats.setdefault(key, {
+                "count": 0, "errors": 0, "retries": 0, "bytes": 0,
+                "total_time": 0.0, "max_time": 0.0, "wait_time": 0.0
+            })
+            stats["count"] += 1
+            stats["total_time"] += elapsed
+            stats["max_time"] = max(stats["max_time"], elapsed)
+            stats["wait_time"] += waited
+            if response is None or response.status_code >= 400:
+                stats["errors"] += 1
+            if response is not None:
+                stats["bytes"] += len(response.content)
+    
+    def _record_retry(self, key):
+        """Record one retry"""
+        with self._stats_lock:
+            self._stats[key]["retries"] += 1
+    
+    def _retry_delay(self, response, attempt):
+        """Seconds to wait before the next attempt: Retry-After if given, else jittered backoff"""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return min(TRELLO_BACKOFF_MAX, float(retry_after))
+            except ValueError:
+                pass
+        backoff = min(TRELLO_BACKOFF_MAX, TRELLO_BACKOFF_BASE * (2 ** attempt))
+        return backoff / 2 + random.uniform(0, backoff / 2)
+    
+    @staticmethod
+    def _never_sent(error):
+        """Whether a connection error happened before any of the request reached Trello"""
+        if isinstance(error, requests.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, ConnectTimeoutError)  # includes failed connects and DNS lookups
     
+    def request(self, method, url, params=None, **kwargs):
+        """
+        Send a request to the Trello API and return the response.
+        
+        url may be a full API URL or a path such as "/cards/{id}". Retries 429
+        responses up to max_retries; 5xx responses and connection errors are
+        only retried for requests other than POST, which might have been
+        applied, or when the connection failed before anything was sent. The
+        last response is returned either way.
+        """
+        if not url.startswith("https://"):
+            url = f"{TRELLO_API_URL}/{url.lstrip('/')}"
+        api_key = self.api_key or os.getenv("TRELLO_API_KEY")
+        token = self.token or os.getenv("TRELLO_TOKEN")
+        params = dict(params or {}, key=api_key, token=token)
+        kwargs.setdefault("timeout", self.timeout)
+        
+        key = self._endpoint_key(method, url)
+        repeatable = method.upper() != "POST"
+        attempt = 0
+        
+        while True:
+            waited = self.rate_limiter.acquire(api_key, token)
+            
+            start = time.perf_counter()
+            response = None
+            error = None
+            try:
+                response = self.session.request(method, url, params=params, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not repeatable and not self._never_sent(e):
+                    raise
+                error = e
+            finally:
+                self._record(key, time.perf_counter() - start, response, waited)
+            
+            if response is not None and response.status_code != 429 and (response.status_code < 500 or not repeatable):
+                return response
+            
+            if attempt >= self.max_retries:
+                if error is not None:
+                    raise error
+                return response
+            
+            delay = self._retry_delay(response, attempt)
+            attempt += 1
+            self._record_retry(key)
+            time.sleep(delay)
+    
+    def get_stats(self):
+        """Return a copy of the per-endpoint counters with average latency filled in"""
+        with self._stats_lock:
+            stats = {}
+            for key, value in self._stats.items():
+                stats[key] = dict(value)
+                stats[key]["avg_time"] = value["total_time"] / value["count"] if value["count"] else 0.0
+            return stats
+    
+    def reset_stats(self):
+        """Clear all counters"""
+        with self._stats_lock:
+            self._stats.clear()
+    
+    def close(self):
+        """Close the underlying session and its pooled connections"""
+        self.session.close()
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    """Return the process-wide TrelloClient, creating it on first use"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = TrelloClient()
+    return _client
+
+TRELLO_SNAPSHOT_TTL = 60  # seconds
+TRELLO_METADATA_TTL = 300  # seconds; lists, labels and members change far less often than cards
+
+# Lists create_card falls back to, in order, when the requested status has no list
+FALLBACK_STATUS_NAMES = ['To Do', 'Not Started', 'Backlog', 'Todo']
+
+def _board_query(**fields):
+    """Return the query for a nested /boards/{id} request with the given fields"""
     query = {
-        'key': trello_api_key,
-        'token': trello_token
+        'fields': 'id,name'
     }
+    query.update(fields)
+    return query
+
+class BoardMetadata:
+    """
+    Cached lists, labels and members of the Trello board.
     
-    response = requests.get(url, params=query)
+    Names are indexed case-insensitively so lookups are dict hits; a lookup falls
+    back to a substring match only when there is no exact one. The list used for
+    each status create_card asks for, including the FALLBACK_STATUS_NAMES walk,
+    is resolved once per load. Labels and lists we create are added in place.
     
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f"❌ Failed to fetch cards: {response.text}")
-        return []
-
-def fetch_lists():
-    """Fetch all lists from Trello board"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    trello_board_id = os.getenv("TRELLO_BOARD_ID")
+    Every board snapshot load refreshes it for free; on its own it reloads after
+    the TTL with a nested request that leaves out cards and checklists. List,
+    label and member names are also kept in FuzzyIndexes for search().
+    """
+    
+    def __init__(self, ttl=TRELLO_METADATA_TTL):
+        """Initialize empty metadata"""
+        self.ttl = ttl
+        self._board_id = None
+        self._lists = {}           # list ID -> list, in board order
+        self._labels = {}          # label ID -> label
+        self._members = {}         # member ID -> member
+        self._list_ids = {}        # lowercase list name -> list ID
+        self._label_ids = {}       # lowercase label name -> label ID
+        self._member_ids = {}      # lowercase full name or username -> member ID
+        self._statuses = {}        # lowercase status -> (list ID, fallback name or None)
+        self._fallback = (None, None)
+        self._indexes = {'lists': FuzzyIndex(), 'labels': FuzzyIndex(), 'members': FuzzyIndex()}
+        self._loaded_at = None
+        self._lock = threading.RLock()
+    
+    def is_fresh(self):
+        """Check whether the metadata is loaded and within its TTL"""
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl
+    
+    def ensure_current(self):
+        """Reload the metadata if it is stale"""
+        with self._lock:
+            if not self.is_fresh():
+                self.refresh()
+    
+    def refresh(self):
+        """Reload lists, labels and members in one request; on failure the previous contents are kept"""
+        url = f"https://api.trello.com/1/boards/{os.getenv('TRELLO_BOARD_ID')}"
+        query = _board_query(lists='open', labels='all', labels_limit=1000, members='all')
+        
+        with self._lock:
+            try:
+                response = get_client().request("GET", url, params=query)
+            except requests.RequestException as e:
+                print(f"❌ Error loading board metadata: {str(e)}")
+                return False
+            
+            if response.status_code != 200:
+                print(f"❌ Failed to load board metadata: {response.text}")
+                return False
+            
+            self.replace(response.json())
+            return True
     
-    url = f"https://api.trello.com/1/boards/{trello_board_id}/lists"
+    def replace(self, board):
+        """Replace the metadata with the lists, labels and members of a nested board response"""
+        with self._lock:
+            self._board_id = board.get('id')
+            self._lists = {}
+            self._labels = {}
+            self._members = {}
+            self._list_ids = {}
+            self._label_ids = {}
+            self._member_ids = {}
+            for index in self._indexes.values():
+                index.clear()
+            for lst in board.get('lists', []):
+                self._add_list(lst)
+            for label in board.get('labels', []):
+                self._add_label(label)
+            for member in board.get('members', []):
+                self._members[member['id']] = member
+                for name in (member.get('fullName'), member.get('username')):
+                    if name:
+                        self._member_ids.setdefault(name.lower(), member['id'])
+                self._indexes['members'].add(member['id'], member.get('fullName') or member.get('username'))
+            self._resolve_fallback()
+            self._loaded_at = time.monotonic()
+    
+    def _add_list(self, lst):
+        """Index one list"""
+        self._lists[lst['id']] = lst
+        # The first list with a given name wins, as it did when lists were scanned in order
+        self._list_ids.setdefault(lst.get('name', '').lower(), lst['id'])
+        self._indexes['lists'].add(lst['id'], lst.get('name', ''))
+    
+    def _add_label(self, label):
+        """Index one label"""
+        self._labels[label['id']] = label
+        if label.get('name'):
+            self._label_ids.setdefault(label['name'].lower(), label['id'])
+            self._indexes['labels'].add(label['id'], label['name'])
+        else:
+            self._indexes['labels'].remove(label['id'])
+    
+    def _resolve_fallback(self):
+        """Work out the list create_card falls back to and forget memoized status resolutions"""
+        self._statuses = {}
+        self._fallback = (None, None)
+        for fallback in FALLBACK_STATUS_NAMES:
+            list_id = self._match(self._list_ids, fallback)
+            if list_id:
+                self._fallback = (list_id, fallback)
+                break
     
-    query = {
-        'key': trello_api_key,
-        'token': trello_token,
-        'fields': 'name,id'
-    }
+    @staticmethod
+    def _match(index, name):
+        """Return the ID for name: exact case-insensitive match first, then substring match"""
+        name = (name or '').lower()
+        if name in index:
+            return index[name]
+        for candidate, item_id in index.items():
+            if name in candidate:
+                return item_id
+        return None
     
-    response = requests.get(url, params=query)
+    def board_id(self):
+        """Return the full board ID, or None if the board could not be loaded"""
+        with self._lock:
+            self.ensure_current()
+            return self._board_id
+    
+    def lists(self):
+        """Return all open lists in board order"""
+        with self._lock:
+            self.ensure_current()
+            return list(self._lists.values())
+    
+    def labels(self):
+        """Return all labels on the board"""
+        with self._lock:
+            self.ensure_current()
+            return list(self._labels.values())
+    
+    def members(self):
+        """Return all board members"""
+        with self._lock:
+            self.ensure_current()
+            return list(self._members.values())
+    
+    def list_name(self, list_id):
+        """Return the name of a list, or None if it is not an open list on the board"""
+        with self._lock:
+            self.ensure_current()
+            lst = self._lists.get(list_id)
+            return lst.get('name') if lst else None
+    
+    def get_label(self, label_id):
+        """Return a label by ID, or None"""
+        with self._lock:
+            return self._labels.get(label_id)
+    
+    def list_id(self, list_name, partial=True):
+        """Return the ID of the list called list_name, or None"""
+        with self._lock:
+            self.ensure_current()
+            if not partial:
+                return self._list_ids.get((list_name or '').lower())
+            return self._match(self._list_ids, list_name)
+    
+    def label_id(self, label_name):
+        """Return the ID of the label called label_name, or None"""
+        with self._lock:
+            self.ensure_current()
+            return self._match(self._label_ids, label_name)
+    
+    def member_id(self, member_name):
+        """Return the ID of the member whose full name or username is member_name, or None"""
+        with self._lock:
+            self.ensure_current()
+            return self._member_ids.get((member_name or '').lower())
+    
+    def status_list(self, status):
+        """
+        Return the list a card with this status goes in.
+        
+        Returns:
+            tuple: (list ID, name of the fallback list used or None); the list ID
+            is None when neither the status nor any fallback has a list.
+        """
+        with self._lock:
+            self.ensure_current()
+            key = (status or '').lower()
+            if key not in self._statuses:
+                list_id = self._match(self._list_ids, status)
+                self._statuses[key] = (list_id, None) if list_id else self._fallback
+            return self._statuses[key]
+    
+    def search(self, kind, name, k=5):
+        """
+        Return the lists, labels or members whose names are closest to name.
+        
+        Args:
+            kind (str): 'lists', 'labels' or 'members'.
+            name (str): The name to look up.
+            k (int): Maximum number of results.
+        
+        Returns:
+            list: (ID, name, score) tuples, best first.
+        """
+        with self._lock:
+            self.ensure_current()
+            return self._indexes[kind].search(name, k)
+    
+    def upsert_label(self, label):
+        """Add a label returned by a create call"""
+        if not label or not label.get('id'):
+            return
+        with self._lock:
+            self._add_label(label)
+    
+    def upsert_list(self, lst):
+        """Add a list returned by a create call"""
+        if not lst or not lst.get('id'):
+            return
+        with self._lock:
+            if lst.get('closed'):
+                return
+            self._add_list(lst)
+            # A new list can change which list a status (or the fallback) resolves to
+            self._resolve_fallback()
+    
+    def _reindex(self):
+        """Rebuild the name indexes after a list or label was renamed or removed"""
+        self._list_ids = {}
+        self._label_ids = {}
+        for lst in list(self._lists.values()):
+            self._add_list(lst)
+        for label in list(self._labels.values()):
+            self._add_label(label)
+        for kind, items in (('lists', self._lists), ('labels', self._labels)):
+            for item_id in self._indexes[kind].keys():
+                if item_id not in items:
+                    self._indexes[kind].remove(item_id)
+        self._resolve_fallback()
+    
+    def apply_action(self, action):
+        """
+        Apply a list, label or board-member action delivered to the webhook.
+        
+        Returns:
+            bool: True if the action changed the metadata, False if it was ignored.
+        """
+        action_type = action.get('type')
+        data = action.get('data', {})
+        with self._lock:
+            if self._loaded_at is None:
+                # Nothing cached yet; the next load sees the change anyway
+                return False
+            
+            if action_type in ('createLabel', 'updateLabel'):
+                label = data.get('label', {})
+                if not label.get('id'):
+                    return False
+                self._labels[label['id']] = {**self._labels.get(label['id'], {}), **label}
+                self._reindex()
+                return True
+            
+            if action_type == 'deleteLabel':
+                self._labels.pop(data.get('label', {}).get('id'), None)
+                self._reindex()
+                return True
+            
+            if action_type in ('createList', 'updateList', 'moveListToBoard'):
+                lst = data.get('list', {})
+                if not lst.get('id'):
+                    return False
+                if lst.get('closed'):
+                    self._lists.pop(lst['id'], None)
+                else:
+                    self._lists[lst['id']] = {**self._lists.get(lst['id'], {}), **lst}
+                self._reindex()
+                return True
+            
+            if action_type == 'moveListFromBoard':
+                self._lists.pop(data.get('list', {}).get('id'), None)
+                self._reindex()
+                return True
+            
+            if action_type in ('addMemberToBoard', 'removeMemberFromBoard', 'makeNormalMemberOfBoard',
+                               'makeAdminOfBoard', 'updateMember'):
+                # Payloads carry too little of a member to index it; reload on next use
+                self._loaded_at = None
+                return True
+            
+            return False
     
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f"❌ Error fetching lists: {response.text}")
-        return []
+    def invalidate(self):
+        """Force the next read to reload from Trello"""
+        with self._lock:
+            self._loaded_at = None
 
-def fetch_board_members():
-    """Fetch all members of the Trello board"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    trello_board_id = os.getenv("TRELLO_BOARD_ID")
+_board_metadata = BoardMetadata()
+
+def get_board_metadata():
+    """Return the process-wide BoardMetadata"""
+    return _board_metadata
+
+class TrelloBoardSnapshot:
+    """
+    Process-wide in-memory copy of the Trello board.
+    
+    Loaded with a single nested request that returns the board's open cards,
+    open lists, labels, members and checklists, and indexed by ID. Lists, labels
+    and members are handed to BoardMetadata; cards and checklists are kept here.
+    Every reader in this module shares it, and our own card, label and checklist
+    writes are applied to it so it stays correct without refetching until the
+    TTL runs out or invalidate() is called.
+    
+    The checklists of a card the board load didn't include (one created by
+    someone else since) are fetched once on first use and cached like the rest.
+    Card, checklist and checklist item names are also kept in FuzzyIndexes for
+    search().
+    """
     
-    url = f"https://api.trello.com/1/boards/{trello_board_id}/members"
+    def __init__(self, ttl=TRELLO_SNAPSHOT_TTL):
+        """Initialize an empty snapshot"""
+        self.ttl = ttl
+        self._cards = {}         # card ID -> card, in board order
+        self._checklists = {}    # card ID -> checklists on that card, in card order
+        self._checklists_by_id = {}  # checklist ID -> checklist, with its checkItems
+        self._indexes = {'cards': FuzzyIndex(), 'checklists': FuzzyIndex(), 'items': FuzzyIndex()}
+        self._loaded_at = None
+        self._lock = threading.RLock()
+    
+    def is_fresh(self):
+        """Check whether the snapshot is loaded and within its TTL"""
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl
+    
+    def ensure_current(self):
+        """Reload the snapshot if it is stale"""
+        with self._lock:
+            if not self.is_fresh():
+                self.refresh()
+    
+    def refresh(self):
+        """Reload the whole board in one request; on failure the previous contents are kept"""
+        url = f"https://api.trello.com/1/boards/{os.getenv('TRELLO_BOARD_ID')}"
+        query = _board_query(
+            cards='open', lists='open', labels='all', labels_limit=1000, members='all', checklists='all'
+        )
+        
+        with self._lock:
+            try:
+                response = get_client().request("GET", url, params=query)
+            except requests.RequestException as e:
+                print(f"❌ Error loading board snapshot: {str(e)}")
+                return False
+            
+            if response.status_code != 200:
+                print(f"❌ Failed to load board snapshot: {response.text}")
+                return False
+            
+            self.replace(response.json())
+            return True
     
-    query = {
-        'key': trello_api_key,
-        'token': trello_token
-    }
+    def replace(self, board):
+        """Replace the snapshot contents with a nested board response"""
+        with self._lock:
+            self._cards = {card['id']: card for card in board.get('cards', [])}
+            self._indexes['cards'].replace({card_id: card.get('name', '') for card_id, card in self._cards.items()})
+            # Every loaded card's checklists are known, including cards with none
+            self._checklists = {card_id: [] for card_id in self._cards}
+            self._checklists_by_id = {}
+            self._indexes['checklists'].clear()
+            self._indexes['items'].clear()
+            for checklist in board.get('checklists', []):
+                self._add_checklist(checklist.get('idCard'), checklist)
+            self._loaded_at = time.monotonic()
+            get_board_metadata().replace(board)
+    
+    def cards(self):
+        """Return all open cards in board order"""
+        with self._lock:
+            self.ensure_current()
+            return list(self._cards.values())
+    
+    def checklists(self, card_id):
+        """
+        Return the checklists on a card, in card order.
+        
+        Returns:
+            list or None: The checklists, or None if they had to be fetched and
+            the request failed.
+        """
+        with self._lock:
+            self.ensure_current()
+            cached = self._checklists.get(card_id)
+            if cached is not None:
+                return list(cached)
+        
+        response = get_batcher().submit(f"/cards/{card_id}/checklists").result()
+        if response.status_code != 200:
+            print(f"❌ Failed to fetch checklists: {response.text}")
+            return None
+        
+        with self._lock:
+            self._checklists[card_id] = []
+            for checklist in response.json():
+                self._add_checklist(card_id, checklist)
+            return list(self._checklists[card_id])
+    
+    def checklist_items(self, checklist_id):
+        """
+        Return the items of a checklist, in checklist order.
+        
+        Returns:
+            list or None: The items, or None if the checklist had to be fetched
+            and the request failed.
+        """
+        with self._lock:
+            self.ensure_current()
+            checklist = self._checklists_by_id.get(checklist_id)
+        
+        if checklist is None:
+            response = get_batcher().submit(f"/checklists/{checklist_id}").result()
+            if response.status_code != 200:
+                print(f"❌ Failed to fetch checklist items: {response.text}")
+                return None
+            checklist = response.json()
+            with self._lock:
+                self._add_checklist(checklist.get('idCard'), checklist)
+        
+        with self._lock:
+            return sorted(checklist.get('checkItems', []), key=lambda item: item.get('pos', 0))
+    
+    def _add_checklist(self, card_id, checklist):
+        """Index one checklist; the caller holds the lock"""
+        checklist.setdefault('checkItems', [])
+        self._unindex_items(self._checklists_by_id.get(checklist['id']))
+        self._checklists_by_id[checklist['id']] = checklist
+        self._indexes['checklists'].add(checklist['id'], checklist.get('name', ''))
+        for item in checklist['checkItems']:
+            self._indexes['items'].add(item.get('id'), item.get('name', ''))
+        # Only extend a card's list when it is complete, so a partial list is never served
+        card_checklists = self._checklists.get(card_id)
+        if card_checklists is not None:
+            card_checklists[:] = [c for c in card_checklists if c['id'] != checklist['id']] + [checklist]
+            card_checklists.sort(key=lambda c: c.get('pos', 0))
+    
+    def _unindex_items(self, checklist):
+        """Drop a checklist's items from the item index; the caller holds the lock"""
+        for item in (checklist or {}).get('checkItems', []):
+            self._indexes['items'].remove(item.get('id'))
+    
+    def add_checklist(self, card_id, checklist):
+        """Write a checklist returned by a create call through to the cache"""
+        if not checklist or not checklist.get('id'):
+            return
+        with self._lock:
+            self._add_checklist(card_id, checklist)
+    
+    def remove_checklist(self, checklist_id):
+        """Drop a deleted checklist from the cache"""
+        with self._lock:
+            checklist = self._checklists_by_id.pop(checklist_id, None)
+            self._indexes['checklists'].remove(checklist_id)
+            if checklist is None:
+                return
+            self._unindex_items(checklist)
+            card_checklists = self._checklists.get(checklist.get('idCard'))
+            if card_checklists is not None:
+                card_checklists[:] = [c for c in card_checklists if c['id'] != checklist_id]
+    
+    def upsert_check_item(self, checklist_id, item):
+        """Write a checklist item returned by a create/update call through to the cache"""
+        if not item or not item.get('id'):
+            return
+        with self._lock:
+            checklist = self._checklists_by_id.get(checklist_id or item.get('idChecklist'))
+            if checklist is None:
+                return
+            items = checklist['checkItems']
+            for index, existing in enumerate(items):
+                if existing.get('id') == item['id']:
+                    items[index] = {**existing, **item}
+                    self._indexes['items'].add(item['id'], items[index].get('name', ''))
+                    return
+            items.append(item)
+            self._indexes['items'].add(item['id'], item.get('name', ''))
+    
+    def remove_check_item(self, checklist_id, item_id):
+        """Drop a deleted checklist item from the cache"""
+        with self._lock:
+            checklist = self._checklists_by_id.get(checklist_id)
+            if checklist is not None:
+                checklist['checkItems'] = [i for i in checklist['checkItems'] if i.get('id') != item_id]
+            self._indexes['items'].remove(item_id)
+    
+    def get_card(self, card_id):
+        """Return a cached card by ID, or None"""
+        with self._lock:
+            return self._cards.get(card_id)
+    
+    def upsert_card(self, card):
+        """Write a card returned by a create/update call through to the snapshot"""
+        if not card or not card.get('id'):
+            return
+        with self._lock:
+            if card.get('closed'):
+                self._cards.pop(card['id'], None)
+                self._indexes['cards'].remove(card['id'])
+                return
+            existing = self._cards.get(card['id'])
+            if existing is None and not card.get('idChecklists'):
+                # A card we just created has no checklists yet
+                self._checklists.setdefault(card['id'], [])
+            # Write responses omit some of the nested fields (e.g. labels on PUT)
+            self._cards[card['id']] = {**(existing or {}), **card}
+            self._indexes['cards'].add(card['id'], self._cards[card['id']].get('name', ''))
+    
+    def remove_card(self, card_id):
+        """Drop a deleted card and its checklists from the snapshot"""
+        with self._lock:
+            self._cards.pop(card_id, None)
+            self._indexes['cards'].remove(card_id)
+            for checklist in self._checklists.pop(card_id, None) or []:
+                self._checklists_by_id.pop(checklist['id'], None)
+                self._indexes['checklists'].remove(checklist['id'])
+                self._unindex_items(checklist)
+    
+    def add_card_label(self, card_id, label_id):
+        """Record that a label was added to a card"""
+        with self._lock:
+            card = self._cards.get(card_id)
+            if card is None:
+                return
+            if label_id not in card.setdefault('idLabels', []):
+                card['idLabels'].append(label_id)
+                label = get_board_metadata().get_label(label_id)
+                if label is not None:
+                    card.setdefault('labels', []).append(label)
+    
+    def remove_card_label(self, card_id, label_id):
+        """Record that a label was removed from a card"""
+        with self._lock:
+            card = self._cards.get(card_id)
+            if card is None:
+                return
+            card['idLabels'] = [i for i in card.get('idLabels', []) if i != label_id]
+            card['labels'] = [label for label in card.get('labels', []) if label.get('id') != label_id]
+    
+    def add_card_member(self, card_id, member_id):
+        """Record that a member was added to a card"""
+        with self._lock:
+            card = self._cards.get(card_id)
+            if card is None:
+                return False
+            if member_id not in card.setdefault('idMembers', []):
+                card['idMembers'].append(member_id)
+            return True
     
-    response = requests.get(url, params=query)
+    def remove_card_member(self, card_id, member_id):
+        """Record that a member was removed from a card"""
+        with self._lock:
+            card = self._cards.get(card_id)
+            if card is None:
+                return False
+            card['idMembers'] = [i for i in card.get('idMembers', []) if i != member_id]
+            return True
     
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f"❌ Failed to fetch board members: {response.text}")
-        return []
+    def apply_action(self, action):
+        """
+        Apply one Trello action, as delivered to the webhook, to the snapshot.
+        
+        List, label and member actions also go to BoardMetadata. Cards whose
+        action payload doesn't describe them fully (copies, conversions, cards
+        moved in from another board or reopened) are fetched once, as are
+        checklists copied from another one.
+        
+        Returns:
+            bool: True if the action changed cached state, False if it was ignored.
+        """
+        applied = get_board_metadata().apply_action(action)
+        action_type = action.get('type')
+        data = action.get('data', {})
+        card = data.get('card', {})
+        checklist_id = data.get('checklist', {}).get('id')
+        
+        with self._lock:
+            if self._loaded_at is None or not (card.get('id') or action_type in ('updateLabel', 'deleteLabel')):
+                # Nothing cached yet (the next load sees the change anyway), or not a card action
+                return applied
+            
+            refetch_card = action_type in ('copyCard', 'convertToCardFromCheckItem', 'moveCardToBoard') or (
+                action_type == 'updateCard' and card['id'] not in self._cards and not card.get('closed')
+            )
+            refetch_checklist = (
+                action_type == 'addChecklistToCard' and data.get('checklistSource')
+                and checklist_id not in self._checklists_by_id
+            )
+            if not refetch_card and not refetch_checklist:
+                return self._apply_action(action_type, data) or applied
+        
+        if refetch_checklist:
+            return self._refetch_checklist(card['id'], checklist_id)
+        if action_type == 'convertToCardFromCheckItem':
+            # The converted item is gone from its checklist; reload that checklist on next use
+            self._forget_checklist(checklist_id)
+        return self._refetch_card(card['id'])
+    
+    def _apply_action(self, action_type, data):
+        """Apply an action whose payload carries everything needed; the caller holds the lock"""
+        card = data.get('card', {})
+        checklist = data.get('checklist', {})
+        
+        if action_type == 'createCard':
+            if card.get('id') in self._cards:
+                return False
+            self._cards[card['id']] = {
+                'desc': '', 'due': None, 'closed': False, 'idLabels': [], 'labels': [], 'idMembers': [],
+                **card, 'idList': data.get('list', {}).get('id')
+            }
+            self._indexes['cards'].add(card['id'], card.get('name', ''))
+            self._checklists.setdefault(card['id'], [])
+            return True
+        
+        if action_type == 'updateCard':
+            if card.get('closed'):
+                self.remove_card(card['id'])
+                return True
+            # The payload holds the changed fields; listAfter is set when the card moved
+            changes = dict(card)
+            if data.get('listAfter'):
+                changes['idList'] = data['listAfter']['id']
+            self.upsert_card(changes)
+            return True
+        
+        if action_type in ('deleteCard', 'moveCardFromBoard'):
+            self.remove_card(card.get('id'))
+            return True
+        
+        if action_type in ('addLabelToCard', 'removeLabelFromCard'):
+            label = data.get('label', {})
+            if get_board_metadata().get_label(label.get('id')) is None:
+                get_board_metadata().upsert_label(label)
+            if action_type == 'addLabelToCard':
+                self.add_card_label(card.get('id'), label.get('id'))
+            else:
+                self.remove_card_label(card.get('id'), label.get('id'))
+            return True
+        
+        if action_type in ('updateLabel', 'deleteLabel'):
+            label = data.get('label', {})
+            for cached in self._cards.values():
+                if label.get('id') not in cached.get('idLabels', []):
+                    continue
+                if action_type == 'deleteLabel':
+                    self.remove_card_label(cached['id'], label['id'])
+                else:
+                    cached['labels'] = [
+                        {**existing, **label} if existing.get('id') == label['id'] else existing
+                        for existing in cached.get('labels', [])
+                    ]
+            return True
+        
+        if action_type in ('addMemberToCard', 'removeMemberFromCard'):
+            member_id = data.get('idMember') or data.get('member', {}).get('id')
+            if not member_id:
+                return False
+            if action_type == 'addMemberToCard':
+                return self.add_card_member(card.get('id'), member_id)
+            return self.remove_card_member(card.get('id'), member_id)
+        
+        if action_type == 'addChecklistToCard':
+            if checklist.get('id') in self._checklists_by_id:
+                return False
+            siblings = self._checklists.get(card.get('id')) or []
+            self._add_checklist(card.get('id'), {
+                'checkItems': [], 'pos': max([c.get('pos', 0) for c in siblings] or [0]) + 1,
+                **checklist, 'idCard': card.get('id')
+            })
+            return True
+        
+        if action_type == 'removeChecklistFromCard':
+            self.remove_checklist(checklist.get('id'))
+            return True
+        
+        if action_type == 'updateChecklist':
+            cached = self._checklists_by_id.get(checklist.get('id'))
+            if cached is None:
+                return False
+            cached.update(checklist)
+            self._indexes['checklists'].add(cached['id'], cached.get('name', ''))
+            card_checklists = self._checklists.get(cached.get('idCard'))
+            if card_checklists is not None:
+                card_checklists.sort(key=lambda c: c.get('pos', 0))
+            return True
+        
+        if action_type in ('createCheckItem', 'updateCheckItem', 'updateCheckItemStateOnCard'):
+            cached = self._checklists_by_id.get(checklist.get('id'))
+            item = data.get('checkItem', {})
+            if cached is None or not item.get('id'):
+                return False
+            if 'pos' not in item and not any(i.get('id') == item['id'] for i in cached['checkItems']):
+                # New items go to the bottom unless the payload says otherwise
+                item = {**item, 'pos': max([i.get('pos', 0) for i in cached['checkItems']] or [0]) + 1}
+            self.upsert_check_item(checklist['id'], {**item, 'idChecklist': checklist['id']})
+            return True
+        
+        if action_type == 'deleteCheckItem':
+            self.remove_check_item(checklist.get('id'), data.get('checkItem', {}).get('id'))
+            return True
+        
+        return False
+    
+    def search(self, kind, name, k=5, ids=None):
+        """
+        Return the cards, checklists or checklist items whose names are closest to name.
+        
+        Args:
+            kind (str): 'cards', 'checklists' or 'items'.
+            name (str): The name to look up.
+            k (int): Maximum number of results.
+            ids (iterable): Optional IDs to restrict the search to, e.g. the
+                checklists of one card.
+        
+        Returns:
+            list: (ID, name, score) tuples, best first.
+        """
+        with self._lock:
+            self.ensure_current()
+            return self._indexes[kind].search(name, k, keys=ids)
+    
+    def _refetch_card(self, card_id):
+        """Load one card and its checklists into the snapshot"""
+        response = get_batcher().submit(f"/cards/{card_id}", {'checklists': 'all'}).result()
+        if response.status_code != 200:
+            print(f"❌ Failed to fetch card {card_id}: {response.text}")
+            return False
+        
+        card = response.json()
+        checklists = card.pop('checklists', [])
+        with self._lock:
+            if card.get('closed'):
+                self.remove_card(card_id)
+                return True
+            self._cards[card_id] = card
+            self._indexes['cards'].add(card_id, card.get('name', ''))
+            self._checklists[card_id] = []
+            for checklist in checklists:
+                self._add_checklist(card_id, checklist)
+        return True
+    
+    def _refetch_checklist(self, card_id, checklist_id):
+        """Load one checklist, with its items, into the snapshot"""
+        response = get_batcher().submit(f"/checklists/{checklist_id}").result()
+        if response.status_code != 200:
+            print(f"❌ Failed to fetch checklist {checklist_id}: {response.text}")
+            return False
+        self.add_checklist(card_id, response.json())
+        return True
+    
+    def _forget_checklist(self, checklist_id):
+        """
+        Drop a checklist's cached items so the next read fetches them.
+        
+        Its card's checklist list is dropped too, rather than left holding the
+        stale entry or served without it, so checklists() reloads it whole.
+        """
+        with self._lock:
+            checklist = self._checklists_by_id.pop(checklist_id, None)
+            if checklist is not None:
+                self._checklists.pop(checklist.get('idCard'), None)
+                self._unindex_items(checklist)
+    
+    def invalidate(self):
+        """Force the next read to reload from Trello"""
+        with self._lock:
+            self._loaded_at = None
+
+_board_snapshot = TrelloBoardSnapshot()
+
+def get_board_snapshot():
+    """Return the process-wide TrelloBoardSnapshot"""
+    return _board_snapshot
+
+TRELLO_BATCH_WINDOW = 0.02  # seconds a read waits for others to share its batch call
+TRELLO_BATCH_LIMIT = 10     # URLs Trello accepts in one /1/batch request
+
+class BatchResponse:
+    """One sub-response of a /1/batch call, shaped like the requests.Response fields callers use"""
+    
+    def __init__(self, status_code, body):
+        """Wrap a status code and parsed JSON body"""
+        self.status_code = status_code
+        self._body = body
+    
+    @property
+    def text(self):
+        """The body re-serialized as JSON text"""
+        return json.dumps(self._body)
+    
+    def json(self):
+        """The parsed body"""
+        return self._body
+
+class TrelloBatcher:
+    """
+    Coalesces independent GETs into Trello /1/batch calls.
+    
+    submit() queues a read and returns a Future. Reads queued within the batch
+    window (or as soon as TRELLO_BATCH_LIMIT are waiting) go out together, and
+    each Future resolves to a response with status_code, text and json(). A
+    batch holding a single read is sent as a plain GET.
+    """
+    
+    def __init__(self, window=TRELLO_BATCH_WINDOW, limit=TRELLO_BATCH_LIMIT):
+        """Initialize an empty queue"""
+        self.window = window
+        self.limit = limit
+        self._pending = []  # (relative URL, Future)
+        self._timer = None
+        self._lock = threading.Lock()
+    
+    def submit(self, path, params=None):
+        """
+        Queue a GET of an API path such as "/cards/{id}/checklists".
+        
+        Returns:
+            Future: Resolves to the response, or raises the request's exception.
+        """
+        future = Future()
+        url = path + ('?' + urlencode(params) if params else '')
+        ready = None
+        with self._lock:
+            self._pending.append((url, future))
+            if len(self._pending) >= self.limit:
+                ready = self._take()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if ready:
+            self._send(ready)
+        return future
+    
+    def get_many(self, paths):
+        """Fetch several paths with as few calls as possible and return their responses in order"""
+        futures = [self.submit(path) for path in paths]
+        self.flush()
+        return [future.result() for future in futures]
+    
+    def _take(self):
+        """Remove up to one batch of queued reads; the caller holds the lock"""
+        ready, self._pending = self._pending[:self.limit], self._pending[self.limit:]
+        if not self._pending and self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return ready
+    
+    def flush(self):
+        """Send everything queued now"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            batches = []
+            while self._pending:
+                batches.append(self._take())
+        for batch in batches:
+            self._send(batch)
+    
+    def _send(self, batch):
+        """Send one batch and resolve its futures"""
+        try:
+            if len(batch) == 1:
+                url, future = batch[0]
+                future.set_result(get_client().request("GET", url))
+                return
+            
+            query = {'urls': ','.join(url for url, _ in batch)}
+            response = get_client().request("GET", "/batch", params=query)
+            
+            if response.status_code != 200:
+                print(f"❌ Batch request failed: {response.text}")
+                for _, future in batch:
+                    future.set_result(BatchResponse(response.status_code, {'message': response.text}))
+                return
+            
+            results = response.json()
+            for index, (_, future) in enumerate(batch):
+                result = results[index] if index < len(results) else {}
+                if '200' in result:
+                    future.set_result(BatchResponse(200, result['200']))
+                else:
+                    # Failed sub-requests come back as an error object with their status code
+                    future.set_result(BatchResponse(result.get('statusCode', 500), result))
+        except Exception as e:
+            # Whatever went wrong, no caller may be left waiting on its future
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
 
-def fetch_labels():
-    """Fetch all labels from the Trello board"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    trello_board_id = os.getenv("TRELLO_BOARD_ID")
+_batcher = TrelloBatcher()
+
+def get_batcher():
+    """Return the process-wide TrelloBatcher"""
+    return _batcher
+
+TRELLO_WEBHOOK_HOST = "127.0.0.1"
+TRELLO_WEBHOOK_PORT = 8765
+TRELLO_WEBHOOK_SNAPSHOT_TTL = 3600  # seconds; a full reload only as a safety net for missed deliveries
+
+class TrelloWebhookReceiver:
+    """
+    Local HTTP endpoint that keeps the board snapshot current from Trello webhooks.
     
-    url = f"https://api.trello.com/1/boards/{trello_board_id}/labels"
+    Trello POSTs every action on the board to the callback URL (which must be
+    publicly reachable, e.g. through a tunnel to this port), and each action is
+    applied to the snapshot and metadata in place. While it runs, the snapshot
+    TTL is stretched to TRELLO_WEBHOOK_SNAPSHOT_TTL. If a secret (the Trello app
+    secret) is given, requests without a valid X-Trello-Webhook signature are
+    rejected.
     
-    query = {
-        'key': trello_api_key,
-        'token': trello_token
-    }
+    Recorded payloads can be POSTed to it directly; start(register=False) skips
+    the webhook registration.
+    """
     
-    response = requests.get(url, params=query)
+    def __init__(self, host=TRELLO_WEBHOOK_HOST, port=TRELLO_WEBHOOK_PORT, callback_url=None, secret=None):
+        """Initialize the receiver; nothing listens until start()"""
+        self.host = host
+        self.port = port
+        self.callback_url = callback_url
+        self.secret = secret
+        self.webhook_id = None
+        self.received = 0
+        self.applied = 0
+        self._server = None
+        self._thread = None
+        self._ttls = None
+    
+    @property
+    def address(self):
+        """The (host, port) the server listens on"""
+        return self._server.server_address if self._server else (self.host, self.port)
+    
+    def start(self, register=True):
+        """
+        Start listening and, if register is set, register the webhook with Trello.
+        
+        Returns:
+            bool: True if the receiver is running.
+        """
+        receiver = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_HEAD(self):
+                # Trello checks the callback URL with a HEAD request when the webhook is created
+                self.send_response(200)
+                self.end_headers()
+            
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                status = receiver.handle_request(body, self.headers.get('X-Trello-Webhook'))
+                self.send_response(status)
+                self.end_headers()
+            
+            def log_message(self, format, *args):
+                pass
+        
+        try:
+            self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        except OSError as e:
+            print(f"❌ Could not start the Trello webhook receiver on {self.host}:{self.port}: {str(e)}")
+            return False
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        
+        snapshot, metadata = get_board_snapshot(), get_board_metadata()
+        self._ttls = (snapshot.ttl, metadata.ttl)
+        snapshot.ttl = metadata.ttl = TRELLO_WEBHOOK_SNAPSHOT_TTL
+        print(f"✅ Trello webhook receiver listening on {self.address[0]}:{self.address[1]}")
+        
+        if register and not self.register():
+            self.stop()
+            return False
+        return True
     
-    if response.status_code == 200:
-        labels = response.json()
-        return [label.get('name') for label in labels if label.get('name')]
-    else:
-        print(f"❌ Failed to fetch labels: {response.text}")
-        return []
+    def register(self):
+        """Register the callback URL as a webhook on the board"""
+        if not self.callback_url:
+            print("❌ No callback URL set for the Trello webhook")
+            return False
+        
+        query = {
+            'callbackURL': self.callback_url,
+            'idModel': get_full_board_id(),
+            'description': 'Board snapshot updates'
+        }
+        try:
+            response = get_client().request("POST", "/webhooks", params=query)
+        except requests.RequestException as e:
+            print(f"❌ Error registering Trello webhook: {str(e)}")
+            return False
+        
+        if response.status_code == 200:
+            self.webhook_id = response.json().get('id')
+            print(f"✅ Registered Trello webhook for {self.callback_url}")
+            return True
+        if 'already exists' in response.text:
+            # A webhook from an earlier run still points here, so deliveries already arrive
+            print(f"ℹ️ Trello webhook for {self.callback_url} already registered")
+            return True
+        print(f"❌ Failed to register Trello webhook: {response.text}")
+        return False
+    
+    def handle_request(self, body, signature=None):
+        """
+        Verify and apply one webhook delivery.
+        
+        Returns:
+            int: The HTTP status to answer with.
+        """
+        if self.secret:
+            content = body + (self.callback_url or '').encode('utf-8')
+            expected = base64.b64encode(hmac.new(self.secret.encode('utf-8'), content, hashlib.sha1).digest()).decode()
+            if not signature or not hmac.compare_digest(signature, expected):
+                print("⚠️ Rejected Trello webhook delivery with a bad signature")
+                return 401
+        
+        try:
+            payload = json.loads(body or b'{}')
+        except ValueError:
+            return 400
+        
+        self.handle_payload(payload)
+        return 200
+    
+    def handle_payload(self, payload):
+        """Apply the action in a webhook payload to the board snapshot"""
+        action = payload.get('action')
+        if not action:
+            return False
+        self.received += 1
+        try:
+            applied = get_board_snapshot().apply_action(action)
+        except Exception as e:
+            # A payload we couldn't apply may have left the cache inconsistent
+            print(f"⚠️ Could not apply Trello {action.get('type')} action, reloading the board: {str(e)}")
+            get_board_snapshot().invalidate()
+            return False
+        if applied:
+            self.applied += 1
+        return applied
+    
+    def stop(self):
+        """Delete the webhook, stop listening and restore the snapshot TTLs"""
+        if self.webhook_id:
+            try:
+                get_client().request("DELETE", f"/webhooks/{self.webhook_id}")
+            except requests.RequestException as e:
+                print(f"⚠️ Could not delete Trello webhook {self.webhook_id}: {str(e)}")
+            self.webhook_id = None
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._ttls:
+            get_board_snapshot().ttl, get_board_metadata().ttl = self._ttls
+            self._ttls = None
+
+def start_webhook_receiver():
+    """
+    Start a webhook receiver if TRELLO_WEBHOOK_URL is set.
+    
+    TRELLO_WEBHOOK_URL is the public URL Trello should call, TRELLO_WEBHOOK_PORT
+    the local port it forwards to, and TRELLO_API_SECRET (optional) enables
+    signature checks. The webhook is deleted again when the process exits.
+    
+    Returns:
+        TrelloWebhookReceiver or None: The running receiver, or None if disabled or it failed to start.
+    """
+    callback_url = os.getenv("TRELLO_WEBHOOK_URL")
+    if not callback_url:
+        return None
+    
+    receiver = TrelloWebhookReceiver(
+        host=os.getenv("TRELLO_WEBHOOK_HOST", TRELLO_WEBHOOK_HOST),
+        port=int(os.getenv("TRELLO_WEBHOOK_PORT", TRELLO_WEBHOOK_PORT)),
+        callback_url=callback_url,
+        secret=os.getenv("TRELLO_API_SECRET")
+    )
+    if not receiver.start():
+        return None
+    atexit.register(receiver.stop)
+    return receiver
+
+def fetch_cards():
+    """Fetch all cards from Trello"""
+    return get_board_snapshot().cards()
+
+def fetch_lists():
+    """Fetch all lists from Trello board"""
+    return [{'id': lst['id'], 'name': lst.get('name', '')} for lst in get_board_metadata().lists()]
+
+def fetch_board_members():
+    """Fetch all members of the Trello board"""
+    return get_board_metadata().members()
+
+def fetch_labels():
+    """Fetch all labels from the Trello board"""
+    return [label.get('name') for label in get_board_metadata().labels() if label.get('name')]
 
 def format_board_state(cards):
     """Format the current board state for the AI prompt"""
     if not cards:
         return "No cards found on the board."
     
+    metadata = get_board_metadata()
+    list_names = {}
+    
+    # Cards in archived lists need the list fetched; do all of them in batch calls
+    missing = list({card.get("idList", "") for card in cards if metadata.list_name(card.get("idList", "")) is None})
+    if missing:
+        responses = get_batcher().get_many([f"/lists/{list_id}" for list_id in missing])
+        for list_id, response in zip(missing, responses):
+            if response.status_code == 200:
+                list_names[list_id] = response.json().get("name", "Unknown List")
+            else:
+                list_names[list_id] = "Unknown List"
+    
     formatted_cards = []
     for card in cards:
+        list_id = card.get("idList", "")
         card_info = {
             "name": card.get("name", "Unnamed Card"),
             "description": card.get("desc", "No description"),
-            "status": get_list_name_by_id(card.get("idList", "")),
+            "status": metadata.list_name(list_id) or list_names.get(list_id, "Unknown List"),
             "due_date": card.get("due", "No due date"),
             "labels": [label.get("name", "Unnamed Label") for label in card.get("labels", [])]
         }
@@ -113,17 +1389,12 @@ def format_board_state(cards):
 
 def get_list_name_by_id(list_id):
     """Get the name of a list by its ID"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
+    name = get_board_metadata().list_name(list_id)
+    if name is not None:
+        return name
     
-    url = f"https://api.trello.com/1/lists/{list_id}"
-    
-    query = {
-        'key': trello_api_key,
-        'token': trello_token
-    }
-    
-    response = requests.get(url, params=query)
+    # Cards can sit in lists that are archived, which the metadata doesn't load
+    response = get_batcher().submit(f"/lists/{list_id}").result()
     
     if response.status_code == 200:
         return response.json().get("name", "Unknown List")
@@ -132,34 +1403,7 @@ def get_list_name_by_id(list_id):
 
 def get_list_id_by_name(list_name):
     """Get the ID of a list by its name"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    trello_board_id = os.getenv("TRELLO_BOARD_ID")
-    
-    url = f"https://api.trello.com/1/boards/{trello_board_id}/lists"
-    
-    query = {
-        'key': trello_api_key,
-        'token': trello_token
-    }
-    
-    response = requests.get(url, params=query)
-    
-    if response.status_code == 200:
-        lists = response.json()
-        for lst in lists:
-            if lst.get("name", "").lower() == list_name.lower():
-                return lst.get("id")
-        
-        # If no exact match, try partial match
-        for lst in lists:
-            if list_name.lower() in lst.get("name", "").lower():
-                return lst.get("id")
-        
-        return None
-    else:
-        print(f"❌ Failed to fetch lists: {response.text}")
-        return None
+    return get_board_metadata().list_id(list_name)
 
 def find_card_by_name(card_name):
     """Find a card by its name"""
@@ -178,68 +1422,18 @@ def find_card_by_name(card_name):
 
 def get_full_board_id():
     """Get the full board ID from the short ID in the URL"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    short_board_id = os.getenv("TRELLO_BOARD_ID")
-    
-    # Try to get the full board ID from the short ID
-    url = f"https://api.trello.com/1/boards/{short_board_id}"
-    query = {
-        'key': trello_api_key,
-        'token': trello_token
-    }
-    
-    try:
-        response = requests.get(url, params=query)
-        if response.status_code == 200:
-            board_data = response.json()
-            full_id = board_data.get('id')
-            print(f"✅ Retrieved full board ID: {full_id}")
-            return full_id
-        else:
-            print(f"❌ Failed to get full board ID: {response.text}")
-            return short_board_id  # Fall back to short ID if we can't get the full ID
-    except Exception as e:
-        print(f"❌ Exception getting full board ID: {str(e)}")
-        return short_board_id  # Fall back to short ID if we can't get the full ID
+    full_id = get_board_metadata().board_id()
+    if full_id:
+        return full_id
+    print("❌ Failed to get full board ID")
+    return os.getenv("TRELLO_BOARD_ID")  # Fall back to short ID if we can't get the full ID
 
 def find_label_by_name(label_name):
     """Find a label by its name"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    trello_board_id = os.getenv("TRELLO_BOARD_ID")
-    
-    url = f"https://api.trello.com/1/boards/{trello_board_id}/labels"
-    
-    query = {
-        'key': trello_api_key,
-        'token': trello_token
-    }
-    
-    response = requests.get(url, params=query)
-    
-    if response.status_code == 200:
-        labels = response.json()
-        
-        for label in labels:
-            if label.get("name", "").lower() == label_name.lower():
-                return label.get("id")
-        
-        # If no exact match, try partial match
-        for label in labels:
-            if label_name.lower() in label.get("name", "").lower():
-                return label.get("id")
-        
-        return None
-    else:
-        print(f"❌ Failed to fetch labels: {response.text}")
-        return None
+    return get_board_metadata().label_id(label_name)
 
 def create_label(label_data):
     """Create a new label in Trello"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    
     # Extract the label name from the data
     label_name = label_data.get('epic')
     if not label_name:
@@ -261,15 +1455,14 @@ def create_label(label_data):
     query = {
         'name': label_name,
         'color': color,
-        'idBoard': full_board_id,
-        'key': trello_api_key,
-        'token': trello_token
+        'idBoard': full_board_id
     }
     
     try:
-        response = requests.request("POST", url, params=query)
+        response = get_client().request("POST", url, params=query)
         
         if response.status_code == 200:
+            get_board_metadata().upsert_label(response.json())
             print(f"✅ Created label: {label_name}")
             return True
         else:
@@ -282,20 +1475,16 @@ def create_label(label_data):
 
 def add_label_to_card(card_id, label_id):
     """Add a label to a card"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    
     url = f"https://api.trello.com/1/cards/{card_id}/idLabels"
     
     query = {
-        'key': trello_api_key,
-        'token': trello_token,
         'value': label_id
     }
     
-    response = requests.request("POST", url, params=query)
+    response = get_client().request("POST", url, params=query)
     
     if response.status_code == 200:
+        get_board_snapshot().add_card_label(card_id, label_id)
         return True
     else:
         print(f"❌ Failed to add label to card: {response.text}")
@@ -303,19 +1492,12 @@ def add_label_to_card(card_id, label_id):
 
 def remove_label_from_card(card_id, label_id):
     """Remove a label from a card"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    
     url = f"https://api.trello.com/1/cards/{card_id}/idLabels/{label_id}"
     
-    query = {
-        'key': trello_api_key,
-        'token': trello_token
-    }
-    
-    response = requests.delete(url, params=query)
+    response = get_client().request("DELETE", url)
     
     if response.status_code == 200:
+        get_board_snapshot().remove_card_label(card_id, label_id)
         return True
     else:
         print(f"❌ Failed to remove label from card: {response.text}")
@@ -323,14 +1505,11 @@ def remove_label_from_card(card_id, label_id):
 
 def assign_label_to_card(task_data):
     """Assign a label to a card in Trello"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    
     # Find the card by name
     card_id = find_card_by_name(task_data.get('task', ''))
     
     if not card_id:
-        print(f"❌ Card not found: {task_data.get('task')}")
+        print(f"❌ Card not found: {task_data.get('task')}{_not_found_hint('cards', task_data.get('task'))}")
         return False
     
     # Find the label by name
@@ -356,32 +1535,21 @@ def assign_label_to_card(task_data):
 
 def create_card(task_data):
     """Create a new card in Trello"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    
     # Get the list ID for the status
     status = task_data.get('status', 'Not started')
-    list_id = get_list_id_by_name(status)
+    list_id, fallback = get_board_metadata().status_list(status)
     
-    if not list_id:
+    if fallback:
         print(f"❌ List not found for status: {status}")
-        # Try with alternative names as fallbacks
-        fallback_names = ['To Do', 'Not Started', 'Backlog', 'Todo']
-        for fallback in fallback_names:
-            list_id = get_list_id_by_name(fallback)
-            if list_id:
-                print(f"✅ Using '{fallback}' list instead")
-                break
-        
-        if not list_id:
-            return False
+        print(f"✅ Using '{fallback}' list instead")
+    elif not list_id:
+        print(f"❌ List not found for status: {status}")
+        return False
     
     # Create the card
     url = "https://api.trello.com/1/cards"
     
     query = {
-        'key': trello_api_key,
-        'token': trello_token,
         'idList': list_id,
         'name': task_data.get('task', 'Unnamed Task'),
         'desc': task_data.get('description', '')
@@ -415,10 +1583,12 @@ def create_card(task_data):
             except ValueError:
                 print(f"❌ Invalid deadline format: {task_data['deadline']}")
     
-    response = requests.post(url, params=query)
+    response = get_client().request("POST", url, params=query)
     
     if response.status_code == 200:
-        card_id = response.json().get('id')
+        card = response.json()
+        get_board_snapshot().upsert_card(card)
+        card_id = card.get('id')
         
         # Assign label if provided
         if 'epic' in task_data and task_data['epic']:
@@ -441,23 +1611,17 @@ def create_card(task_data):
 
 def update_card(task_data):
     """Update a card in Trello"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    
     # Find the card by name
     card_id = find_card_by_name(task_data.get('task', ''))
     
     if not card_id:
-        print(f"❌ Card not found: {task_data.get('task')}")
+        print(f"❌ Card not found: {task_data.get('task')}{_not_found_hint('cards', task_data.get('task'))}")
         return False
     
     # Update the card
     url = f"https://api.trello.com/1/cards/{card_id}"
     
-    query = {
-        'key': trello_api_key,
-        'token': trello_token
-    }
+    query = {}
     
     # Add fields to update
     if 'description' in task_data:
@@ -498,9 +1662,11 @@ def update_card(task_data):
             except ValueError:
                 print(f"❌ Invalid deadline format: {task_data['deadline']}")
     
-    response = requests.put(url, params=query)
+    response = get_client().request("PUT", url, params=query)
     
     if response.status_code == 200:
+        get_board_snapshot().upsert_card(response.json())
+        
         # Assign label if provided
         if 'epic' in task_data and task_data['epic']:
             assign_label_to_card({
@@ -522,26 +1688,21 @@ def update_card(task_data):
 
 def add_comment_to_card(task_data):
     """Add a comment to a card in Trello"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    
     # Find the card by name
     card_id = find_card_by_name(task_data.get('task', ''))
     
     if not card_id:
-        print(f"❌ Card not found: {task_data.get('task')}")
+        print(f"❌ Card not found: {task_data.get('task')}{_not_found_hint('cards', task_data.get('task'))}")
         return False
     
     # Add comment to the card
     url = f"https://api.trello.com/1/cards/{card_id}/actions/comments"
     
     query = {
-        'key': trello_api_key,
-        'token': trello_token,
         'text': task_data.get('comment', '')
     }
     
-    response = requests.post(url, params=query)
+    response = get_client().request("POST", url, params=query)
     
     if response.status_code == 200:
         print(f"✅ Added comment to card: {task_data.get('task')}")
@@ -552,27 +1713,20 @@ def add_comment_to_card(task_data):
 
 def delete_card(task_data):
     """Delete a card in Trello"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    
     # Find the card by name
     card_id = find_card_by_name(task_data.get('task', ''))
     
     if not card_id:
-        print(f"❌ Card not found: {task_data.get('task')}")
+        print(f"❌ Card not found: {task_data.get('task')}{_not_found_hint('cards', task_data.get('task'))}")
         return False
     
     # Delete the card
     url = f"https://api.trello.com/1/cards/{card_id}"
     
-    query = {
-        'key': trello_api_key,
-        'token': trello_token
-    }
-    
-    response = requests.delete(url, params=query)
+    response = get_client().request("DELETE", url)
     
     if response.status_code == 200:
+        get_board_snapshot().remove_card(card_id)
         return True
     else:
         print(f"❌ Failed to delete card: {response.text}")
@@ -580,28 +1734,24 @@ def delete_card(task_data):
 
 def rename_card(task_data):
     """Rename a card in Trello"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    
     # Find the card by name
     card_id = find_card_by_name(task_data.get('old_name', ''))
     
     if not card_id:
-        print(f"❌ Card not found: {task_data.get('old_name')}")
+        print(f"❌ Card not found: {task_data.get('old_name')}{_not_found_hint('cards', task_data.get('old_name'))}")
         return False
     
     # Rename the card
     url = f"https://api.trello.com/1/cards/{card_id}"
     
     query = {
-        'key': trello_api_key,
-        'token': trello_token,
         'name': task_data.get('new_name', '')
     }
     
-    response = requests.put(url, params=query)
+    response = get_client().request("PUT", url, params=query)
     
     if response.status_code == 200:
+        get_board_snapshot().upsert_card(response.json())
         return True
     else:
         print(f"❌ Failed to rename card: {response.text}")
@@ -609,67 +1759,38 @@ def rename_card(task_data):
 
 def get_member_id_by_name(member_name):
     """Get a member ID by name"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    trello_board_id = os.getenv("TRELLO_BOARD_ID")
-    
-    url = f"https://api.trello.com/1/boards/{trello_board_id}/members"
-    
-    query = {
-        'key': trello_api_key,
-        'token': trello_token
-    }
-    
-    response = requests.get(url, params=query)
-    
-    if response.status_code == 200:
-        members = response.json()
-        
-        # Try to find a member with a matching name (case-insensitive)
-        for member in members:
-            full_name = member.get('fullName', '')
-            username = member.get('username', '')
-            
-            if (full_name.lower() == member_name.lower() or 
-                username.lower() == member_name.lower()):
-                return member.get('id')
-        
+    # Matches the full name or username, case-insensitively
+    member_id = get_board_metadata().member_id(member_name)
+    if not member_id:
         print(f"❌ Member not found: {member_name}")
-        return None
-    else:
-        print(f"❌ Failed to fetch board members: {response.text}")
-        return None
+    return member_id
 
 def assign_member_to_card(task_data):
     """Assign a member to a card in Trello"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    
     # Find the card by name
     card_id = find_card_by_name(task_data.get('task', ''))
     
     if not card_id:
-        print(f"❌ Card not found: {task_data.get('task')}")
+        print(f"❌ Card not found: {task_data.get('task')}{_not_found_hint('cards', task_data.get('task'))}")
         return False
     
     # Find the member by name
     member_id = get_member_id_by_name(task_data.get('member', ''))
     
     if not member_id:
-        print(f"❌ Member not found: {task_data.get('member')}")
+        print(f"❌ Member not found: {task_data.get('member')}{_not_found_hint('members', task_data.get('member'))}")
         return False
     
     url = f"https://api.trello.com/1/cards/{card_id}/idMembers"
     
     query = {
-        'key': trello_api_key,
-        'token': trello_token,
         'value': member_id
     }
     
-    response = requests.post(url, params=query)
+    response = get_client().request("POST", url, params=query)
     
     if response.status_code == 200:
+        get_board_snapshot().add_card_member(card_id, member_id)
         print(f"✅ Member assigned to card: {task_data.get('member')} → {task_data.get('task')}")
         return True
     else:
@@ -678,33 +1799,26 @@ def assign_member_to_card(task_data):
 
 def remove_member_from_card(task_data):
     """Remove a member from a card in Trello"""
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    
     # Find the card by name
     card_id = find_card_by_name(task_data.get('task', ''))
     
     if not card_id:
-        print(f"❌ Card not found: {task_data.get('task')}")
+        print(f"❌ Card not found: {task_data.get('task')}{_not_found_hint('cards', task_data.get('task'))}")
         return False
     
     # Find the member by name
     member_id = get_member_id_by_name(task_data.get('member', ''))
     
     if not member_id:
-        print(f"❌ Member not found: {task_data.get('member')}")
+        print(f"❌ Member not found: {task_data.get('member')}{_not_found_hint('members', task_data.get('member'))}")
         return False
     
     url = f"https://api.trello.com/1/cards/{card_id}/idMembers/{member_id}"
     
-    query = {
-        'key': trello_api_key,
-        'token': trello_token
-    }
-    
-    response = requests.delete(url, params=query)
+    response = get_client().request("DELETE", url)
     
     if response.status_code == 200:
+        get_board_snapshot().remove_card_member(card_id, member_id)
         print(f"✅ Member removed from card: {task_data.get('member')} ← {task_data.get('task')}")
         return True
     else:
@@ -712,7 +1826,10 @@ def remove_member_from_card(task_data):
         return False
 
 # New function for creating checklists
-def create_checklist(card_id, checklist_name, items):
+TRELLO_CHECKLIST_WORKERS = 6
+CHECKLIST_POS_STEP = 16384  # the spacing Trello itself uses between positions
+
+def create_checklist(card_id, checklist_name, items, source_checklist_id=None, item_results=None):
     """
     Create a checklist in a Trello card.
 
@@ -720,61 +1837,103 @@ def create_checklist(card_id, checklist_name, items):
         card_id (str): The ID of the Trello card.
         checklist_name (str): The name of the checklist.
         items (list): A list of items to add to the checklist.
+        source_checklist_id (str): Optional ID of a checklist to copy, items included,
+            before the new items are added.
+        item_results (list): Optional list that receives one entry per item
+            (see populate_checklist).
 
     Returns:
-        bool: True if the checklist was created successfully, False otherwise.
+        bool: True if the checklist and all of its items were created successfully, False otherwise.
     """
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-
     # Create the checklist
     url = f"https://api.trello.com/1/cards/{card_id}/checklists"
     query = {
-        'key': trello_api_key,
-        'token': trello_token,
         'name': checklist_name
     }
+    if source_checklist_id:
+        query['idChecklistSource'] = source_checklist_id
 
-    response = requests.post(url, params=query)
+    response = get_client().request("POST", url, params=query)
 
     if response.status_code == 200:
-        checklist_id = response.json().get('id')
-        print(f"✅ Created checklist '{checklist_name}' in card {card_id}")
+        checklist = response.json()
+        get_board_snapshot().add_checklist(card_id, checklist)
+        checklist_id = checklist.get('id')
+        if source_checklist_id:
+            print(f"✅ Created checklist '{checklist_name}' in card {card_id} from template ({len(checklist.get('checkItems', []))} items copied)")
+        else:
+            print(f"✅ Created checklist '{checklist_name}' in card {card_id}")
 
         # Add items to the checklist
-        for item in items:
-            add_checklist_item(checklist_id, item)
+        results = populate_checklist(checklist_id, items)
+        if item_results is not None:
+            item_results.extend(results)
 
-        return True
+        return all(result['success'] for result in results)
     else:
         print(f"❌ Failed to create checklist: {response.text}")
         return False
 
+def populate_checklist(checklist_id, items, max_workers=TRELLO_CHECKLIST_WORKERS):
+    """
+    Add items to a checklist concurrently, keeping them in the given order.
+
+    Each item gets an explicit pos after the checklist's current last item, so
+    the requests can complete in any order. Every request still passes through
+    the client's rate limiter.
+    
+    Args:
+        checklist_id (str): The ID of the checklist.
+        items (list): The item names, in the order they should appear.
+        max_workers (int): Maximum number of items created at once.
+    
+    Returns:
+        list: One {'item', 'success'} entry per item, in the given order.
+    """
+    if not items:
+        return []
+    
+    existing = get_board_snapshot().checklist_items(checklist_id) or []
+    last_pos = max([item.get('pos', 0) for item in existing] or [0])
+    positions = [last_pos + CHECKLIST_POS_STEP * (i + 1) for i in range(len(items))]
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        futures = [pool.submit(add_checklist_item, checklist_id, item, pos) for item, pos in zip(items, positions)]
+        results = []
+        for item, future in zip(items, futures):
+            try:
+                results.append({'item': item, 'success': future.result()})
+            except Exception as e:
+                print(f"❌ Failed to add item '{item}' to checklist: {str(e)}")
+                results.append({'item': item, 'success': False, 'error': str(e)})
+    
+    added = sum(1 for result in results if result['success'])
+    print(f"{'✅' if added == len(items) else '⚠️'} Added {added}/{len(items)} items to checklist {checklist_id}")
+    return results
 
-def add_checklist_item(checklist_id, item_name):
+def add_checklist_item(checklist_id, item_name, pos=None):
     """
     Add an item to a checklist.
 
     Args:
         checklist_id (str): The ID of the checklist.
         item_name (str): The name of the item to add.
+        pos (float): Optional position; defaults to the bottom of the checklist.
 
     Returns:
         bool: True if the item was added successfully, False otherwise.
     """
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-
     url = f"https://api.trello.com/1/checklists/{checklist_id}/checkItems"
     query = {
-        'key': trello_api_key,
-        'token': trello_token,
         'name': item_name
     }
+    if pos is not None:
+        query['pos'] = pos
 
-    response = requests.post(url, params=query)
+    response = get_client().request("POST", url, params=query)
 
     if response.status_code == 200:
+        get_board_snapshot().upsert_check_item(checklist_id, response.json())
         print(f"✅ Added item '{item_name}' to checklist {checklist_id}")
         return True
     else:
@@ -792,9 +1951,6 @@ def find_checklist_by_position(card_id, position_text):
     Returns:
         str or None: The ID of the checklist if found, None otherwise.
     """
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    
     # Map position text to 0-based index
     position_map = {
         'first': 0, '1st': 0,
@@ -823,17 +1979,10 @@ def find_checklist_by_position(card_id, position_text):
     if position == -1:
         return None
         
-    # Get the checklists for the card
-    url = f"https://api.trello.com/1/cards/{card_id}/checklists"
-    query = {
-        'key': trello_api_key,
-        'token': trello_token
-    }
-    
-    response = requests.get(url, params=query)
+    # Get the checklists for the card (cached)
+    checklists = get_board_snapshot().checklists(card_id)
     
-    if response.status_code == 200:
-        checklists = response.json()
+    if checklists is not None:
         
         # Debug info
         print(f"Looking for the {position_text} checklist (index {position}) in card {card_id}")
@@ -850,7 +1999,6 @@ def find_checklist_by_position(card_id, position_text):
             print(f"❌ Position out of range: {position_text} (index {position}). Only {len(checklists)} checklists available.")
             return None
     else:
-        print(f"❌ Failed to fetch checklists: {response.text}")
         return None
 
 def find_checklist_by_name(card_id, checklist_name):
@@ -880,19 +2028,9 @@ def find_checklist_by_name(card_id, checklist_name):
         if checklist_id:
             return checklist_id
     
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-
-    url = f"https://api.trello.com/1/cards/{card_id}/checklists"
-    query = {
-        'key': trello_api_key,
-        'token': trello_token
-    }
-
-    response = requests.get(url, params=query)
+    checklists = get_board_snapshot().checklists(card_id)
 
-    if response.status_code == 200:
-        checklists = response.json()
+    if checklists is not None:
         
         # Debug info
         print(f"Found {len(checklists)} checklists in card {card_id}")
@@ -907,7 +2045,11 @@ def find_checklist_by_name(card_id, checklist_name):
         # If no exact match, try fuzzy matching
         if checklists:
             checklist_names = [c.get('name', '') for c in checklists]
-            best_match, similarity = get_best_fuzzy_match(checklist_name, checklist_names, threshold=0.7)
+            checklist_ids = [c.get('id') for c in checklists]
+            best_match, similarity = get_best_fuzzy_match(
+                checklist_name, checklist_names, threshold=0.7,
+                shortlist=lambda name, k: get_board_snapshot().search('checklists', name, k, ids=checklist_ids)
+            )
             
             if best_match:
                 # Find the ID for the best match
@@ -924,7 +2066,6 @@ def find_checklist_by_name(card_id, checklist_name):
         print(f"❌ Checklist not found: '{checklist_name}' - Available checklists: {[c.get('name', '') for c in checklists]}")
         return None
     else:
-        print(f"❌ Failed to fetch checklists: {response.text}")
         return None
 
 def find_checklist_item_by_position(checklist_id, position_text):
@@ -938,9 +2079,6 @@ def find_checklist_item_by_position(checklist_id, position_text):
     Returns:
         str or None: The ID of the item if found, None otherwise.
     """
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-    
     # Map position text to 0-based index
     position_map = {
         'first': 0, '1st': 0,
@@ -976,17 +2114,10 @@ def find_checklist_item_by_position(checklist_id, position_text):
     if position == -1:
         return None
         
-    # Get the items for the checklist
-    url = f"https://api.trello.com/1/checklists/{checklist_id}/checkItems"
-    query = {
-        'key': trello_api_key,
-        'token': trello_token
-    }
-    
-    response = requests.get(url, params=query)
+    # Get the items for the checklist (cached)
+    items = get_board_snapshot().checklist_items(checklist_id)
     
-    if response.status_code == 200:
-        items = response.json()
+    if items is not None:
         
         # Debug info
         print(f"Looking for the {position_text} item (index {position}) in checklist {checklist_id}")
@@ -1003,7 +2134,6 @@ def find_checklist_item_by_position(checklist_id, position_text):
             print(f"❌ Position out of range: {position_text} (index {position}). Only {len(items)} items available.")
             return None
     else:
-        print(f"❌ Failed to fetch checklist items: {response.text}")
         return None
 
 def find_checklist_item_by_name(checklist_id, item_name):
@@ -1039,19 +2169,9 @@ def find_checklist_item_by_name(checklist_id, item_name):
         if item_id:
             return item_id
 
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-
-    url = f"https://api.trello.com/1/checklists/{checklist_id}/checkItems"
-    query = {
-        'key': trello_api_key,
-        'token': trello_token
-    }
-
-    response = requests.get(url, params=query)
+    items = get_board_snapshot().checklist_items(checklist_id)
 
-    if response.status_code == 200:
-        items = response.json()
+    if items is not None:
         
         # Debug info
         print(f"Found {len(items)} items in checklist {checklist_id}")
@@ -1066,7 +2186,11 @@ def find_checklist_item_by_name(checklist_id, item_name):
         # Try fuzzy matching
         if items:
             item_names = [i.get('name', '') for i in items]
-            best_match, similarity = get_best_fuzzy_match(item_name, item_names, threshold=0.6)
+            item_ids = [i.get('id') for i in items]
+            best_match, similarity = get_best_fuzzy_match(
+                item_name, item_names, threshold=0.6,
+                shortlist=lambda name, k: get_board_snapshot().search('items', name, k, ids=item_ids)
+            )
             
             if best_match:
                 # Find the ID for the best match
@@ -1078,7 +2202,6 @@ def find_checklist_item_by_name(checklist_id, item_name):
         print(f"❌ Checklist item not found: '{item_name}' - Available items: {[i.get('name', '') for i in items]}")
         return None
     else:
-        print(f"❌ Failed to fetch checklist items: {response.text}")
         return None
 
 # New function to update a checklist item state (complete/incomplete)
@@ -1096,9 +2219,6 @@ def update_checklist_item(card_id, checklist_name, item_name, state):
     Returns:
         bool: True if the item was updated successfully, False otherwise.
     """
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-
     print(f"🔍 Looking for checklist '{checklist_name}' in card {card_id}")
     # Find the checklist
     checklist_id = find_checklist_by_name(card_id, checklist_name)
@@ -1132,15 +2252,14 @@ def update_checklist_item(card_id, checklist_name, item_name, state):
     state_value = 'complete' if state.lower() == 'complete' or state.lower() == 'done' else 'incomplete'
     
     query = {
-        'key': trello_api_key,
-        'token': trello_token,
         'state': state_value
     }
 
     print(f"📝 Updating checklist item '{item_name}' to state '{state_value}'")
-    response = requests.put(url, params=query)
+    response = get_client().request("PUT", url, params=query)
 
     if response.status_code == 200:
+        get_board_snapshot().upsert_check_item(checklist_id, response.json())
         print(f"✅ Updated checklist item '{item_name}' to state '{state_value}'")
         return True
     else:
@@ -1163,9 +2282,6 @@ def delete_checklist_item(card_id, checklist_name, item_name):
     Returns:
         bool: True if the item was deleted successfully, False otherwise.
     """
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-
     print(f"🔍 Looking for checklist '{checklist_name}' in card {card_id}")
     # Find the checklist
     checklist_id = find_checklist_by_name(card_id, checklist_name)
@@ -1184,22 +2300,17 @@ def delete_checklist_item(card_id, checklist_name, item_name):
 
     # Delete the item
     url = f"https://api.trello.com/1/checklists/{checklist_id}/checkItems/{item_id}"
-    query = {
-        'key': trello_api_key,
-        'token': trello_token
-    }
-
     print(f"🗑️ Deleting checklist item '{item_name}'")
-    response = requests.delete(url, params=query)
+    response = get_client().request("DELETE", url)
 
     if response.status_code == 200:
+        get_board_snapshot().remove_check_item(checklist_id, item_id)
         print(f"✅ Deleted checklist item '{item_name}'")
         return True
     else:
         print(f"❌ Failed to delete checklist item: {response.text}")
         print(f"❌ Response status code: {response.status_code}")
         print(f"❌ Request URL: {url}")
-        print(f"❌ Request params: {query}")
         return False
 
 # New function to delete an entire checklist
@@ -1214,9 +2325,6 @@ def delete_checklist(card_id, checklist_name):
     Returns:
         bool: True if the checklist was deleted successfully, False otherwise.
     """
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-
     # Find the checklist
     checklist_id = find_checklist_by_name(card_id, checklist_name)
     if not checklist_id:
@@ -1225,14 +2333,10 @@ def delete_checklist(card_id, checklist_name):
 
     # Delete the checklist
     url = f"https://api.trello.com/1/checklists/{checklist_id}"
-    query = {
-        'key': trello_api_key,
-        'token': trello_token
-    }
-
-    response = requests.delete(url, params=query)
+    response = get_client().request("DELETE", url)
 
     if response.status_code == 200:
+        get_board_snapshot().remove_checklist(checklist_id)
         print(f"✅ Deleted checklist '{checklist_name}'")
         return True
     else:
@@ -1240,7 +2344,7 @@ def delete_checklist(card_id, checklist_name):
         return False
 
 # New function to add items to an existing checklist
-def add_items_to_checklist(card_id, checklist_name, items, force_new=False):
+def add_items_to_checklist(card_id, checklist_name, items, force_new=False, source_checklist_id=None, item_results=None):
     """
     Add items to an existing checklist in a Trello card.
     If the checklist doesn't exist or force_new is True, create a new checklist.
@@ -1250,484 +2354,579 @@ def add_items_to_checklist(card_id, checklist_name, items, force_new=False):
         checklist_name (str): The name of the checklist.
         items (list): A list of items to add to the checklist.
         force_new (bool): If True, always create a new checklist even if one with the same name exists.
+        source_checklist_id (str): Optional ID of a checklist to copy when a new checklist is created.
+        item_results (list): Optional list that receives one entry per item
+            (see populate_checklist).
 
     Returns:
         bool: True if the items were added successfully, False otherwise.
     """
-    trello_api_key = os.getenv("TRELLO_API_KEY")
-    trello_token = os.getenv("TRELLO_TOKEN")
-
     # Check if the checklist already exists
     print(f"🔍 Checking if checklist '{checklist_name}' exists in card {card_id}")
     existing_checklist_id = find_checklist_by_name(card_id, checklist_name)
     
     if existing_checklist_id and not force_new:
         print(f"✅ Found existing checklist: '{checklist_name}' (ID: {existing_checklist_id})")
-        success = True
         
         # Add items to the existing checklist
-        for item in items:
-            item_success = add_checklist_item(existing_checklist_id, item)
-            success = success and item_success
+        results = populate_checklist(existing_checklist_id, items)
+        if item_results is not None:
+            item_results.extend(results)
             
-        return success
+        return all(result['success'] for result in results)
     else:
         if force_new:
             print(f"⚠️ Force creating a new checklist '{checklist_name}' even though one might exist.")
         else:
             print(f"⚠️ Checklist '{checklist_name}' not found. Creating a new one.")
-        return create_checklist(card_id, checklist_name, items)
+        return create_checklist(card_id, checklist_name, items, source_checklist_id, item_results)
 
-def handle_task_operations_trello(operations):
-    """Handle task operations for Trello"""
-    results = []
+def _execute_trello_operation(op):
+    """Run a single Trello operation and return its result entry"""
+    operation_type = op.get('operation', '')
     
-    for op in operations:
-        operation_type = op.get('operation', '')
+    try:
+        if operation_type == 'create':
+            success = create_card(op)
+            return {
+                'operation': 'create',
+                'task': op.get('task'),
+                'success': success
+            }
         
-        try:
-            if operation_type == 'create':
-                success = create_card(op)
-                results.append({
-                    'operation': 'create',
-                    'task': op.get('task'),
-                    'success': success
-                })
+        elif operation_type == 'update':
+            success = update_card(op)
+            return {
+                'operation': 'update',
+                'task': op.get('task'),
+                'success': success
+            }
             
-            elif operation_type == 'update':
-                success = update_card(op)
-                results.append({
-                    'operation': 'update',
-                    'task': op.get('task'),
-                    'success': success
-                })
+        elif operation_type == 'delete':
+            success = delete_card(op)
+            return {
+                'operation': 'delete',
+                'task': op.get('task'),
+                'success': success
+            }
             
-            elif operation_type == 'delete':
-                success = delete_card(op)
-                results.append({
-                    'operation': 'delete',
-                    'task': op.get('task'),
-                    'success': success
-                })
+        elif operation_type == 'rename':
+            success = rename_card(op)
+            return {
+                'operation': 'rename',
+                'old_name': op.get('old_name'),
+                'new_name': op.get('new_name'),
+                'success': success
+            }
             
-            elif operation_type == 'rename':
-                success = rename_card(op)
-                results.append({
-                    'operation': 'rename',
-                    'old_name': op.get('old_name'),
-                    'new_name': op.get('new_name'),
-                    'success': success
-                })
+        elif operation_type == 'comment':
+            success = add_comment_to_card(op)
+            return {
+                'operation': 'comment',
+                'task': op.get('task'),
+                'success': success
+            }
             
-            elif operation_type == 'comment':
-                success = add_comment_to_card(op)
-                results.append({
-                    'operation': 'comment',
-                    'task': op.get('task'),
-                    'success': success
-                })
+        elif operation_type == 'create_epic':
+            success = create_label(op)
+            return {
+                'operation': 'create_epic',
+                'epic': op.get('epic'),
+                'success': success
+            }
             
-            elif operation_type == 'create_epic':
-                success = create_label(op)
-                results.append({
-                    'operation': 'create_epic',
-                    'epic': op.get('epic'),
-                    'success': success
-                })
+        elif operation_type == 'assign_epic':
+            success = assign_label_to_card(op)
+            return {
+                'operation': 'assign_epic',
+                'task': op.get('task'),
+                'epic': op.get('epic'),
+                'success': success
+            }
             
-            elif operation_type == 'assign_epic':
-                success = assign_label_to_card(op)
-                results.append({
-                    'operation': 'assign_epic',
-                    'task': op.get('task'),
-                    'epic': op.get('epic'),
-                    'success': success
-                })
+        elif operation_type == 'assign_member':
+            success = assign_member_to_card(op)
+            return {
+                'operation': 'assign_member',
+                'task': op.get('task'),
+                'member': op.get('member'),
+                'success': success
+            }
             
-            elif operation_type == 'assign_member':
-                success = assign_member_to_card(op)
-                results.append({
-                    'operation': 'assign_member',
-                    'task': op.get('task'),
-                    'member': op.get('member'),
-                    'success': success
-                })
+        elif operation_type == 'remove_member':
+            success = remove_member_from_card(op)
+            return {
+                'operation': 'remove_member',
+                'task': op.get('task'),
+                'member': op.get('member'),
+                'success': success
+            }
             
-            elif operation_type == 'remove_member':
-                success = remove_member_from_card(op)
-                results.append({
-                    'operation': 'remove_member',
-                    'task': op.get('task'),
-                    'member': op.get('member'),
-                    'success': success
-                })
+        # Handle create_checklist operation
+        elif operation_type == 'create_checklist':
+            card_id = find_card_by_name(op.get('card', ''))
+            if card_id:
+                try:
+                    # Check if force_new flag is set
+                    force_new = op.get('force_new', False)
             
-            # Handle create_checklist operation
-            elif operation_type == 'create_checklist':
-                card_id = find_card_by_name(op.get('card', ''))
-                if card_id:
-                    try:
-                        # Check if force_new flag is set
-                        force_new = op.get('force_new', False)
-                        
-                        # Use add_items_to_checklist with force_new flag
-                        success = add_items_to_checklist(
-                            card_id, 
-                            op.get('checklist', 'Checklist'), 
-                            op.get('items', []),
-                            force_new=force_new
-                        )
-                        results.append({
-                            'operation': 'create_checklist' if force_new else ('add_to_checklist' if success else 'create_checklist'),
-                            'card': op.get('card'),
-                            'checklist': op.get('checklist'),
-                            'success': success
-                        })
-                    except Exception as e:
-                        error_message = str(e)
-                        print(f"❌ Exception handling checklist: {error_message}")
-                        results.append({
-                            'operation': 'create_checklist',
-                            'card': op.get('card'),
-                            'checklist': op.get('checklist'),
-                            'success': False,
-                            'error': error_message
-                        })
-                else:
-                    error_message = f"Card not found: {op.get('card')}"
-                    print(f"❌ {error_message}")
-                    results.append({
+                    # Template mode: copy an existing checklist (from this card unless template_card is given)
+                    source_checklist_id = None
+                    if op.get('template_checklist'):
+                        template_card_id = find_card_by_name(op['template_card']) if op.get('template_card') else card_id
+                        source_checklist_id = template_card_id and find_checklist_by_name(template_card_id, op['template_checklist'])
+                        if not source_checklist_id:
+                            error_message = f"Template checklist not found: {op.get('template_checklist')}"
+                            print(f"❌ {error_message}")
+                            return {
+                                'operation': 'create_checklist',
+                                'card': op.get('card'),
+                                'checklist': op.get('checklist'),
+                                'success': False,
+                                'error': error_message
+                            }
+                        force_new = True
+            
+                    # Use add_items_to_checklist with force_new flag
+                    item_results = []
+                    success = add_items_to_checklist(
+                        card_id, 
+                        op.get('checklist', 'Checklist'), 
+                        op.get('items', []),
+                        force_new=force_new,
+                        source_checklist_id=source_checklist_id,
+                        item_results=item_results
+                    )
+                    return {
+                        'operation': 'create_checklist' if force_new else ('add_to_checklist' if success else 'create_checklist'),
+                        'card': op.get('card'),
+                        'checklist': op.get('checklist'),
+                        'items': item_results,
+                        'success': success
+                    }
+                except Exception as e:
+                    error_message = str(e)
+                    print(f"❌ Exception handling checklist: {error_message}")
+                    return {
                         'operation': 'create_checklist',
                         'card': op.get('card'),
+                        'checklist': op.get('checklist'),
                         'success': False,
                         'error': error_message
-                    })
-            
-            # Handle update_checklist_item operation
-            elif operation_type == 'update_checklist_item':
-                card_id = find_card_by_name(op.get('card', ''))
-                if card_id:
-                    try:
-                        success = update_checklist_item(
-                            card_id,
-                            op.get('checklist', ''),
-                            op.get('item', ''),
-                            op.get('state', 'incomplete')
-                        )
-                        results.append({
-                            'operation': 'update_checklist_item',
-                            'card': op.get('card'),
-                            'checklist': op.get('checklist'),
-                            'item': op.get('item'),
-                            'state': op.get('state'),
-                            'success': success
-                        })
-                    except Exception as e:
-                        error_message = str(e)
-                        print(f"❌ Exception updating checklist item: {error_message}")
-                        results.append({
-                            'operation': 'update_checklist_item',
-                            'card': op.get('card'),
-                            'checklist': op.get('checklist'),
-                            'item': op.get('item'),
-                            'success': False,
-                            'error': error_message
-                        })
-                else:
-                    error_message = f"Card not found: {op.get('card')}"
-                    print(f"❌ {error_message}")
-                    results.append({
+                    }
+            else:
+                error_message = f"Card not found: {op.get('card')}{_not_found_hint('cards', op.get('card'))}"
+                print(f"❌ {error_message}")
+                return {
+                    'operation': 'create_checklist',
+                    'card': op.get('card'),
+                    'success': False,
+                    'error': error_message
+                }
+                
+        # Handle update_checklist_item operation
+        elif operation_type == 'update_checklist_item':
+            card_id = find_card_by_name(op.get('card', ''))
+            if card_id:
+                try:
+                    success = update_checklist_item(
+                        card_id,
+                        op.get('checklist', ''),
+                        op.get('item', ''),
+                        op.get('state', 'incomplete')
+                    )
+                    return {
                         'operation': 'update_checklist_item',
                         'card': op.get('card'),
-                        'success': False,
-                        'error': error_message
-                    })
-            
-            # Handle delete_checklist_item operation
-            elif operation_type == 'delete_checklist_item':
-                card_id = find_card_by_name(op.get('card', ''))
-                if card_id:
-                    try:
-                        success = delete_checklist_item(
-                            card_id,
-                            op.get('checklist', ''),
-                            op.get('item', '')
-                        )
-                        results.append({
-                            'operation': 'delete_checklist_item',
-                            'card': op.get('card'),
-                            'checklist': op.get('checklist'),
-                            'item': op.get('item'),
-                            'success': success
-                        })
-                    except Exception as e:
-                        error_message = str(e)
-                        print(f"❌ Exception deleting checklist item: {error_message}")
-                        results.append({
-                            'operation': 'delete_checklist_item',
-                            'card': op.get('card'),
-                            'checklist': op.get('checklist'),
-                            'item': op.get('item'),
-                            'success': False,
-                            'error': error_message
-                        })
-                else:
-                    error_message = f"Card not found: {op.get('card')}"
-                    print(f"❌ {error_message}")
-                    results.append({
-                        'operation': 'delete_checklist_item',
+                        'checklist': op.get('checklist'),
+                        'item': op.get('item'),
+                        'state': op.get('state'),
+                        'success': success
+                    }
+                except Exception as e:
+                    error_message = str(e)
+                    print(f"❌ Exception updating checklist item: {error_message}")
+                    return {
+                        'operation': 'update_checklist_item',
                         'card': op.get('card'),
+                        'checklist': op.get('checklist'),
+                        'item': op.get('item'),
                         'success': False,
                         'error': error_message
-                    })
-            
-            # Handle delete_checklist operation
-            elif operation_type == 'delete_checklist':
-                card_id = find_card_by_name(op.get('card', ''))
-                if card_id:
-                    success = delete_checklist(
+                    }
+            else:
+                error_message = f"Card not found: {op.get('card')}{_not_found_hint('cards', op.get('card'))}"
+                print(f"❌ {error_message}")
+                return {
+                    'operation': 'update_checklist_item',
+                    'card': op.get('card'),
+                    'success': False,
+                    'error': error_message
+                }
+                
+        # Handle delete_checklist_item operation
+        elif operation_type == 'delete_checklist_item':
+            card_id = find_card_by_name(op.get('card', ''))
+            if card_id:
+                try:
+                    success = delete_checklist_item(
                         card_id,
-                        op.get('checklist', '')
+                        op.get('checklist', ''),
+                        op.get('item', '')
                     )
-                    results.append({
-                        'operation': 'delete_checklist',
+                    return {
+                        'operation': 'delete_checklist_item',
                         'card': op.get('card'),
                         'checklist': op.get('checklist'),
+                        'item': op.get('item'),
                         'success': success
-                    })
-                else:
-                    print(f"❌ Card not found: {op.get('card')}")
-                    results.append({
-                        'operation': 'delete_checklist',
+                    }
+                except Exception as e:
+                    error_message = str(e)
+                    print(f"❌ Exception deleting checklist item: {error_message}")
+                    return {
+                        'operation': 'delete_checklist_item',
                         'card': op.get('card'),
-                        'success': False,
-                        'error': 'Card not found'
-                    })
-            
-            elif operation_type == 'add_reflection_positive':
-                # Find the card ID for the "What's going well?" list
-                list_id = find_list_by_name("What's going well?")
-                if not list_id:
-                    error_message = "Could not find 'What's going well?' list"
-                    print(f"❌ {error_message}")
-                    results.append({
-                        'operation': 'add_reflection_positive',
-                        'task': op.get('task'),
+                        'checklist': op.get('checklist'),
+                        'item': op.get('item'),
                         'success': False,
                         'error': error_message
-                    })
-                    continue
+                    }
+            else:
+                error_message = f"Card not found: {op.get('card')}{_not_found_hint('cards', op.get('card'))}"
+                print(f"❌ {error_message}")
+                return {
+                    'operation': 'delete_checklist_item',
+                    'card': op.get('card'),
+                    'success': False,
+                    'error': error_message
+                }
                 
-                # Create a card with the same name as the task
-                task_name = op.get('task', '')
-                items = op.get('items', [])
+        # Handle delete_checklist operation
+        elif operation_type == 'delete_checklist':
+            card_id = find_card_by_name(op.get('card', ''))
+            if card_id:
+                success = delete_checklist(
+                    card_id,
+                    op.get('checklist', '')
+                )
+                return {
+                    'operation': 'delete_checklist',
+                    'card': op.get('card'),
+                    'checklist': op.get('checklist'),
+                    'success': success
+                }
+            else:
+                print(f"❌ Card not found: {op.get('card')}")
+                return {
+                    'operation': 'delete_checklist',
+                    'card': op.get('card'),
+                    'success': False,
+                    'error': 'Card not found'
+                }
+        
+        elif operation_type == 'add_reflection_positive':
+            # Find the card ID for the "What's going well?" list
+            list_id = find_list_by_name("What's going well?")
+            if not list_id:
+                error_message = "Could not find 'What's going well?' list"
+                print(f"❌ {error_message}")
+                return {
+                    'operation': 'add_reflection_positive',
+                    'task': op.get('task'),
+                    'success': False,
+                    'error': error_message
+                }
+            
+            # Create a card with the same name as the task
+            task_name = op.get('task', '')
+            items = op.get('items', [])
+            
+            # Format items as a numbered list
+            description = format_numbered_list(items)
+            
+            # Create the card
+            try:
+                url = "https://api.trello.com/1/cards"
                 
-                # Format items as a numbered list
-                description = format_numbered_list(items)
+                query = {
+                    'idList': list_id,
+                    'name': task_name,
+                    'desc': description
+                }
                 
-                # Create the card
-                trello_api_key = os.getenv("TRELLO_API_KEY")
-                trello_token = os.getenv("TRELLO_TOKEN")
+                response = get_client().request("POST", url, params=query)
+                response.raise_for_status()
+                get_board_snapshot().upsert_card(response.json())
                 
-                try:
-                    url = "https://api.trello.com/1/cards"
-                    
-                    query = {
-                        'key': trello_api_key,
-                        'token': trello_token,
-                        'idList': list_id,
-                        'name': task_name,
-                        'desc': description
-                    }
-                    
-                    response = requests.post(url, params=query)
-                    response.raise_for_status()
-                    
-                    results.append({
-                        'operation': 'add_reflection_positive',
-                        'task': task_name,
-                        'success': True
-                    })
-                except Exception as e:
-                    error_message = str(e)
-                    print(f"❌ Failed to create reflection card: {error_message}")
-                    results.append({
-                        'operation': 'add_reflection_positive',
-                        'task': task_name,
-                        'success': False,
-                        'error': error_message
-                    })
+                return {
+                    'operation': 'add_reflection_positive',
+                    'task': task_name,
+                    'success': True
+                }
+            except Exception as e:
+                error_message = str(e)
+                print(f"❌ Failed to create reflection card: {error_message}")
+                return {
+                    'operation': 'add_reflection_positive',
+                    'task': task_name,
+                    'success': False,
+                    'error': error_message
+                }
+        
+        elif operation_type == 'add_reflection_negative':
+            # Find the card ID for the "What's not going well?" list
+            list_id = find_list_by_name("What's not going well?")
+            if not list_id:
+                error_message = "Could not find 'What's not going well?' list"
+                print(f"❌ {error_message}")
+                return {
+                    'operation': 'add_reflection_negative',
+                    'task': op.get('task'),
+                    'success': False,
+                    'error': error_message
+                }
             
-            elif operation_type == 'add_reflection_negative':
-                # Find the card ID for the "What's not going well?" list
-                list_id = find_list_by_name("What's not going well?")
-                if not list_id:
-                    error_message = "Could not find 'What's not going well?' list"
-                    print(f"❌ {error_message}")
-                    results.append({
-                        'operation': 'add_reflection_negative',
-                        'task': op.get('task'),
-                        'success': False,
-                        'error': error_message
-                    })
-                    continue
+            # Create a card with the same name as the task
+            task_name = op.get('task', '')
+            issues = op.get('issues', [])
+            lessons_learned = op.get('lessons_learned', [])
+            
+            # Format issues as a numbered list
+            description = format_numbered_list(issues)
+            
+            # Create the card
+            try:
+                url = "https://api.trello.com/1/cards"
                 
-                # Create a card with the same name as the task
-                task_name = op.get('task', '')
-                issues = op.get('issues', [])
-                lessons_learned = op.get('lessons_learned', [])
+                query = {
+                    'idList': list_id,
+                    'name': task_name,
+                    'desc': description
+                }
                 
-                # Format issues as a numbered list
-                description = format_numbered_list(issues)
+                response = get_client().request("POST", url, params=query)
+                response.raise_for_status()
+                get_board_snapshot().upsert_card(response.json())
                 
-                # Create the card
-                trello_api_key = os.getenv("TRELLO_API_KEY")
-                trello_token = os.getenv("TRELLO_TOKEN")
+                # Get the card ID
+                card_id = response.json().get('id')
                 
-                try:
-                    url = "https://api.trello.com/1/cards"
+                # Add lessons learned as a comment
+                if card_id and lessons_learned:
+                    lessons_text = format_numbered_list(lessons_learned)
+                    comment_text = f"Lessons Learned:\n{lessons_text}"
                     
-                    query = {
-                        'key': trello_api_key,
-                        'token': trello_token,
-                        'idList': list_id,
-                        'name': task_name,
-                        'desc': description
+                    comment_url = f"https://api.trello.com/1/cards/{card_id}/actions/comments"
+                    comment_query = {
+                        'text': comment_text
                     }
                     
-                    response = requests.post(url, params=query)
-                    response.raise_for_status()
-                    
-                    # Get the card ID
-                    card_id = response.json().get('id')
-                    
-                    # Add lessons learned as a comment
-                    if card_id and lessons_learned:
-                        lessons_text = format_numbered_list(lessons_learned)
-                        comment_text = f"Lessons Learned:\n{lessons_text}"
-                        
-                        comment_url = f"https://api.trello.com/1/cards/{card_id}/actions/comments"
-                        comment_query = {
-                            'key': trello_api_key,
-                            'token': trello_token,
-                            'text': comment_text
-                        }
-                        
-                        comment_response = requests.post(comment_url, params=comment_query)
-                        comment_response.raise_for_status()
-                    
-                    results.append({
-                        'operation': 'add_reflection_negative',
-                        'task': task_name,
-                        'success': True
-                    })
-                except Exception as e:
-                    error_message = str(e)
-                    print(f"❌ Failed to create reflection card: {error_message}")
-                    results.append({
-                        'operation': 'add_reflection_negative',
-                        'task': task_name,
-                        'success': False,
-                        'error': error_message
-                    })
-            
-            elif operation_type == 'create_improvement_task':
-                # Find the card ID for the "What changes/ideas to make?" list
-                list_id = find_list_by_name("What changes/ideas to make?")
-                if not list_id:
-                    error_message = "Could not find 'What changes/ideas to make?' list"
-                    print(f"❌ {error_message}")
-                    results.append({
-                        'operation': 'create_improvement_task',
-                        'task_name': op.get('task_name'),
-                        'success': False,
-                        'error': error_message
-                    })
-                    continue
-                
-                # Create a card with the task name
-                task_name = op.get('task_name', '')
-                description = op.get('description', '')  # Get the description from the operation
-                checklist_items = op.get('checklist_items', [])
+                    comment_response = get_client().request("POST", comment_url, params=comment_query)
+                    comment_response.raise_for_status()
                 
-                try:
-                    # Create the card
-                    trello_api_key = os.getenv("TRELLO_API_KEY")
-                    trello_token = os.getenv("TRELLO_TOKEN")
+                return {
+                    'operation': 'add_reflection_negative',
+                    'task': task_name,
+                    'success': True
+                }
+            except Exception as e:
+                error_message = str(e)
+                print(f"❌ Failed to create reflection card: {error_message}")
+                return {
+                    'operation': 'add_reflection_negative',
+                    'task': task_name,
+                    'success': False,
+                    'error': error_message
+                }
+        
+        elif operation_type == 'create_improvement_task':
+            # Find the card ID for the "What changes/ideas to make?" list
+            list_id = find_list_by_name("What changes/ideas to make?")
+            if not list_id:
+                error_message = "Could not find 'What changes/ideas to make?' list"
+                print(f"❌ {error_message}")
+                return {
+                    'operation': 'create_improvement_task',
+                    'task_name': op.get('task_name'),
+                    'success': False,
+                    'error': error_message
+                }
+            
+            # Create a card with the task name
+            task_name = op.get('task_name', '')
+            description = op.get('description', '')  # Get the description from the operation
+            checklist_items = op.get('checklist_items', [])
+            
+            try:
+                # Create the card
+                card_url = "https://api.trello.com/1/cards"
+                card_query = {
+                    'idList': list_id,
+                    'name': task_name,
+                    'desc': description  # Add the description to the card creation request
+                }
                     
-                    card_url = "https://api.trello.com/1/cards"
-                    card_query = {
-                        'key': trello_api_key,
-                        'token': trello_token,
-                        'idList': list_id,
-                        'name': task_name,
-                        'desc': description  # Add the description to the card creation request
+                card_response = get_client().request("POST", card_url, params=card_query)
+                card_response.raise_for_status()
+                card_data = card_response.json()
+                get_board_snapshot().upsert_card(card_data)
+                card_id = card_data.get('id')
+                
+                # Add checklist items
+                if card_id and checklist_items:
+                    # Create a checklist
+                    checklist_url = f"https://api.trello.com/1/checklists"
+                    checklist_query = {
+                        'idCard': card_id,
+                        'name': 'Action Items'
                     }
                     
-                    card_response = requests.post(card_url, params=card_query)
-                    card_response.raise_for_status()
-                    card_data = card_response.json()
-                    card_id = card_data.get('id')
+                    checklist_response = get_client().request("POST", checklist_url, params=checklist_query)
+                    checklist_response.raise_for_status()
+                    checklist = checklist_response.json()
+                    get_board_snapshot().add_checklist(card_id, checklist)
+                    checklist_id = checklist.get('id')
                     
-                    # Add checklist items
-                    if card_id and checklist_items:
-                        # Create a checklist
-                        checklist_url = f"https://api.trello.com/1/checklists"
-                        checklist_query = {
-                            'key': trello_api_key,
-                            'token': trello_token,
-                            'idCard': card_id,
-                            'name': 'Action Items'
+                    # Add items to the checklist
+                    item_results = populate_checklist(checklist_id, checklist_items)
+                    failed = [result['item'] for result in item_results if not result['success']]
+                    if failed:
+                        return {
+                            'operation': 'create_improvement_task',
+                            'task_name': task_name,
+                            'items': item_results,
+                            'success': False,
+                            'error': f"{len(failed)} of {len(item_results)} checklist items could not be added"
                         }
                         
-                        checklist_response = requests.post(checklist_url, params=checklist_query)
-                        checklist_response.raise_for_status()
-                        checklist_id = checklist_response.json().get('id')
-                        
-                        # Add items to the checklist
-                        for item in checklist_items:
-                            item_url = f"https://api.trello.com/1/checklists/{checklist_id}/checkItems"
-                            item_query = {
-                                'key': trello_api_key,
-                                'token': trello_token,
-                                'name': item
-                            }
-                            
-                            item_response = requests.post(item_url, params=item_query)
-                            item_response.raise_for_status()
-                    
-                    results.append({
+                    return {
                         'operation': 'create_improvement_task',
                         'task_name': task_name,
+                        'items': item_results,
                         'success': True
-                    })
-                except Exception as e:
-                    error_message = str(e)
-                    print(f"❌ Failed to create improvement task: {error_message}")
-                    results.append({
-                        'operation': 'create_improvement_task',
-                        'task_name': task_name,
-                        'success': False,
-                        'error': error_message
-                    })
-            
-            else:
-                print(f"❌ Unknown operation type: {operation_type}")
-                results.append({
-                    'operation': operation_type,
+                    }
+                    
+                return {
+                    'operation': 'create_improvement_task',
+                    'task_name': task_name,
+                    'success': True
+                }
+            except Exception as e:
+                error_message = str(e)
+                print(f"❌ Failed to create improvement task: {error_message}")
+                return {
+                    'operation': 'create_improvement_task',
+                    'task_name': task_name,
                     'success': False,
-                    'error': 'Unknown operation type'
-                })
-        
-        except Exception as e:
-            print(f"❌ Error processing operation {operation_type}: {str(e)}")
-            results.append({
+                    'error': error_message
+                }
+            
+        else:
+            print(f"❌ Unknown operation type: {operation_type}")
+            return {
                 'operation': operation_type,
                 'success': False,
-                'error': str(e)
-            })
+                'error': 'Unknown operation type'
+            }
     
-    return results
+    except Exception as e:
+        print(f"❌ Error processing operation {operation_type}: {str(e)}")
+        return {
+            'operation': operation_type,
+            'success': False,
+            'error': str(e)
+        }
+
+TRELLO_MAX_WORKERS = 8
+
+CARD_CREATING_OPERATIONS = ('create', 'create_improvement_task', 'add_reflection_positive', 'add_reflection_negative')
+
+def _operation_resources(op):
+    """
+    Return the board resources a Trello operation touches.
+    
+    Cards are keyed by lowercase name and, when the name already resolves, by
+    card ID, so two references to the same card are ordered even when one of
+    them is a partial name. Labels are keyed by lowercase name.
+    
+    Returns:
+        tuple: (set of resource keys, whether a card the operation targets does
+        not exist yet and may be one created earlier in the batch).
+    """
+    operation_type = op.get('operation', '')
+    resources = set()
+    unresolved = False
+    
+    if operation_type == 'rename':
+        names = [op.get('old_name'), op.get('new_name')]
+    elif operation_type == 'create_improvement_task':
+        names = [op.get('task_name')]
+    elif operation_type in ('create_checklist', 'update_checklist_item', 'delete_checklist_item', 'delete_checklist'):
+        # Checklist ops are ordered through their card, which also orders ops on the same checklist
+        names = [op.get('card'), op.get('template_card')]
+    else:
+        names = [op.get('task')]
+    
+    for position, name in enumerate(names):
+        if not name:
+            continue
+        resources.add(f"card:{name.lower()}")
+        if operation_type not in CARD_CREATING_OPERATIONS:
+            card_id = find_card_by_name(name)
+            if card_id:
+                resources.add(card_id)
+            elif not (operation_type == 'rename' and position == 1):
+                # A rename's new name is not expected to exist yet
+                unresolved = True
+    
+    if op.get('epic'):
+        # assign_epic creates a missing label, so it is a write like create_epic
+        resources.add(f"label:{op['epic'].lower()}")
+    
+    return resources, unresolved
+
+def _build_dependencies(operations):
+    """
+    Build the dependency graph for a batch of Trello operations.
+    
+    An operation waits for every earlier operation that touches one of the same
+    cards, checklists or labels, so those run in input order. An operation on a
+    card that does not exist yet also waits for every earlier create, since its
+    name may only match the new card fuzzily.
+    
+    Returns:
+        dict: operation index -> set of indices it must wait for.
+    """
+    entries = [_operation_resources(op) for op in operations]
+    dependencies = {i: set() for i in range(len(operations))}
+    for i, (resources, unresolved) in enumerate(entries):
+        for j in range(i):
+            if resources & entries[j][0]:
+                dependencies[i].add(j)
+            elif unresolved and operations[j].get('operation') in CARD_CREATING_OPERATIONS:
+                dependencies[i].add(j)
+    return dependencies
+
+def handle_task_operations_trello(operations, max_workers=TRELLO_MAX_WORKERS):
+    """
+    Handle task operations for Trello.
+    
+    Independent operations run concurrently on a bounded pool; every request
+    they make passes through the shared sliding-window rate limiter. Operations
+    on the same card, checklist or label run one after another in input order.
+    
+    Returns:
+        list: One result entry per operation, in input order.
+    """
+    if not operations:
+        return []
+    
+    # Load the board once up front so the workers share it instead of racing to load it
+    get_board_snapshot().ensure_current()
+    
+    dependencies = _build_dependencies(operations)
+    return run_with_dependencies(operations, dependencies, _execute_trello_operation, max_workers=max_workers)
 
 def format_operation_summary_trello(results):
     """Format the results of task operations for display"""
@@ -1823,7 +3022,7 @@ def format_operation_summary_trello(results):
             if success:
                 summary += f"✅ Created checklist: {checklist} in {card}\n"
             else:
-                error = result.get('error', 'Unknown error')
+                error = result.get('error', 'Some items could not be added')
                 summary += f"❌ Failed to create checklist: {checklist} in {card} - {error}\n"
         
         # Add summary for add_to_checklist operations
@@ -1833,7 +3032,7 @@ def format_operation_summary_trello(results):
             if success:
                 summary += f"✅ Added items to existing checklist: {checklist} in {card}\n"
             else:
-                error = result.get('error', 'Unknown error')
+                error = result.get('error', 'Some items could not be added')
                 summary += f"❌ Failed to add items to checklist: {checklist} in {card} - {error}\n"
         
         elif operation == 'update_checklist_item':
@@ -1896,6 +3095,11 @@ def format_operation_summary_trello(results):
             else:
                 error = result.get('error', 'Unknown error')
                 summary += f"❌ {operation.capitalize()} operation failed: {error}\n"
+        
+        # List the checklist items that could not be added
+        for item_result in result.get('items', []):
+            if not item_result.get('success'):
+                summary += f"   ❌ Item not added: {item_result.get('item')}\n"
     
     return summary
 
@@ -1974,14 +3178,24 @@ def adjust_timezone_for_trello(iso_date_string):
             return iso_date_string
     return iso_date_string
 
-def get_best_fuzzy_match(target, candidates, threshold=0.75):
+FUZZY_SHORTLIST = 10  # index hits re-scored with SequenceMatcher
+FUZZY_HINT_MIN_SCORE = 0.4  # n-gram similarity a name needs to be suggested
+
+def get_best_fuzzy_match(target, candidates, threshold=0.75, shortlist=None):
     """
     Find the best fuzzy match from a list of candidates for a target string.
     
+    With a shortlist, only the closest candidates by n-grams are scored with
+    SequenceMatcher, so threshold keeps its difflib meaning. Every candidate is
+    scored when there is no shortlist or none of it reaches the threshold.
+    
     Args:
         target (str): The string to match against.
         candidates (list): List of candidate strings to match.
         threshold (float): Minimum similarity ratio to consider a match (0.0 to 1.0).
+        shortlist (callable): Optional lookup in a maintained index, taking
+            (name, k) and returning (ID, name, score) tuples, such as
+            TrelloBoardSnapshot.search restricted to the candidates' IDs.
         
     Returns:
         tuple: (best_match, similarity_ratio) or (None, 0) if no match above threshold.
@@ -1992,28 +3206,64 @@ def get_best_fuzzy_match(target, candidates, threshold=0.75):
     # Convert to lowercase for case-insensitive matching
     target = target.lower()
     
+    lowered = [candidate.lower() for candidate in candidates]
+    
     # First check for exact match
-    for candidate in candidates:
-        if candidate.lower() == target:
-            return candidate, 1.0
+    if target in lowered:
+        return candidates[lowered.index(target)], 1.0
     
     # Then check for contained match
-    for candidate in candidates:
-        if target in candidate.lower() or candidate.lower() in target:
+    for candidate, lower in zip(candidates, lowered):
+        if target in lower or lower in target:
             # Calculate how much of one string is contained in the other
-            similarity = len(min(target, candidate.lower(), key=len)) / len(max(target, candidate.lower(), key=len))
+            similarity = len(min(target, lower, key=len)) / len(max(target, lower, key=len))
             if similarity >= threshold:
                 return candidate, similarity
     
-    # Finally use difflib for fuzzy matching
-    matches = difflib.get_close_matches(target, candidates, n=1, cutoff=threshold)
+    # Then score the closest candidates by n-grams with difflib
+    by_lower = {}
+    for candidate, lower in zip(candidates, lowered):
+        by_lower.setdefault(lower, candidate)
+    if shortlist is not None:
+        best_match, best_ratio = None, 0
+        for _, name, _ in shortlist(target, FUZZY_SHORTLIST):
+            lower = (name or '').lower()
+            if lower not in by_lower:
+                continue
+            ratio = difflib.SequenceMatcher(None, target, lower).ratio()
+            if ratio >= threshold and ratio > best_ratio:
+                best_match, best_ratio = by_lower[lower], ratio
+        if best_match is not None:
+            return best_match, best_ratio
+    
+    # Finally fall back to difflib over every candidate
+    matches = difflib.get_close_matches(target, lowered, n=1, cutoff=threshold)
     if matches:
-        best_match = matches[0]
-        ratio = difflib.SequenceMatcher(None, target, best_match.lower()).ratio()
-        return best_match, ratio
-    
+        return by_lower[matches[0]], difflib.SequenceMatcher(None, target, matches[0]).ratio()
     return None, 0
 
+def find_similar_names(kind, name, k=3):
+    """
+    Return the board items whose names are closest to name.
+    
+    Args:
+        kind (str): 'cards', 'checklists', 'lists', 'labels' or 'members'.
+        name (str): The name to look up.
+        k (int): Maximum number of results.
+    
+    Returns:
+        list: (ID, name, score) tuples, best first.
+    """
+    source = get_board_snapshot() if kind in ('cards', 'checklists') else get_board_metadata()
+    return source.search(kind, name or '', k)
+
+def _not_found_hint(kind, name):
+    """Return a " (did you mean ...?)" suffix naming the closest items, or an empty string"""
+    names = [match for _, match, score in find_similar_names(kind, name) if score >= FUZZY_HINT_MIN_SCORE]
+    if not names:
+        return ""
+    return " (did you mean " + " or ".join(f"'{match}'" for match in names) + "?)"
+
 def format_numbered_list(items):
     """Format a list of items as a numbered list string"""
     if not items:
@@ -2023,11 +3273,7 @@ def format_numbered_list(items):
 def find_list_by_name(list_name):
     """Find a list ID by name"""
     try:
-        lists = fetch_lists()
-        for list_item in lists:
-            if list_item['name'].lower() == list_name.lower():
-                return list_item['id']
-        return None
+        return get_board_metadata().list_id(list_name, partial=False)
     except Exception as e:
         print(f"❌ Error finding list: {str(e)}")
         return None
\ No newline at end of file
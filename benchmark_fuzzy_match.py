@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark the n-gram fuzzy index against the difflib name matching it replaced
+"""
+
+import argparse
+import difflib
+import random
+import time
+
+from api.fuzzy_index import FuzzyIndex
+from api.trello_handler import get_best_fuzzy_match
+
+WORDS = [
+    "design", "landing", "page", "fix", "login", "bug", "update", "docs", "review", "api",
+    "release", "notes", "migrate", "database", "schema", "add", "tests", "for", "checkout",
+    "flow", "refactor", "auth", "service", "onboarding", "email", "dashboard", "metrics",
+    "mobile", "layout", "search", "filter", "export", "report", "billing", "invoice", "cache",
+    "deploy", "pipeline", "staging", "monitoring", "alerts", "customer", "feedback", "survey"
+]
+
+def difflib_best_match(target, candidates, threshold=0.75):
+    """The previous get_best_fuzzy_match: exact, contained, then difflib over every candidate"""
+    if not target or not candidates:
+        return None, 0
+    target = target.lower()
+    for candidate in candidates:
+        if candidate.lower() == target:
+            return candidate, 1.0
+    for candidate in candidates:
+        if target in candidate.lower() or candidate.lower() in target:
+            similarity = len(min(target, candidate.lower(), key=len)) / len(max(target, candidate.lower(), key=len))
+            if similarity >= threshold:
+                return candidate, similarity
+    matches = difflib.get_close_matches(target, candidates, n=1, cutoff=threshold)
+    if matches:
+        return matches[0], difflib.SequenceMatcher(None, target, matches[0].lower()).ratio()
+    return None, 0
+
+def make_names(rng, count):
+    """Generate count distinct task-like names"""
+    names = set()
+    while len(names) < count:
+        names.add(" ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 6))).capitalize() + f" {rng.randint(1, 999)}")
+    return sorted(names)
+
+def make_typo(rng, name):
+    """Drop, swap or replace a couple of characters, as a transcript might"""
+    chars = list(name.lower())
+    for _ in range(2):
+        i = rng.randrange(len(chars) - 1)
+        edit = rng.choice(("drop", "swap", "replace"))
+        if edit == "drop":
+            del chars[i]
+        elif edit == "swap":
+            chars[i], chars[i + 1] = chars[i + 1], chars[i]
+        else:
+            chars[i] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+    return "".join(chars)
+
+def timed(fn, queries):
+    """Run fn over the queries and return (results, seconds per query)"""
+    start = time.perf_counter()
+    results = [fn(query) for query in queries]
+    return results, (time.perf_counter() - start) / len(queries)
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--names", type=int, default=10000, help="number of candidate names")
+    parser.add_argument("--queries", type=int, default=50, help="number of misspelled lookups")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    names = make_names(rng, args.names)
+    targets = rng.sample(names, args.queries)
+    queries = [make_typo(rng, target) for target in targets]
+    
+    print("\n" + "=" * 50)
+    print(f"Fuzzy match benchmark: {len(names)} names, {len(queries)} queries")
+    print("=" * 50 + "\n")
+    
+    start = time.perf_counter()
+    index = FuzzyIndex(names)
+    build_time = time.perf_counter() - start
+    
+    old_results, old_time = timed(lambda q: difflib_best_match(q, names), queries)
+    new_results, new_time = timed(lambda q: get_best_fuzzy_match(q, names, shortlist=index.search), queries)
+    
+    # Keep the rename path honest: move 1% of the names and time the updates
+    renamed = rng.sample(range(len(names)), len(names) // 100)
+    start = time.perf_counter()
+    for i in renamed:
+        index.add(names[i], names[i] + " v2")
+    update_time = (time.perf_counter() - start) / len(renamed)
+    
+    agree = sum(1 for old, new in zip(old_results, new_results) if old[0] == new[0])
+    old_hits = sum(1 for (match, _), target in zip(old_results, targets) if match == target)
+    new_hits = sum(1 for (match, _), target in zip(new_results, targets) if match == target)
+    
+    print(f"Index build:          {build_time * 1000:9.1f} ms")
+    print(f"Index rename:         {update_time * 1000:9.3f} ms per name")
+    print(f"difflib lookup:       {old_time * 1000:9.2f} ms per query ({old_hits}/{len(queries)} found the original)")
+    print(f"n-gram index lookup:  {new_time * 1000:9.2f} ms per query ({new_hits}/{len(queries)} found the original)")
+    print(f"Speedup:              {old_time / new_time:9.1f}x")
+    print(f"Same answer as difflib for {agree}/{len(queries)} queries")
+
+if __name__ == "__main__":
+    main()
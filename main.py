@@ -7,6 +7,7 @@ A tool that extracts tasks from meeting transcripts or live meetings and adds th
 
 import os
 import sys
+from functools import partial
 from utils.config_manager import ConfigManager
 from utils.setup_wizard import run_setup_wizard
 from agents.audio_recorder import record_audio
@@ -48,6 +49,9 @@ def main():
         print("Please run the setup wizard again to configure your environment.")
         sys.exit(1)
     
+    # --plan-only prints the Notion execution plan instead of writing to the board
+    plan_only = "--plan-only" in sys.argv[1:]
+    
     # Ask user which tool they want to use
     selected_tool = select_tool()
     
@@ -55,12 +59,21 @@ def main():
     if selected_tool == "notion":
         from agents.task_extractor import extract_tasks
         from api.notion_handler import handle_task_operations, format_operation_summary
+        if plan_only:
+            handle_task_operations = partial(handle_task_operations, plan_only=True)
+            print("\nℹ️ Plan-only mode: no changes will be written to Notion")
         print("\n✅ Using Notion for task management")
     else:  # trello
+        if plan_only:
+            print("\n❌ --plan-only is only supported with Notion; nothing was run")
+            sys.exit(1)
         from agents.task_extractor_trello import extract_tasks_trello as extract_tasks
         from api.trello_handler import handle_task_operations_trello as handle_task_operations
         from api.trello_handler import format_operation_summary_trello as format_operation_summary
+        from api.trello_handler import start_webhook_receiver
         print("\n✅ Using Trello for task management")
+        # Optional: keep the cached board current from Trello webhooks (TRELLO_WEBHOOK_URL)
+        start_webhook_receiver()
     
     # Ask user if they want to process a transcript or record a meeting
     while True:
@@ -78,7 +91,7 @@ def main():
             record_meeting(extract_tasks, handle_task_operations, format_operation_summary)
             break
         elif choice == "3":
-            stream_meeting(selected_tool)
+            stream_meeting(selected_tool, plan_only=plan_only)
             break
         else:
             print("Invalid choice. Please enter 1, 2, or 3.")
@@ -167,17 +180,22 @@ def record_meeting(extract_tasks_fn, handle_operations_fn, format_summary_fn):
         print("\nNo audio recorded. Exiting.")
 
 
-def stream_meeting(selected_tool):
+def stream_meeting(selected_tool, plan_only=False):
     """Stream and process a meeting in real-time"""
     print("\n" + "=" * 50)
     print("Live Streaming Meeting")
     print("=" * 50)
     
-    # Initialize the streaming processor with the selected tool
-    processor = StreamingMeetingProcessor(tool=selected_tool)
+    # The streaming processor writes to Notion only
+    if selected_tool != "notion":
+        print("\n❌ Live streaming is only supported with Notion")
+        return None
+    
+    processor = StreamingMeetingProcessor(plan_only=plan_only)
     
     # Start streaming
-    processor.start_streaming()
+    processor.start()
+    return processor
 
 
 if __name__ == "__main__":
@@ -0,0 +1,355 @@
+# tests/fakes.py
+"""
+In-memory Notion and Trello transports for offline tests.
+
+Each fake is a requests transport adapter mounted on the shared client's
+session, so requests go through the real client code (rate limiting,
+retries, stats) and are answered from a small in-memory board. Every call
+is recorded in `calls` as (method, path), and `fail_next` can queue
+(status, headers) responses, or exceptions to raise, before the normal
+routing.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs, urlparse
+
+from requests.adapters import BaseAdapter
+from requests.models import Response
+
+class FakeTransport(BaseAdapter):
+    """Base adapter that records calls and serves queued failures"""
+    
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+        self.fail_next = []
+        self._lock = threading.Lock()
+    
+    def send(self, request, **kwargs):
+        with self._lock:
+            url = urlparse(request.url)
+            self.calls.append((request.method, url.path))
+            response = Response()
+            response.request = request
+            response.url = request.url
+            if self.fail_next:
+                failure = self.fail_next.pop(0)
+                if isinstance(failure, Exception):
+                    raise failure
+                status, headers = failure
+                response.status_code = status
+                response.headers.update(headers)
+                response._content = b'{"message": "fail"}'
+                return response
+            status, body = self.route(request.method, url.path, parse_qs(url.query), request.body)
+            response.status_code = status
+            response._content = json.dumps(body).encode()
+            return response
+    
+    def route(self, method, path, query, body):
+        raise NotImplementedError
+    
+    def close(self):
+        pass
+
+class FakeNotion(FakeTransport):
+    """A Notion task database with Name, Status, Assign, Deadline and Select properties"""
+    
+    def __init__(self, titles=(), start=datetime(2024, 1, 1)):
+        super().__init__()
+        self.start = start
+        self.clock = 0
+        self.pages = {}
+        self.comments = []
+        self.users = [
+            {"object": "user", "id": "u1", "name": "Alice Smith", "type": "person", "person": {"email": "alice@example.com"}},
+            {"object": "user", "id": "u2", "name": "Bob", "type": "person", "person": {}}
+        ]
+        self.schema = {"object": "database", "id": "db", "properties": {
+            "Name": {"id": "title", "name": "Name", "type": "title", "title": {}},
+            "Status": {"id": "st", "name": "Status", "type": "status", "status": {}},
+            "Assign": {"id": "as", "name": "Assign", "type": "people", "people": {}},
+            "Deadline": {"id": "dl", "name": "Deadline", "type": "date", "date": {}},
+            "Select": {"id": "sel", "name": "Select", "type": "select",
+                       "select": {"options": [{"name": "Backend", "color": "red"}]}}
+        }}
+        for title in titles:
+            self.add_page(title)
+    
+    def tick(self):
+        """Advance the fake clock by a minute and return the timestamp"""
+        self.clock += 1
+        return (self.start + timedelta(minutes=self.clock)).strftime("%Y-%m-%dT%H:%M:00.000Z")
+    
+    def add_page(self, title, status="Not started"):
+        """Add a page directly, as if someone else created it"""
+        page_id = f"{len(self.pages) + 1:08x}-0000-0000-0000-000000000000"
+        now = self.tick()
+        self.pages[page_id] = {
+            "object": "page", "id": page_id, "archived": False, "created_time": now, "last_edited_time": now,
+            "properties": {
+                "Name": {"id": "title", "type": "title", "title": [{"text": {"content": title}, "plain_text": title}]},
+                "Status": {"id": "st", "type": "status", "status": {"name": status}},
+                "Assign": {"id": "as", "type": "people", "people": []},
+                "Deadline": {"id": "dl", "type": "date", "date": None},
+                "Select": {"id": "sel", "type": "select", "select": None}
+            }
+        }
+        return page_id
+    
+    def title(self, page_id):
+        """Return the current title of a page"""
+        return self.pages[page_id]["properties"]["Name"]["title"][0]["plain_text"]
+    
+    def edit(self, page_id, **changes):
+        """Change a page directly, as if someone else edited it"""
+        self.pages[page_id].update(changes)
+        self.pages[page_id]["last_edited_time"] = self.tick()
+    
+    def route(self, method, path, query, body):
+        body = json.loads(body) if body else {}
+        parts = path.split("/v1/", 1)[1].strip("/").split("/")
+        
+        if parts[0] == "databases" and parts[-1] == "query":
+            pages = [page for page in self.pages.values() if not page["archived"]]
+            since = (body.get("filter") or {}).get("last_edited_time", {}).get("on_or_after")
+            if since:
+                pages = [page for page in pages if page["last_edited_time"] >= since]
+            start = int(body.get("start_cursor") or 0)
+            size = body.get("page_size", 100)
+            more = start + size < len(pages)
+            return 200, {"object": "list", "results": pages[start:start + size], "has_more": more,
+                         "next_cursor": str(start + size) if more else None}
+        
+        if parts[0] == "databases":
+            if method == "PATCH":
+                for name, prop in body.get("properties", {}).items():
+                    for existing_name, existing in self.schema["properties"].items():
+                        if name in (existing_name, existing["id"]) and "select" in prop:
+                            existing["select"]["options"] = prop["select"]["options"]
+            return 200, self.schema
+        
+        if parts[0] == "users":
+            return 200, {"object": "list", "results": self.users, "has_more": False, "next_cursor": None}
+        
+        if parts[0] == "pages" and method == "POST":
+            title = body["properties"]["Name"]["title"][0]["text"]["content"]
+            page_id = self.add_page(title)
+            self._update(page_id, {key: value for key, value in body["properties"].items() if key != "Name"})
+            return 200, self.pages[page_id]
+        
+        if parts[0] == "pages" and method == "PATCH":
+            page_id = parts[1]
+            if page_id not in self.pages:
+                return 404, {"object": "error", "message": "page not found"}
+            if "archived" in body:
+                self.pages[page_id]["archived"] = body["archived"]
+            self._update(page_id, body.get("properties", {}))
+            self.pages[page_id]["last_edited_time"] = self.tick()
+            return 200, self.pages[page_id]
+        
+        if parts[0] == "pages":
+            return 200, self.pages[parts[1]]
+        
+        if parts[0] == "comments" and method == "POST":
+            comment = {"object": "comment", "id": f"c{len(self.comments) + 1}",
+                       "parent": body["parent"], "created_time": self.tick(), "rich_text": body["rich_text"]}
+            self.comments.append(comment)
+            return 200, comment
+        
+        if parts[0] == "comments":
+            block_id = query.get("block_id", [None])[0]
+            return 200, {"object": "list", "has_more": False,
+                         "results": [c for c in self.comments if c["parent"].get("page_id") == block_id]}
+        
+        return 404, {"object": "error", "message": f"no route for {method} {path}"}
+    
+    def _update(self, page_id, properties):
+        """Apply a properties payload the way Notion echoes it back"""
+        stored = self.pages[page_id]["properties"]
+        for name, value in properties.items():
+            if name == "Name":
+                text = value["title"][0]["text"]["content"]
+                stored["Name"]["title"] = [{"text": {"content": text}, "plain_text": text}]
+            elif name == "Select" and value.get("select"):
+                stored["Select"]["select"] = dict(value["select"], color=value["select"].get("color", "default"))
+            else:
+                stored[name] = dict(stored.get(name, {}), **value)
+
+class FakeTrello(FakeTransport):
+    """A Trello board with To Do / In Progress / Done lists, one label, one member and some cards"""
+    
+    def __init__(self, cards=3):
+        super().__init__()
+        self.seq = 0
+        self.lists = [{"id": "L1", "name": "To Do", "pos": 1}, {"id": "L2", "name": "In Progress", "pos": 2},
+                      {"id": "L3", "name": "Done", "pos": 3}]
+        self.labels = [{"id": "LB1", "name": "Backend", "color": "red"}]
+        self.members = [{"id": "M1", "fullName": "Alice Smith", "username": "alice"}]
+        self.cards = {}
+        self.checklists = {}
+        for i in range(cards):
+            self.cards[f"C{i}"] = self.make_card(f"C{i}", f"Card {i}", "L1")
+        self.checklists["CL1"] = {"id": "CL1", "idCard": "C0", "name": "Steps", "pos": 1, "checkItems": [
+            {"id": "I1", "name": "one", "state": "incomplete", "pos": 1, "idChecklist": "CL1"},
+            {"id": "I2", "name": "two", "state": "incomplete", "pos": 2, "idChecklist": "CL1"}
+        ]}
+    
+    def new_id(self, prefix):
+        self.seq += 1
+        return f"{prefix}new{self.seq}"
+    
+    @staticmethod
+    def make_card(card_id, name, list_id):
+        return {"id": card_id, "name": name, "desc": "", "idList": list_id, "due": None, "labels": [], "idLabels": [],
+                "idMembers": [], "idChecklists": [], "closed": False}
+    
+    def route(self, method, path, query, body):
+        query = {key: values[0] for key, values in query.items()}
+        parts = path.strip("/").split("/")[1:]
+        
+        if parts[0] == "batch":
+            results = []
+            for url in query["urls"].split(","):
+                parsed = urlparse(url)
+                status, result = self.route("GET", "/1" + parsed.path, parse_qs(parsed.query), None)
+                results.append({str(status): result} if status == 200 else {"statusCode": status, "message": result})
+            return 200, results
+        
+        if parts[0] == "boards":
+            board = {"id": "FULLBOARD", "name": "Board"}
+            for field, value in (("cards", list(self.cards.values())), ("lists", self.lists), ("labels", self.labels),
+                                 ("members", self.members), ("checklists", list(self.checklists.values()))):
+                if field in query:
+                    board[field] = value
+            return 200, board
+        
+        if parts[0] == "lists":
+            for lst in self.lists:
+                if lst["id"] == parts[1]:
+                    return 200, lst
+            return 404, "list not found"
+        
+        if parts[0] == "labels" and method == "POST":
+            label = {"id": self.new_id("LB"), "name": query["name"], "color": query.get("color")}
+            self.labels.append(label)
+            return 200, label
+        
+        if parts[0] == "cards" and len(parts) == 1:
+            card = self.make_card(self.new_id("C"), query["name"], query["idList"])
+            self.cards[card["id"]] = card
+            return 200, card
+        
+        if parts[0] == "cards":
+            card = self.cards.get(parts[1])
+            if card is None:
+                return 404, "card not found"
+            if len(parts) == 2:
+                if method == "PUT":
+                    card.update({key: value for key, value in query.items() if key not in ("key", "token")})
+                elif method == "DELETE":
+                    del self.cards[card["id"]]
+                    return 200, {}
+                return 200, card
+            if parts[2] == "idLabels":
+                if method == "POST":
+                    card["idLabels"].append(query["value"])
+                else:
+                    card["idLabels"].remove(parts[3])
+                return 200, card["idLabels"]
+            if parts[2] == "idMembers":
+                if method == "POST":
+                    card["idMembers"].append(query["value"])
+                else:
+                    card["idMembers"].remove(parts[3])
+                return 200, card["idMembers"]
+            if parts[2] == "actions":
+                return 200, {"id": self.new_id("A")}
+            if parts[2] == "checklists":
+                if method == "GET":
+                    return 200, [c for c in self.checklists.values() if c["idCard"] == card["id"]]
+                return 200, self.make_checklist(card["id"], query)
+            if parts[2] == "checkItem":
+                for checklist in self.checklists.values():
+                    for item in checklist["checkItems"]:
+                        if item["id"] == parts[3]:
+                            item.update({key: query[key] for key in ("state", "name") if key in query})
+                            return 200, item
+                return 404, "item not found"
+        
+        if parts[0] == "checklists" and len(parts) == 1:
+            return 200, self.make_checklist(query["idCard"], query)
+        
+        if parts[0] == "checklists":
+            checklist = self.checklists.get(parts[1])
+            if checklist is None:
+                return 404, "checklist not found"
+            if len(parts) == 2:
+                if method == "DELETE":
+                    del self.checklists[parts[1]]
+                    return 200, {}
+                return 200, checklist
+            if method == "POST":
+                pos = query.get("pos")
+                pos = float(pos) if pos else max([i["pos"] for i in checklist["checkItems"]] or [0]) + 1
+                item = {"id": self.new_id("I"), "name": query["name"], "state": "incomplete", "pos": pos,
+                        "idChecklist": checklist["id"]}
+                checklist["checkItems"].append(item)
+                return 200, item
+            if method == "DELETE":
+                checklist["checkItems"] = [i for i in checklist["checkItems"] if i["id"] != parts[3]]
+                return 200, {}
+            return 200, checklist["checkItems"]
+        
+        if parts[0] == "webhooks":
+            if method == "DELETE":
+                return 200, {}
+            return 200, {"id": self.new_id("W"), "callbackURL": query.get("callbackURL")}
+        
+        return 404, f"no route for {method} {path}"
+    
+    def make_checklist(self, card_id, query):
+        checklist = {"id": self.new_id("CL"), "idCard": card_id, "name": query.get("name", "Checklist"),
+                     "pos": len(self.checklists) + 1, "checkItems": []}
+        source = query.get("idChecklistSource")
+        if source:
+            checklist["checkItems"] = [dict(item, id=self.new_id("I"), idChecklist=checklist["id"])
+                                       for item in self.checklists[source]["checkItems"]]
+        self.checklists[checklist["id"]] = checklist
+        return checklist
+
+def install_notion(fake):
+    """Point api.notion_handler at a fresh client and empty caches that talk to fake"""
+    from api import notion_handler
+    
+    os.environ.update(NOTION_API_KEY="test-key", NOTION_DATABASE_ID="db")
+    for name in ("NOTION_MIRROR_PATH", "NOTION_JOURNAL_PATH"):
+        os.environ.pop(name, None)
+    
+    client = notion_handler.NotionClient(rate_limiter=notion_handler.RateLimiter(rate=1000))
+    client.session.mount("https://", fake)
+    notion_handler._client = client
+    notion_handler._board_snapshot = notion_handler.BoardSnapshot()
+    notion_handler._users_directory = notion_handler.UsersDirectory()
+    notion_handler._database_schema = notion_handler.DatabaseSchema()
+    notion_handler._journals.clear()
+    notion_handler._recovered_journals.clear()
+    return notion_handler
+
+def install_trello(fake):
+    """Point api.trello_handler at a fresh client and empty caches that talk to fake"""
+    from api import trello_handler
+    
+    os.environ.update(TRELLO_API_KEY="test-key", TRELLO_TOKEN="test-token", TRELLO_BOARD_ID="board")
+    client = trello_handler.TrelloClient(
+        rate_limiter=trello_handler.SlidingWindowLimiter(token_limit=(10000, 10.0), key_limit=(10000, 10.0))
+    )
+    client.session.mount("https://", fake)
+    trello_handler._client = client
+    trello_handler._board_metadata = trello_handler.BoardMetadata()
+    trello_handler._board_snapshot = trello_handler.TrelloBoardSnapshot()
+    trello_handler._batcher = trello_handler.TrelloBatcher()
+    return trello_handler
@@ -0,0 +1,86 @@
+# tests/test_clients.py
+import unittest
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from tests.fakes import FakeNotion, FakeTrello, install_notion, install_trello
+
+RETRY_NOW = {"Retry-After": "0"}
+
+class NotionClientRetryTest(unittest.TestCase):
+    """NotionClient.request only repeats requests that are safe to repeat"""
+    
+    def setUp(self):
+        self.notion = FakeNotion(["Fix login bug"])
+        self.client = install_notion(self.notion)._client
+        self.page_id = next(iter(self.notion.pages))
+    
+    def test_rate_limited_post_is_retried(self):
+        self.notion.fail_next = [(429, RETRY_NOW)]
+        response = self.client.post("comments", json={"parent": {"page_id": self.page_id}, "rich_text": []})
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.notion.calls, [("POST", "/v1/comments")] * 2)
+        self.assertEqual(len(self.notion.comments), 1)
+    
+    def test_server_error_on_post_is_not_retried(self):
+        self.notion.fail_next = [(502, RETRY_NOW)]
+        response = self.client.post("comments", json={"parent": {"page_id": self.page_id}, "rich_text": []})
+        
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(self.notion.calls, [("POST", "/v1/comments")])
+        self.assertEqual(self.client.get_metrics()["retries"], 0)
+    
+    def test_server_error_on_query_and_patch_is_retried(self):
+        self.notion.fail_next = [(503, RETRY_NOW), (500, RETRY_NOW)]
+        self.assertEqual(self.client.post("databases/db/query", json={}).status_code, 200)
+        self.assertEqual(self.client.patch(f"pages/{self.page_id}", json={"archived": True}).status_code, 200)
+        
+        self.assertEqual(len(self.notion.calls), 4)
+
+class TrelloClientRetryTest(unittest.TestCase):
+    """TrelloClient.request never repeats a POST that may have been applied"""
+    
+    def setUp(self):
+        self.trello = FakeTrello()
+        self.client = install_trello(self.trello)._client
+    
+    def create_card(self):
+        return self.client.request("POST", "/cards", params={"idList": "L1", "name": "New card"})
+    
+    def test_rate_limited_post_is_retried(self):
+        self.trello.fail_next = [(429, RETRY_NOW)]
+        self.assertEqual(self.create_card().status_code, 200)
+        
+        self.assertEqual(self.trello.calls, [("POST", "/1/cards")] * 2)
+        self.assertEqual(len(self.trello.cards), 4)
+    
+    def test_server_error_on_post_is_not_retried(self):
+        self.trello.fail_next = [(500, RETRY_NOW)]
+        self.assertEqual(self.create_card().status_code, 500)
+        
+        self.assertEqual(self.trello.calls, [("POST", "/1/cards")])
+    
+    def test_post_is_retried_when_the_connection_never_opened(self):
+        refused = NewConnectionError(None, "Connection refused")
+        self.trello.fail_next = [requests.ConnectionError(MaxRetryError(None, "/1/cards", refused))]
+        self.assertEqual(self.create_card().status_code, 200)
+        
+        self.assertEqual(len(self.trello.calls), 2)
+    
+    def test_post_is_not_retried_after_a_read_error(self):
+        self.trello.fail_next = [requests.ConnectionError("Connection reset by peer")]
+        with self.assertRaises(requests.ConnectionError):
+            self.create_card()
+        
+        self.assertEqual(len(self.trello.calls), 1)
+    
+    def test_server_error_on_get_is_retried(self):
+        self.trello.fail_next = [(503, RETRY_NOW)]
+        self.assertEqual(self.client.request("GET", "/cards/C1").status_code, 200)
+        
+        self.assertEqual(self.trello.calls, [("GET", "/1/cards/C1")] * 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+# tests/test_dependency_runner.py
+import threading
+import unittest
+
+from utils.dependency_runner import run_with_dependencies
+
+class RunWithDependenciesTest(unittest.TestCase):
+    """run_with_dependencies starts items only after what they wait for"""
+    
+    def test_results_in_item_order_and_dependencies_respected(self):
+        finished = []
+        lock = threading.Lock()
+        
+        def worker(item):
+            with lock:
+                finished.append(item)
+            return item * 10
+        
+        dependencies = {0: {2}, 1: {0}, 3: set()}
+        results = run_with_dependencies([0, 1, 2, 3], dependencies, worker, max_workers=4)
+        
+        self.assertEqual(results, [0, 10, 20, 30])
+        self.assertLess(finished.index(2), finished.index(0))
+        self.assertLess(finished.index(0), finished.index(1))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+# tests/test_fuzzy_index.py
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+from api import fuzzy_index
+from api.fuzzy_index import FuzzyIndex
+from tests.fakes import FakeTrello, install_trello
+
+NAMES = {"c1": "Fix login bug", "c2": "Write API docs", "c3": "Design landing page"}
+
+class FuzzyIndexTest(unittest.TestCase):
+    """FuzzyIndex lookups stay correct as names are added, renamed and removed"""
+    
+    def setUp(self):
+        self.index = FuzzyIndex(NAMES)
+    
+    def best(self, query):
+        results = self.index.search(query, k=1)
+        return results[0][0] if results else None
+    
+    def test_exact_and_misspelled_names(self):
+        key, name, score = self.index.search("Write API docs", k=1)[0]
+        self.assertEqual((key, name), ("c2", "Write API docs"))
+        self.assertAlmostEqual(score, 1.0)
+        self.assertEqual(self.best("fix lgoin bug"), "c1")
+        self.assertEqual(self.best("desing landing pgae"), "c3")
+    
+    def test_list_of_names_are_their_own_keys(self):
+        index = FuzzyIndex(["Alpha release", "Beta release"])
+        self.assertEqual(index.search("beta relase", k=1)[0][0], "Beta release")
+    
+    def test_results_are_ranked_and_thresholded(self):
+        results = self.index.search("fix login", k=3)
+        self.assertEqual(results[0][0], "c1")
+        self.assertEqual([score for _, _, score in results], sorted((score for _, _, score in results), reverse=True))
+        self.assertEqual(self.index.search("fix login", min_score=1.0), [])
+        self.assertEqual(self.index.search("Fix login bug", min_score=1.0)[0][0], "c1")
+    
+    def test_add_and_rename(self):
+        self.index.add("c4", "Ship release notes")
+        self.assertEqual(self.best("ship relase notes"), "c4")
+        
+        self.index.add("c1", "Fix SSO bug")
+        self.assertEqual(self.index.name("c1"), "Fix SSO bug")
+        self.assertEqual(self.best("Fix SSO bug"), "c1")
+        self.assertLess(self.index.search("Fix login bug", k=1)[0][2], 1.0)
+        self.assertEqual(len(self.index), 4)
+    
+    def test_remove(self):
+        self.index.remove("c2")
+        self.index.remove("unknown")
+        
+        self.assertNotIn("c2", self.index)
+        self.assertIsNone(self.index.name("c2"))
+        self.assertNotIn("c2", [key for key, _, _ in self.index.search("Write API docs", k=3)])
+        self.assertEqual(sorted(self.index.keys()), ["c1", "c3"])
+    
+    def test_compaction_keeps_live_names(self):
+        with mock.patch.object(fuzzy_index, "COMPACT_MIN_DEAD", 2):
+            for i in range(4):
+                self.index.add(f"tmp{i}", f"Temporary task {i}")
+            for i in range(4):
+                self.index.remove(f"tmp{i}")
+        
+        # Removing four of seven rows crossed the threshold, so the dead rows are gone
+        self.assertEqual(len(self.index._keys), 3)
+        self.assertEqual(self.index._dead, set())
+        self.assertEqual(sorted(self.index.keys()), ["c1", "c2", "c3"])
+        self.assertEqual(self.best("fix lgoin bug"), "c1")
+        self.assertNotIn("tmp2", [key for key, _, _ in self.index.search("Temporary task 2", k=5)])
+    
+    def test_empty_index_and_queries(self):
+        self.assertEqual(FuzzyIndex().search("anything"), [])
+        self.assertEqual(self.index.search("Fix login bug", k=0), [])
+        self.assertEqual(self.index.search(""), self.index.search("  "))
+    
+    def test_search_restricted_to_keys(self):
+        self.assertNotIn("c1", [key for key, _, _ in self.index.search("fix login bug", k=3, keys=["c2", "c3", "gone"])])
+        self.assertEqual(self.index.search("write api dcos", k=3, keys=["c2", "c3"])[0][0], "c2")
+        self.assertEqual(self.index.search("write api docs", keys=[]), [])
+
+class BestFuzzyMatchTest(unittest.TestCase):
+    """Checklist lookups shortlist through the snapshot's indexes and fall back to difflib"""
+    
+    def setUp(self):
+        self.trello = FakeTrello()
+        self.trello.checklists["CL2"] = {"id": "CL2", "idCard": "C0", "name": "Release tasks", "pos": 2,
+                                         "checkItems": []}
+        # Same name on another card, which a lookup on C0 must never return
+        self.trello.checklists["CL3"] = {"id": "CL3", "idCard": "C1", "name": "Release tasks", "pos": 1,
+                                         "checkItems": []}
+        self.handler = install_trello(self.trello)
+        self.snapshot = self.handler.get_board_snapshot()
+    
+    def lookup(self, fn, *args):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return fn(*args)
+    
+    def test_checklist_and_item_lookups_use_the_snapshot_indexes(self):
+        with mock.patch.object(self.snapshot, "search", wraps=self.snapshot.search) as search:
+            self.assertEqual(self.lookup(self.handler.find_checklist_by_name, "C0", "relase taks"), "CL2")
+            self.assertEqual(self.lookup(self.handler.find_checklist_item_by_name, "CL1", "tow"), "I2")
+        
+        self.assertEqual([(call.args[0], call.kwargs["ids"]) for call in search.call_args_list],
+                         [("checklists", ["CL1", "CL2"]), ("items", ["I1", "I2"])])
+    
+    def test_item_index_follows_writes(self):
+        self.snapshot.ensure_current()
+        self.snapshot.upsert_check_item("CL1", {"id": "I9", "name": "Deploy to staging", "pos": 3})
+        self.assertEqual(self.snapshot.search("items", "deploy to stagign", k=1)[0][0], "I9")
+        
+        self.snapshot.remove_check_item("CL1", "I9")
+        self.snapshot.remove_checklist("CL1")
+        self.assertEqual(self.snapshot.search("items", "deploy to staging"), [])
+        self.assertEqual(self.snapshot.search("items", "one"), [])
+    
+    def test_difflib_fallback_when_the_shortlist_misses(self):
+        candidates = ["Fix login bug", "Write API docs"]
+        
+        # A shortlist with nothing above the threshold falls back to every candidate
+        nothing = lambda name, k: [("x", "Unrelated", 0.9)]
+        self.assertEqual(self.handler.get_best_fuzzy_match("wrte api dcs", candidates, shortlist=nothing)[0],
+                         "Write API docs")
+        self.assertEqual(self.handler.get_best_fuzzy_match("wrte api dcs", candidates)[0], "Write API docs")
+        self.assertEqual(self.handler.get_best_fuzzy_match("deploy", candidates, shortlist=nothing), (None, 0))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+# tests/test_main.py
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+MISSING = None
+try:
+    import main
+except ImportError as e:  # the audio, keyboard and OpenAI packages aren't installed everywhere
+    main = None
+    MISSING = str(e)
+
+@unittest.skipIf(main is None, f"main.py dependencies are not installed: {MISSING}")
+class StreamMeetingTest(unittest.TestCase):
+    """stream_meeting builds a StreamingMeetingProcessor it can start"""
+    
+    def stream(self, *args, **kwargs):
+        with mock.patch.object(main.StreamingMeetingProcessor, "start", autospec=True) as start:
+            with contextlib.redirect_stdout(io.StringIO()):
+                processor = main.stream_meeting(*args, **kwargs)
+        return processor, start
+    
+    def test_builds_and_starts_the_processor(self):
+        processor, start = self.stream("notion")
+        
+        self.assertIsInstance(processor, main.StreamingMeetingProcessor)
+        self.assertFalse(processor.plan_only)
+        start.assert_called_once_with(processor)
+    
+    def test_passes_plan_only_through(self):
+        processor, _ = self.stream("notion", plan_only=True)
+        
+        self.assertTrue(processor.plan_only)
+    
+    def test_refuses_trello(self):
+        processor, start = self.stream("trello")
+        
+        self.assertIsNone(processor)
+        start.assert_not_called()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+# tests/test_notion_async.py
+import asyncio
+import unittest
+
+from tests.fakes import FakeNotion, install_notion
+
+from api import notion_async_handler
+
+class AsyncHandlerIsolationTest(unittest.TestCase):
+    """The async handler never falls back to the blocking sync client"""
+    
+    def setUp(self):
+        self.notion = FakeNotion(["Fix login bug"])
+        self.handler = install_notion(self.notion)
+        notion_async_handler._board_snapshot = notion_async_handler._AsyncBoardSnapshot()
+        notion_async_handler._users_directory = notion_async_handler._AsyncUsersDirectory()
+    
+    def test_unloaded_snapshot_reads_make_no_requests(self):
+        snapshot = notion_async_handler._board_snapshot
+        self.assertEqual(snapshot.pages(), [])
+        self.assertEqual(snapshot.title_index().lookup("Fix login bug"), (None, 0))
+        self.assertIsNone(notion_async_handler._users_directory.resolve("Alice"))
+        
+        self.assertEqual(self.notion.calls, [])
+        self.assertIsNone(snapshot.mirror())
+    
+    def test_rate_limiter_is_shared_with_sync_client(self):
+        async def make_client():
+            client = notion_async_handler.AsyncNotionClient()
+            await client.close()
+            return client
+        
+        client = asyncio.run(make_client())
+        self.assertIs(client.rate_limiter.limiter, self.handler._client.rate_limiter)
+    
+    def test_each_loop_gets_its_own_client_until_closed(self):
+        async def use_and_close():
+            client = notion_async_handler.get_client()
+            self.assertIs(notion_async_handler.get_client(), client)
+            await notion_async_handler.close_client()
+            self.assertTrue(client.http.is_closed)
+            return client
+        
+        async def use_only():
+            return notion_async_handler.get_client()
+        
+        first = asyncio.run(use_and_close())
+        self.assertEqual(notion_async_handler._clients, {})
+        
+        leaked = asyncio.run(use_only())
+        second = asyncio.run(use_and_close())
+        self.assertIsNot(first, second)
+        self.assertNotIn(leaked.loop, notion_async_handler._clients)
+
+if __name__ == "__main__":
+    unittest.main()
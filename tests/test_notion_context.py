@@ -0,0 +1,102 @@
+# tests/test_notion_context.py
+import contextlib
+import io
+import json
+import os
+import unittest
+
+from tests.fakes import FakeNotion, install_notion
+
+def text(value):
+    return {"type": "rich_text", "rich_text": [{"plain_text": value}]}
+
+class FakeContextNotion(FakeNotion):
+    """FakeNotion plus a retrologs database whose property names differ in case and spacing"""
+    
+    def __init__(self, titles=(), retro_properties=("Team member", "went well", "Didn't  Go Well", "Action Items")):
+        super().__init__(titles)
+        self.retro_properties = retro_properties
+        self.entries = []  # properties of pages created in the retrologs database
+    
+    def route(self, method, path, query, body):
+        if method == "POST" and path.endswith("/pages") and json.loads(body)["parent"].get("database_id") == "retro":
+            self.entries.append(json.loads(body)["properties"])
+            return 200, {"object": "page", "id": f"r{len(self.entries) + 1}"}
+        if "/databases/retro" not in path:
+            return super().route(method, path, query, body)
+        if path.endswith("/query"):
+            values = ["Alice", "Shipped", "Flaky CI", "Fix CI"]
+            page = {"object": "page", "id": "r1", "created_time": "2024-01-02T00:00:00.000Z",
+                    "properties": {name: text(value) for name, value in zip(self.retro_properties, values)}}
+            return 200, {"object": "list", "results": [page], "has_more": False, "next_cursor": None}
+        properties = {name: {"id": f"p{i}", "type": "rich_text", "rich_text": {}}
+                      for i, name in enumerate(self.retro_properties)}
+        properties["Entry"] = {"id": "title", "type": "title", "title": {}}
+        return 200, {"object": "database", "id": "retro", "properties": properties}
+
+class ContextLoaderTest(unittest.TestCase):
+    """fetch_context_for_agent resolves context property names from each database's schema"""
+    
+    def setUp(self):
+        os.environ["NOTION_RETROLOGS_DATABASE_ID"] = "retro"
+        self.addCleanup(os.environ.pop, "NOTION_RETROLOGS_DATABASE_ID", None)
+    
+    def fetch(self, notion):
+        handler = install_notion(notion)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            return handler.fetch_context_for_agent(), output.getvalue()
+    
+    def test_property_names_match_ignoring_case_and_spacing(self):
+        context, _ = self.fetch(FakeContextNotion(["Fix login bug"]))
+        
+        self.assertEqual([task["name"] for task in context["tasks"]], ["Fix login bug"])
+        self.assertEqual(context["retrologs"], [{
+            "date": "2024-01-02", "team_member": "Alice", "went_well": "Shipped",
+            "didnt_go_well": "Flaky CI", "action_items": "Fix CI"
+        }])
+        self.assertEqual(context["weekly_summaries"], [])
+    
+    def test_missing_property_fails_clearly(self):
+        notion = FakeContextNotion(retro_properties=("Team member", "Highlights"))
+        context, output = self.fetch(notion)
+        
+        self.assertEqual(context["retrologs"], [])
+        self.assertIn("NOTION_RETROLOGS_DATABASE_ID", output)
+        self.assertIn("'Went Well'", output)
+        self.assertNotIn(("POST", "/v1/databases/retro/query"), notion.calls)
+
+class ContextWriterTest(unittest.TestCase):
+    """The context writers use the property names and types the database schema resolves to"""
+    
+    def setUp(self):
+        os.environ["NOTION_RETROLOGS_DATABASE_ID"] = "retro"
+        self.addCleanup(os.environ.pop, "NOTION_RETROLOGS_DATABASE_ID", None)
+    
+    def create(self, notion):
+        handler = install_notion(notion)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            created = handler.create_retrolog_entry("Alice", "Shipped", "Flaky CI", "Fix CI")
+        return created, output.getvalue()
+    
+    def test_entry_is_written_under_the_schema_names(self):
+        notion = FakeContextNotion()
+        created, _ = self.create(notion)
+        
+        self.assertTrue(created)
+        (entry,) = notion.entries
+        self.assertEqual(sorted(entry), sorted(["Entry", "Team member", "went well", "Didn't  Go Well", "Action Items"]))
+        self.assertTrue(entry["Entry"]["title"][0]["text"]["content"].startswith("Retro - Alice - "))
+        self.assertEqual(entry["went well"], {"rich_text": [{"text": {"content": "Shipped"}}]})
+    
+    def test_missing_property_is_reported_without_writing(self):
+        notion = FakeContextNotion(retro_properties=("Team member", "Highlights"))
+        created, output = self.create(notion)
+        
+        self.assertFalse(created)
+        self.assertEqual(notion.entries, [])
+        self.assertIn("'Went Well'", output)
+
+if __name__ == "__main__":
+    unittest.main()
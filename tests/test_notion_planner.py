@@ -0,0 +1,133 @@
+# tests/test_notion_planner.py
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+from tests.fakes import FakeNotion, install_notion
+
+class PlannerTest(unittest.TestCase):
+    """plan_task_operations / execute_plan against a fake Notion database"""
+    
+    def setUp(self):
+        self.notion = FakeNotion(["Fix login bug", "Write docs", "Old task"])
+        self.handler = install_notion(self.notion)
+        self.page_ids = {self.notion.title(page_id): page_id for page_id in self.notion.pages}
+    
+    def plan(self, operations):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.handler.plan_task_operations(operations)
+    
+    def run_operations(self, operations):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.handler.handle_task_operations(operations)
+    
+    def test_comment_after_rename_uses_new_name(self):
+        results = self.run_operations([
+            {"operation": "rename", "old_name": "Fix login bug", "new_name": "Fix auth bug"},
+            {"operation": "comment", "task": "Fix auth bug", "comment": "Root cause found"}
+        ])
+        
+        self.assertTrue(all(result["success"] for result in results), results)
+        page_id = self.page_ids["Fix login bug"]
+        self.assertEqual(self.notion.title(page_id), "Fix auth bug")
+        self.assertEqual([c["parent"]["page_id"] for c in self.notion.comments], [page_id])
+    
+    def test_delete_after_rename_uses_new_name(self):
+        results = self.run_operations([
+            {"operation": "rename", "old_name": "Fix login bug", "new_name": "Fix auth bug"},
+            {"operation": "delete", "task": "Fix auth bug"}
+        ])
+        
+        self.assertTrue(all(result["success"] for result in results), results)
+        self.assertTrue(self.notion.pages[self.page_ids["Fix login bug"]]["archived"])
+        self.assertFalse(self.notion.pages[self.page_ids["Write docs"]]["archived"])
+    
+    def test_rename_chain_resolves_to_original_page(self):
+        plan = self.plan([
+            {"operation": "rename", "old_name": "Fix login bug", "new_name": "Fix auth bug"},
+            {"operation": "rename", "old_name": "Fix auth bug", "new_name": "Fix SSO bug"},
+            {"operation": "comment", "task": "Fix SSO bug", "comment": "done"}
+        ])
+        
+        page_id = self.page_ids["Fix login bug"]
+        self.assertEqual(plan["errors"], {})
+        self.assertEqual(plan["page_ids"], [page_id] * 3)
+        # Both renames share one PATCH; the comment waits for it
+        patch, comment = plan["steps"]
+        self.assertEqual((patch["path"], patch["operations"]), (f"pages/{page_id}", [0, 1]))
+        self.assertEqual(patch["body"]["properties"]["Name"]["title"][0]["text"]["content"], "Fix SSO bug")
+        self.assertEqual(comment["body"]["parent"]["page_id"], page_id)
+        self.assertEqual(comment["depends_on"], [patch["id"]])
+    
+    def test_writes_to_one_page_are_coalesced_until_another_operation(self):
+        plan = self.plan([
+            {"operation": "update", "task": "Write docs", "status": "In Progress"},
+            {"operation": "assign_epic", "task": "write docs", "epic": "Backend"},
+            {"operation": "comment", "task": "Write docs", "comment": "started"},
+            {"operation": "update", "task": "Write docs", "status": "Done"}
+        ])
+        
+        page_id = self.page_ids["Write docs"]
+        self.assertEqual([(step["method"], step["path"], step["operations"]) for step in plan["steps"]], [
+            ("PATCH", f"pages/{page_id}", [0, 1]),
+            ("POST", "comments", [2]),
+            ("PATCH", f"pages/{page_id}", [3])
+        ])
+        self.assertEqual(set(plan["steps"][0]["body"]["properties"]), {"Status", "Select"})
+        self.assertEqual(plan["steps"][1]["depends_on"], [0])
+        self.assertIn(1, plan["steps"][2]["depends_on"])
+    
+    def test_operations_on_a_task_created_in_the_batch_use_a_placeholder(self):
+        plan = self.plan([
+            {"operation": "comment", "task": "Brand new task", "comment": "first"},
+            {"operation": "create", "task": "Brand new task", "status": "Not started"},
+            {"operation": "update", "task": "Brand new task", "status": "Done"}
+        ])
+        
+        create, = [step for step in plan["steps"] if step["creates"] is not None]
+        placeholder = self.handler._created_page_placeholder(1)
+        comment, = [step for step in plan["steps"] if step["kind"] == "comment"]
+        update, = [step for step in plan["steps"] if step["path"] == f"pages/{placeholder}"]
+        self.assertEqual(comment["body"]["parent"]["page_id"], placeholder)
+        self.assertIn(create["id"], comment["depends_on"])
+        self.assertIn(create["id"], update["depends_on"])
+        
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = self.handler.execute_plan(plan)
+        self.assertTrue(all(result["success"] for result in results), results)
+        new_page = next(p for p in self.notion.pages.values() if self.notion.title(p["id"]) == "Brand new task")
+        self.assertEqual(new_page["properties"]["Status"]["status"]["name"], "Done")
+        self.assertEqual(self.notion.comments[0]["parent"]["page_id"], new_page["id"])
+    
+    def test_unreadable_response_fails_only_its_step(self):
+        send = self.notion.send
+        
+        def garbled_create(request, **kwargs):
+            response = send(request, **kwargs)
+            if request.method == "POST" and request.url.endswith("/pages"):
+                response._content = b"<html>Bad gateway</html>"
+            return response
+        
+        plan = self.plan([
+            {"operation": "create", "task": "Brand new task", "status": "Not started"},
+            {"operation": "comment", "task": "Brand new task", "comment": "first"},
+            {"operation": "comment", "task": "Write docs", "comment": "still fine"}
+        ])
+        with mock.patch.object(self.notion, "send", side_effect=garbled_create), contextlib.redirect_stdout(io.StringIO()):
+            results = self.handler.execute_plan(plan)
+        
+        self.assertFalse(results[0]["success"])
+        self.assertTrue(results[0]["error"])
+        self.assertFalse(results[1]["success"])
+        self.assertTrue(results[2]["success"])
+        self.assertEqual([c["parent"]["page_id"] for c in self.notion.comments], [self.page_ids["Write docs"]])
+    
+    def test_unknown_task_is_reported_without_a_request(self):
+        plan = self.plan([{"operation": "comment", "task": "Nothing like this", "comment": "?"}])
+        
+        self.assertEqual(plan["steps"], [])
+        self.assertIn("Task not found", plan["errors"][0])
+
+if __name__ == "__main__":
+    unittest.main()
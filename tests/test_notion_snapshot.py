@@ -0,0 +1,133 @@
+# tests/test_notion_snapshot.py
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from tests.fakes import FakeNotion, install_notion
+
+def select(name, color):
+    return {"Select": {"id": "sel", "type": "select", "select": {"name": name, "color": color}}}
+
+class RecordingNotion(FakeNotion):
+    """FakeNotion that also records the filter of every database query"""
+    
+    def __init__(self, titles=()):
+        super().__init__(titles)
+        self.query_filters = []
+    
+    def route(self, method, path, query, body):
+        if path.endswith("/query") and not json.loads(body or "{}").get("start_cursor"):
+            self.query_filters.append(json.loads(body or "{}").get("filter"))
+        return super().route(method, path, query, body)
+
+class DeltaSyncTest(unittest.TestCase):
+    """BoardSnapshot.sync merges pages edited since the high-water mark"""
+    
+    def setUp(self):
+        self.notion = RecordingNotion(["Fix login bug", "Write docs", "Old task"])
+        self.handler = install_notion(self.notion)
+        self.page_ids = {self.notion.title(page_id): page_id for page_id in self.notion.pages}
+        self.snapshot = self.handler.BoardSnapshot()
+        self.sync()
+    
+    def sync(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(self.snapshot.sync())
+    
+    def titles(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return sorted(self.handler.get_task_title(page) for page in self.snapshot.pages())
+    
+    def rename(self, page_id, title):
+        """Rename a page on the fake, as if someone edited it in Notion"""
+        self.notion._update(page_id, {"Name": {"title": [{"text": {"content": title}}]}})
+        self.notion.edit(page_id)
+    
+    def test_first_sync_is_a_full_load(self):
+        self.assertEqual(self.notion.query_filters, [None])
+        self.assertEqual(self.titles(), ["Fix login bug", "Old task", "Write docs"])
+    
+    def test_delta_sync_merges_edits_and_new_pages(self):
+        self.rename(self.page_ids["Write docs"], "Write API docs")
+        self.notion.add_page("Ship release")
+        self.sync()
+        
+        since = self.notion.query_filters[-1]["last_edited_time"]["on_or_after"]
+        self.assertEqual(since, "2024-01-01T00:03:00.000Z")
+        self.assertEqual(self.titles(), ["Fix login bug", "Old task", "Ship release", "Write API docs"])
+        # The title index follows the merge without a rebuild from scratch
+        self.assertEqual(self.snapshot.title_index().lookup("Write API docs"), (self.page_ids["Write docs"], 1.0))
+        self.assertLess(self.snapshot.title_index().lookup("Write docs")[1], 1.0)
+    
+    def test_high_water_mark_advances(self):
+        self.rename(self.page_ids["Old task"], "Older task")
+        self.sync()
+        self.sync()
+        
+        first, second = self.notion.query_filters[1:]
+        self.assertLess(first["last_edited_time"]["on_or_after"], second["last_edited_time"]["on_or_after"])
+    
+    def test_archived_page_in_delta_is_dropped(self):
+        archived = dict(self.notion.pages[self.page_ids["Old task"]], archived=True)
+        self.snapshot.merge([archived])
+        
+        self.assertEqual(self.titles(), ["Fix login bug", "Write docs"])
+        self.assertLess(self.snapshot.title_index().lookup("Old task")[1], 1.0)
+    
+    def test_page_archived_elsewhere_is_dropped_by_the_full_reload(self):
+        self.notion.edit(self.page_ids["Old task"], archived=True)
+        self.sync()
+        # The query endpoint never returns archived pages, so a delta can't see it
+        self.assertIn("Old task", self.titles())
+        
+        self.snapshot.full_sync_interval = 0
+        self.sync()
+        self.assertIsNone(self.notion.query_filters[-1])
+        self.assertEqual(self.titles(), ["Fix login bug", "Write docs"])
+    
+    def test_own_writes_are_written_through(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.handler._board_snapshot = self.snapshot
+            self.handler.handle_task_operations([
+                {"operation": "delete", "task": "Old task"},
+                {"operation": "create", "task": "Ship release"}
+            ])
+        queries = len(self.notion.query_filters)
+        
+        self.assertEqual(self.titles(), ["Fix login bug", "Ship release", "Write docs"])
+        self.assertEqual(len(self.notion.query_filters), queries)
+
+class MirrorTest(unittest.TestCase):
+    """Epic lookups are served from the SQLite mirror when it is enabled"""
+    
+    def setUp(self):
+        self.notion = FakeNotion(["Fix login bug", "Write docs", "Old task"])
+        pages = list(self.notion.pages)
+        self.notion.pages[pages[0]]["properties"].update(select("Backend", "red"))
+        self.notion.pages[pages[1]]["properties"].update(select("Docs", "blue"))
+        self.handler = install_notion(self.notion)
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+    
+    def enable_mirror(self):
+        os.environ["NOTION_MIRROR_PATH"] = os.path.join(self.directory, "mirror.db")
+        self.addCleanup(os.environ.pop, "NOTION_MIRROR_PATH", None)
+        self.addCleanup(self.handler._mirrors.clear)
+    
+    def test_epic_colors_match_with_and_without_mirror(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            without_mirror = sorted(self.handler.get_epic_colors())
+            self.enable_mirror()
+            self.handler._board_snapshot = self.handler.BoardSnapshot()
+            with_mirror = sorted(self.handler.get_epic_colors())
+        
+        self.assertEqual(without_mirror, ["blue", "red"])
+        self.assertEqual(with_mirror, without_mirror)
+        self.assertIsNotNone(self.handler.get_board_snapshot().mirror())
+
+if __name__ == "__main__":
+    unittest.main()
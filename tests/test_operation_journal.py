@@ -0,0 +1,140 @@
+# tests/test_operation_journal.py
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+import requests
+
+from tests.fakes import FakeNotion, install_notion
+
+class LossyNotion(FakeNotion):
+    """FakeNotion that drops the connection on chosen requests, before or after applying them"""
+    
+    def __init__(self, titles=(), start=None):
+        super().__init__(titles, start=start or datetime.now(timezone.utc).replace(tzinfo=None, second=0, microsecond=0))
+        self.lose = []  # (method, first path segment) of requests to apply and then lose
+        self.refuse = []  # ... of requests to lose without applying
+        self.full_loads = 0  # database queries without a filter
+    
+    def route(self, method, path, query, body):
+        target = (method, path.split("/v1/", 1)[1].split("/")[0])
+        if path.endswith("/query") and not json.loads(body or "{}").get("filter"):
+            self.full_loads += 1
+        if target in self.refuse:
+            self.refuse.remove(target)
+            raise requests.ConnectionError("Connection reset by peer")
+        status, result = super().route(method, path, query, body)
+        if target in self.lose:
+            self.lose.remove(target)
+            raise requests.ConnectionError("Connection reset by peer")
+        return status, result
+
+class JournalTest(unittest.TestCase):
+    """Operations with a missing or unknown outcome are checked against the board, never applied twice"""
+    
+    def setUp(self):
+        self.notion = LossyNotion(["Fix login bug", "Old task"])
+        self.handler = install_notion(self.notion)
+        self.page_ids = {self.notion.title(page_id): page_id for page_id in self.notion.pages}
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "journal.jsonl")
+        os.environ["NOTION_JOURNAL_PATH"] = self.path
+        self.addCleanup(os.environ.pop, "NOTION_JOURNAL_PATH", None)
+        self.addCleanup(lambda: [journal.close() for journal in self.handler._journals.values()])
+    
+    def run_operations(self, operations):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.handler.handle_task_operations(operations)
+    
+    def posts(self, segment):
+        return [call for call in self.notion.calls if call == ("POST", f"/v1/{segment}")]
+    
+    def titled(self, title):
+        return [page for page in self.notion.pages.values()
+                if self.notion.title(page["id"]) == title and not page["archived"]]
+    
+    def test_lost_responses_are_not_repeated(self):
+        self.notion.lose = [("POST", "pages"), ("POST", "comments")]
+        results = self.run_operations([
+            {"operation": "create", "task": "Ship release"},
+            {"operation": "comment", "task": "Fix login bug", "comment": "Root cause found"}
+        ])
+        
+        self.assertTrue(all(result["success"] for result in results), results)
+        self.assertEqual(len(self.titled("Ship release")), 1)
+        self.assertEqual(len(self.notion.comments), 1)
+        self.assertEqual((len(self.posts("pages")), len(self.posts("comments"))), (1, 1))
+        self.assertEqual(self.handler.get_journal().pending(), [])
+    
+    def test_requests_that_never_arrived_are_replayed_once(self):
+        self.notion.refuse = [("POST", "pages")]
+        results = self.run_operations([{"operation": "create", "task": "Ship release"}])
+        
+        self.assertTrue(results[0]["success"], results)
+        self.assertEqual(len(self.titled("Ship release")), 1)
+        self.assertEqual(len(self.posts("pages")), 2)
+    
+    def test_lost_responses_across_batches_never_reload_the_whole_board(self):
+        self.handler._client.max_retries = 0  # so the lost archive is left for reconciliation
+        self.notion.lose = [("POST", "comments"), ("PATCH", "pages"), ("POST", "pages")]
+        first = self.run_operations([
+            {"operation": "comment", "task": "Fix login bug", "comment": "Root cause found"},
+            {"operation": "delete", "task": "Old task"}
+        ])
+        second = self.run_operations([{"operation": "create", "task": "Ship release"}])
+        
+        self.assertTrue(all(result["success"] for result in first + second), first + second)
+        self.assertEqual(self.notion.full_loads, 1)
+        self.assertEqual(len(self.notion.comments), 1)
+        self.assertEqual(len(self.titled("Ship release")), 1)
+        self.assertEqual([call for call in self.notion.calls if call[0] == "PATCH"],
+                         [("PATCH", f"/v1/pages/{self.page_ids['Old task']}")])
+        self.assertIsNone(self.handler.get_board_snapshot().get(self.page_ids["Old task"]))
+    
+    def test_unfinished_operations_from_a_previous_run_are_reconciled(self):
+        # A previous process journaled these, then died; some of them reached Notion
+        at = self.notion.start.isoformat() + "+00:00"
+        fix_login = self.page_ids["Fix login bug"]
+        self.notion.add_page("Ship release")
+        self.notion.comments.append({"object": "comment", "id": "c0", "parent": {"page_id": fix_login},
+                                     "created_time": self.notion.tick(),
+                                     "rich_text": [{"plain_text": "Root cause found"}]})
+        self.notion.edit(self.page_ids["Old task"], archived=True)
+        intents = [
+            ({"operation": "create", "task": "Ship release"}, None, None),
+            ({"operation": "comment", "task": "Fix login bug", "comment": "Root cause found"}, fix_login, None),
+            ({"operation": "comment", "task": "Fix login bug", "comment": "Needs review"}, fix_login, None),
+            ({"operation": "delete", "task": "Old task"}, self.page_ids["Old task"], "unknown"),
+            ({"operation": "rename", "old_name": "Fix login bug", "new_name": "Fix auth bug"}, fix_login, "done")
+        ]
+        with open(self.path, "w", encoding="utf-8") as journal_file:
+            for i, (op, page_id, status) in enumerate(intents):
+                key = f"previous:{i}"
+                journal_file.write(json.dumps({"event": "intent", "key": key, "op": op, "page_id": page_id, "at": at}) + "\n")
+                if status:
+                    journal_file.write(json.dumps({"event": "outcome", "key": key, "status": status, "at": at}) + "\n")
+        
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = self.handler.recover_operations()
+        
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(result["success"] for result in results), results)
+        self.assertEqual(self.posts("pages"), [])
+        self.assertEqual(len(self.posts("comments")), 1)
+        self.assertEqual([c["rich_text"][0].get("plain_text") or c["rich_text"][0]["text"]["content"] for c in self.notion.comments],
+                         ["Root cause found", "Needs review"])
+        self.assertEqual(self.notion.title(fix_login), "Fix login bug")
+        # The journal is compacted, and recovery runs once per process
+        with open(self.path, encoding="utf-8") as journal_file:
+            self.assertEqual(journal_file.read(), "")
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(self.handler.recover_operations(), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+# tests/test_trello_batcher.py
+import contextlib
+import io
+import threading
+import unittest
+from unittest import mock
+
+import requests
+
+from tests.fakes import FakeTrello, install_trello
+
+RETRY_NOW = {"Retry-After": "0"}
+
+class TrelloBatcherTest(unittest.TestCase):
+    """TrelloBatcher coalesces reads into /1/batch calls and resolves every Future"""
+    
+    def setUp(self):
+        self.trello = FakeTrello(cards=5)
+        self.handler = install_trello(self.trello)
+        self.output = io.StringIO()
+    
+    def batcher(self, **kwargs):
+        return self.handler.TrelloBatcher(**kwargs)
+    
+    def test_get_many_uses_one_batch_call_in_order(self):
+        responses = self.batcher().get_many(["/cards/C2", "/cards/C0", "/lists/L3"])
+        
+        self.assertEqual([r.status_code for r in responses], [200, 200, 200])
+        self.assertEqual([r.json()["id"] for r in responses], ["C2", "C0", "L3"])
+        self.assertEqual(self.trello.calls, [("GET", "/1/batch")])
+    
+    def test_failed_sub_request_resolves_with_its_status(self):
+        responses = self.batcher().get_many(["/cards/C1", "/cards/missing"])
+        
+        self.assertEqual(responses[0].json()["name"], "Card 1")
+        self.assertEqual(responses[1].status_code, 404)
+        self.assertIn("card not found", responses[1].text)
+    
+    def test_single_read_is_sent_as_a_plain_get_after_the_window(self):
+        response = self.batcher(window=0.01).submit("/cards/C3").result(timeout=5)
+        
+        self.assertEqual(response.json()["name"], "Card 3")
+        self.assertEqual(self.trello.calls, [("GET", "/1/cards/C3")])
+    
+    def test_concurrent_reads_share_a_batch(self):
+        batcher = self.batcher(window=0.2)
+        futures = [None] * 5
+        barrier = threading.Barrier(5)
+        
+        def submit(i):
+            barrier.wait()
+            futures[i] = batcher.submit(f"/cards/C{i}")
+        
+        threads = [threading.Thread(target=submit, args=(i,)) for i in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual([f.result(timeout=5).json()["id"] for f in futures], [f"C{i}" for i in range(5)])
+        self.assertEqual(self.trello.calls, [("GET", "/1/batch")])
+    
+    def test_full_batch_is_sent_without_waiting(self):
+        batcher = self.batcher(window=60, limit=2)
+        first, second, third = (batcher.submit(f"/cards/C{i}") for i in range(3))
+        
+        self.assertTrue(first.done() and second.done())
+        self.assertFalse(third.done())
+        batcher.flush()
+        self.assertEqual(third.result(timeout=5).json()["id"], "C2")
+        self.assertEqual(self.trello.calls, [("GET", "/1/batch"), ("GET", "/1/cards/C2")])
+    
+    def test_failed_batch_call_resolves_every_future_with_its_status(self):
+        self.handler._client.max_retries = 0
+        self.trello.fail_next = [(500, RETRY_NOW)]
+        with contextlib.redirect_stdout(self.output):
+            responses = self.batcher().get_many(["/cards/C0", "/cards/C1"])
+        
+        self.assertEqual([r.status_code for r in responses], [500, 500])
+    
+    def test_request_exception_is_raised_from_every_future(self):
+        self.handler._client.max_retries = 0
+        self.trello.fail_next = [requests.ConnectionError("Connection reset by peer")]
+        batcher = self.batcher(window=60)
+        futures = [batcher.submit("/cards/C0"), batcher.submit("/cards/C1")]
+        batcher.flush()
+        
+        for future in futures:
+            with self.assertRaises(requests.ConnectionError):
+                future.result(timeout=5)
+    
+    def test_unparseable_batch_response_fails_every_future(self):
+        send = self.trello.send
+        
+        def garbled(request, **kwargs):
+            response = send(request, **kwargs)
+            response._content = b"<html>Bad gateway</html>"
+            return response
+        
+        batcher = self.batcher(window=60)
+        futures = [batcher.submit("/cards/C0"), batcher.submit("/cards/C1")]
+        with mock.patch.object(self.trello, "send", side_effect=garbled), contextlib.redirect_stdout(self.output):
+            batcher.flush()
+        
+        self.assertEqual(self.trello.calls, [("GET", "/1/batch")])
+        for future in futures:
+            with self.assertRaises(ValueError):
+                future.result(timeout=5)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+# tests/test_trello_dependencies.py
+import contextlib
+import io
+import unittest
+
+from tests.fakes import FakeTrello, install_trello
+
+class TrelloDependencyTest(unittest.TestCase):
+    """_build_dependencies orders operations on the same card and on cards created in the batch"""
+    
+    def setUp(self):
+        self.trello = FakeTrello()
+        self.handler = install_trello(self.trello)
+    
+    def dependencies(self, operations):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.handler._build_dependencies(operations)
+    
+    def test_operation_on_missing_card_waits_for_earlier_creates(self):
+        dependencies = self.dependencies([
+            {"operation": "create", "task": "Design landing page"},
+            {"operation": "update", "task": "Card 1", "status": "Done"},
+            {"operation": "comment", "task": "Design landing", "comment": "Mockups attached"}
+        ])
+        
+        self.assertEqual(dependencies, {0: set(), 1: set(), 2: {0}})
+    
+    def test_operations_on_existing_cards_do_not_wait_for_creates(self):
+        dependencies = self.dependencies([
+            {"operation": "create", "task": "Design landing page"},
+            {"operation": "rename", "old_name": "Card 2", "new_name": "Card two"},
+            {"operation": "comment", "task": "card 1", "comment": "Still on track"},
+            {"operation": "create_checklist", "card": "Card 0", "checklist": "QA"}
+        ])
+        
+        self.assertEqual(dependencies, {0: set(), 1: set(), 2: set(), 3: set()})
+    
+    def test_operations_on_the_same_card_run_in_order(self):
+        dependencies = self.dependencies([
+            {"operation": "update", "task": "Card 1", "status": "Done"},
+            {"operation": "comment", "task": "Card", "comment": "Partial name of Card 0"},
+            {"operation": "delete", "task": "card 1"}
+        ])
+        
+        self.assertEqual(dependencies[2], {0})
+    
+    def test_operations_on_a_reflection_card_wait_for_it(self):
+        dependencies = self.dependencies([
+            {"operation": "add_reflection_positive", "task": "Faster code reviews", "items": ["Same-day reviews"]},
+            {"operation": "add_reflection_negative", "task": "Flaky deploys", "issues": ["Timeouts"]},
+            {"operation": "comment", "task": "Flaky deploy", "comment": "Pipeline fixed"},
+            {"operation": "update", "task": "Card 1", "status": "Done"}
+        ])
+        
+        self.assertEqual(dependencies, {0: set(), 1: set(), 2: {0, 1}, 3: set()})
+    
+    def test_comment_on_created_card_lands_on_it(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = self.handler.handle_task_operations_trello([
+                {"operation": "create", "task": "Design landing page"},
+                {"operation": "comment", "task": "Design landing", "comment": "Mockups attached"}
+            ])
+        
+        self.assertTrue(all(result["success"] for result in results), results)
+        card_id = next(card_id for card_id, card in self.trello.cards.items() if card["name"] == "Design landing page")
+        self.assertIn(("POST", f"/1/cards/{card_id}/actions/comments"), self.trello.calls)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+# tests/test_trello_webhook.py
+import base64
+import contextlib
+import hashlib
+import hmac
+import io
+import json
+import unittest
+
+from tests.fakes import FakeTrello, install_trello
+
+CALLBACK_URL = "https://example.test/trello"
+SECRET = "app-secret"
+
+def sign(body, callback_url=CALLBACK_URL, secret=SECRET):
+    digest = hmac.new(secret.encode(), body + callback_url.encode(), hashlib.sha1).digest()
+    return base64.b64encode(digest).decode()
+
+class WebhookTest(unittest.TestCase):
+    """TrelloWebhookReceiver checks signatures and applies actions to the cached board"""
+    
+    def setUp(self):
+        self.trello = FakeTrello()
+        self.handler = install_trello(self.trello)
+        self.snapshot = self.handler.get_board_snapshot()
+        self.receiver = self.handler.TrelloWebhookReceiver(callback_url=CALLBACK_URL, secret=SECRET)
+        self.output = io.StringIO()
+        with contextlib.redirect_stdout(self.output):
+            self.snapshot.ensure_current()
+        self.trello.calls.clear()
+    
+    def deliver(self, action, signature=None):
+        body = json.dumps({"action": action}).encode()
+        with contextlib.redirect_stdout(self.output):
+            return self.receiver.handle_request(body, sign(body) if signature is None else signature)
+    
+    def card_names(self):
+        return {card["id"]: card["name"] for card in self.snapshot.cards()}
+    
+    def test_valid_signature_is_applied(self):
+        status = self.deliver({"type": "updateCard", "data": {"card": {"id": "C1", "name": "Renamed"}}})
+        
+        self.assertEqual(status, 200)
+        self.assertEqual(self.card_names()["C1"], "Renamed")
+        self.assertEqual(self.snapshot.search("cards", "Renamed", k=1)[0][0], "C1")
+        self.assertEqual((self.receiver.received, self.receiver.applied), (1, 1))
+        self.assertEqual(self.trello.calls, [])
+    
+    def test_bad_signature_is_rejected(self):
+        status = self.deliver({"type": "updateCard", "data": {"card": {"id": "C1", "name": "Renamed"}}},
+                              signature=sign(b"something else"))
+        
+        self.assertEqual(status, 401)
+        self.assertEqual(self.card_names()["C1"], "Card 1")
+        self.assertEqual(self.receiver.received, 0)
+    
+    def test_signature_covers_the_callback_url(self):
+        body = json.dumps({"action": {"type": "deleteCard", "data": {"card": {"id": "C1"}}}}).encode()
+        with contextlib.redirect_stdout(self.output):
+            status = self.receiver.handle_request(body, sign(body, callback_url="https://other.test/"))
+        
+        self.assertEqual(status, 401)
+        self.assertIn("C1", self.card_names())
+    
+    def test_bad_json_is_rejected(self):
+        body = b"not json"
+        with contextlib.redirect_stdout(self.output):
+            self.assertEqual(self.receiver.handle_request(body, sign(body)), 400)
+    
+    def test_card_actions(self):
+        self.deliver({"type": "createCard", "data": {"card": {"id": "C9", "name": "From webhook"}, "list": {"id": "L2"}}})
+        self.deliver({"type": "deleteCard", "data": {"card": {"id": "C2"}}})
+        self.deliver({"type": "updateCard", "data": {"card": {"id": "C1"}, "listAfter": {"id": "L3"}}})
+        
+        cards = {card["id"]: card for card in self.snapshot.cards()}
+        self.assertEqual((cards["C9"]["name"], cards["C9"]["idList"]), ("From webhook", "L2"))
+        self.assertNotIn("C2", cards)
+        self.assertEqual(cards["C1"]["idList"], "L3")
+        self.assertEqual(self.snapshot.checklists("C9"), [])
+        self.assertEqual(self.trello.calls, [])
+    
+    def test_check_item_actions(self):
+        self.deliver({"type": "createCheckItem", "data": {
+            "card": {"id": "C0"}, "checklist": {"id": "CL1"}, "checkItem": {"id": "I3", "name": "three", "state": "incomplete"}
+        }})
+        self.deliver({"type": "updateCheckItemStateOnCard", "data": {
+            "card": {"id": "C0"}, "checklist": {"id": "CL1"}, "checkItem": {"id": "I1", "state": "complete"}
+        }})
+        self.deliver({"type": "deleteCheckItem", "data": {
+            "card": {"id": "C0"}, "checklist": {"id": "CL1"}, "checkItem": {"id": "I2"}
+        }})
+        
+        items = [(item["name"], item["state"]) for item in self.snapshot.checklist_items("CL1")]
+        self.assertEqual(items, [("one", "complete"), ("three", "incomplete")])
+        self.assertEqual(self.trello.calls, [])
+    
+    def test_converted_check_item_reloads_its_card_checklists(self):
+        # Trello turns item I1 into card C9 and drops it from checklist CL1
+        self.trello.cards["C9"] = self.trello.make_card("C9", "one", "L1")
+        self.trello.checklists["CL1"]["checkItems"] = self.trello.checklists["CL1"]["checkItems"][1:]
+        self.deliver({"type": "convertToCardFromCheckItem", "data": {
+            "card": {"id": "C9", "name": "one"}, "cardSource": {"id": "C0"}, "checklist": {"id": "CL1"}
+        }})
+        
+        self.assertIn("C9", self.card_names())
+        with contextlib.redirect_stdout(self.output):
+            checklists = self.snapshot.checklists("C0")
+        self.assertEqual([item["name"] for item in checklists[0]["checkItems"]], ["two"])
+        self.assertEqual([item["name"] for item in self.snapshot.checklist_items("CL1")], ["two"])
+    
+    def test_member_actions_and_writes(self):
+        self.deliver({"type": "addMemberToCard", "data": {"card": {"id": "C1"}, "idMember": "M1"}})
+        self.assertEqual(self.snapshot.get_card("C1")["idMembers"], ["M1"])
+        self.deliver({"type": "removeMemberFromCard", "data": {"card": {"id": "C1"}, "member": {"id": "M1"}}})
+        self.assertEqual(self.snapshot.get_card("C1")["idMembers"], [])
+        
+        with contextlib.redirect_stdout(self.output):
+            self.assertTrue(self.handler.assign_member_to_card({"task": "Card 2", "member": "Alice Smith"}))
+            self.assertEqual(self.snapshot.get_card("C2")["idMembers"], ["M1"])
+            self.assertTrue(self.handler.remove_member_from_card({"task": "Card 2", "member": "Alice Smith"}))
+            self.assertEqual(self.snapshot.get_card("C2")["idMembers"], [])
+        self.assertEqual(self.trello.calls, [("POST", "/1/cards/C2/idMembers"), ("DELETE", "/1/cards/C2/idMembers/M1")])
+
+if __name__ == "__main__":
+    unittest.main()
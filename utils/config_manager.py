@@ -16,6 +16,10 @@ class ConfigManager:
         # Store configuration values
         self.notion_api_key = os.getenv("NOTION_API_KEY")
         self.notion_database_id = os.getenv("NOTION_DATABASE_ID")
+        # Optional databases the agent reads its context from
+        self.notion_retrologs_database_id = os.getenv("NOTION_RETROLOGS_DATABASE_ID")
+        self.notion_weekly_summaries_database_id = os.getenv("NOTION_WEEKLY_SUMMARIES_DATABASE_ID")
+        self.notion_execution_insights_database_id = os.getenv("NOTION_EXECUTION_INSIGHTS_DATABASE_ID")
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         
         # Validate configuration
@@ -55,12 +59,33 @@ class ConfigManager:
         """Get the Notion database ID"""
         return self.notion_database_id
     
+    def get_notion_retrologs_database_id(self):
+        """Get the Notion retrologs database ID"""
+        return self.notion_retrologs_database_id
+    
+    def get_notion_weekly_summaries_database_id(self):
+        """Get the Notion weekly summaries database ID"""
+        return self.notion_weekly_summaries_database_id
+    
+    def get_notion_execution_insights_database_id(self):
+        """Get the Notion execution insights database ID"""
+        return self.notion_execution_insights_database_id
+    
     def override(self, **kwargs):
         """Override configuration values at runtime"""
         for key, value in kwargs.items():
             if key == "NOTION_DATABASE_ID":
                 self.notion_database_id = value
                 os.environ["NOTION_DATABASE_ID"] = value
+            elif key == "NOTION_RETROLOGS_DATABASE_ID":
+                self.notion_retrologs_database_id = value
+                os.environ["NOTION_RETROLOGS_DATABASE_ID"] = value
+            elif key == "NOTION_WEEKLY_SUMMARIES_DATABASE_ID":
+                self.notion_weekly_summaries_database_id = value
+                os.environ["NOTION_WEEKLY_SUMMARIES_DATABASE_ID"] = value
+            elif key == "NOTION_EXECUTION_INSIGHTS_DATABASE_ID":
+                self.notion_execution_insights_database_id = value
+                os.environ["NOTION_EXECUTION_INSIGHTS_DATABASE_ID"] = value
             elif key == "NOTION_API_KEY":
                 self.notion_api_key = value
                 os.environ["NOTION_API_KEY"] = value
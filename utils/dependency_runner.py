@@ -0,0 +1,49 @@
+# utils/dependency_runner.py
+"""
+Dependency-ordered execution on a thread pool, shared by the Notion and Trello
+handlers: each item starts as soon as the items it waits for have finished.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+def run_with_dependencies(items, dependencies, worker, max_workers=4):
+    """
+    Run worker(item) for every item on a bounded thread pool, starting each one
+    only after the items it depends on have finished.
+    
+    Args:
+        items (list): The work items.
+        dependencies (dict): item index -> set of item indices it must wait for.
+        worker (callable): Called with one item; should handle its own errors.
+        max_workers (int): Maximum number of items in flight.
+    
+    Returns:
+        list: Worker results, in the same order as items.
+    """
+    results = [None] * len(items)
+    waiting = {i: set(dependencies.get(i, ())) for i in range(len(items))}
+    dependents = {i: [] for i in range(len(items))}
+    for i, deps in waiting.items():
+        for j in deps:
+            dependents[j].append(i)
+    
+    ready = sorted(i for i, deps in waiting.items() if not deps)
+    running = {}
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while ready or running:
+            for i in ready:
+                running[pool.submit(worker, items[i])] = i
+            ready = []
+            
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = running.pop(future)
+                results[i] = future.result()
+                for j in dependents[i]:
+                    waiting[j].discard(i)
+                    if not waiting[j]:
+                        ready.append(j)
+            ready.sort()
+    
+    return results